@@ -37,11 +37,14 @@ public interface ReportRepository extends JpaRepository<UserContract, Long> {
     """)
     FinancialReportDTO findFinancialReports(@Param("userId") Long userId);
 
-    @Query("""
-        SELECT sj.skills
-        FROM UserContract uc
-        JOIN ScrapedJob sj ON sj.linkHash = uc.jobLinkHash
-        WHERE uc.user.id = :userId
-    """)
-    List<String> findAllSkillsByUser(@Param("userId") Long userId);
+    @Query(value = """
+        SELECT js.skill, COUNT(*)
+        FROM user_contracts uc
+        JOIN scraped_jobs sj ON sj.link_hash = uc.job_link_hash
+        JOIN job_skills js ON js.job_id = sj.id
+        WHERE uc.user_id = :userId
+        GROUP BY js.skill
+        ORDER BY COUNT(*) DESC
+    """, nativeQuery = true)
+    List<Object[]> countSkillsByUser(@Param("userId") Long userId);
 }
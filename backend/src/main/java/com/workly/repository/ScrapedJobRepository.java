@@ -10,14 +10,21 @@ import java.util.List;
 public interface ScrapedJobRepository extends JpaRepository<ScrapedJob, Long> {
 
     @Query(value = """
-        SELECT * FROM scraped_jobs sj
-        WHERE sj.skills ~* ('(^|\\|)\\s*' || :query || '\\s*($|\\|)')
+        SELECT sj.* FROM scraped_jobs sj
+        WHERE sj.id IN (
+            SELECT js.job_id FROM job_skills js
+            WHERE js.skill = normalize_skill(:query)
+        )
     """, nativeQuery = true)
     List<ScrapedJob> searchJobBySkill(@Param("query") String query);
 
     @Query(value = """
-        SELECT * FROM scraped_jobs sj
-        WHERE sj.title ILIKE %:query%
+        SELECT sj.* FROM scraped_jobs sj
+        CROSS JOIN (
+            SELECT websearch_to_tsquery('portuguese', :query) || websearch_to_tsquery('simple', :query) AS q
+        ) ts
+        WHERE sj.search_vector @@ ts.q
+        ORDER BY ts_rank(sj.search_vector, ts.q) DESC, sj.scraped_at DESC
     """, nativeQuery = true)
     List<ScrapedJob> searchJobByKeyword(@Param("query") String query);
 
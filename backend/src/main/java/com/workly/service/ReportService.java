@@ -8,11 +8,7 @@ import lombok.AllArgsConstructor;
 import org.springframework.stereotype.Service;
 import org.springframework.transaction.annotation.Transactional;
 
-import java.util.Arrays;
 import java.util.List;
-import java.util.Map;
-import java.util.Objects;
-import java.util.stream.Collectors;
 
 @Service
 @AllArgsConstructor
@@ -31,18 +27,8 @@ public class ReportService {
 
     @Transactional(readOnly = true)
     public List<LanguageUsageDTO> getLanguagedUsage(Long userId) {
-        List<String> skills = repository.findAllSkillsByUser(userId);
-
-        Map<String, Long> skillCount = skills.stream()
-                .filter(Objects::nonNull)
-                .flatMap(s -> Arrays.stream(s.split("\\s*\\|\\s*")))
-                .map(String::trim)
-                .filter(s -> !s.isEmpty() && !s.equals("+"))
-                .collect(Collectors.groupingBy(s-> s, Collectors.counting()));
-
-        return skillCount.entrySet().stream()
-                .sorted(Map.Entry.<String, Long>comparingByValue().reversed())
-                .map(e -> new LanguageUsageDTO(e.getKey(), e.getValue()))
+        return repository.countSkillsByUser(userId).stream()
+                .map(row -> new LanguageUsageDTO((String) row[0], ((Number) row[1]).longValue()))
                 .toList();
     }
 }
@@ -0,0 +1,5 @@
+-- vaga original (link_hash) de uma quase duplicata detectada pelo scraper (MinHash/LSH);
+-- gravado só na inserção, NULL para as vagas originais
+ALTER TABLE scraped_jobs ADD COLUMN duplicate_of CHAR(64);
+
+CREATE INDEX idx_scraped_jobs_duplicate_of ON scraped_jobs(duplicate_of) WHERE duplicate_of IS NOT NULL;
@@ -0,0 +1,44 @@
+-- grafias alternativas -> nome canônico. Fonte única dos aliases de skill:
+-- usada na gravação (scraper) e na busca (backend) pela função normalize_skill
+CREATE TABLE skill_aliases (
+    alias VARCHAR(100) PRIMARY KEY,
+    skill VARCHAR(100) NOT NULL
+);
+
+INSERT INTO skill_aliases (alias, skill) VALUES
+    ('js', 'javascript'), ('java script', 'javascript'), ('ecmascript', 'javascript'),
+    ('ts', 'typescript'),
+    ('node', 'node.js'), ('nodejs', 'node.js'), ('node js', 'node.js'),
+    ('reactjs', 'react'), ('react.js', 'react'), ('react js', 'react'),
+    ('react-native', 'react native'), ('reactnative', 'react native'),
+    ('vue', 'vue.js'), ('vuejs', 'vue.js'), ('vue js', 'vue.js'),
+    ('angularjs', 'angular'), ('angular.js', 'angular'),
+    ('csharp', 'c#'), ('c sharp', 'c#'),
+    ('cpp', 'c++'),
+    ('dotnet', '.net'), ('dot net', '.net'),
+    ('golang', 'go'),
+    ('python3', 'python'), ('python 3', 'python'),
+    ('postgres', 'postgresql'), ('postgre sql', 'postgresql'), ('postgre', 'postgresql'),
+    ('rails', 'ruby on rails'), ('ror', 'ruby on rails'),
+    ('html5', 'html'),
+    ('css3', 'css'),
+    ('word press', 'wordpress'),
+    ('aws', 'amazon web services');
+
+-- minúsculas, espaços colapsados e alias resolvido; NULL para tokens vazios ou "+"
+CREATE FUNCTION normalize_skill(raw TEXT) RETURNS VARCHAR(100) AS $$
+    SELECT LEFT(COALESCE(a.skill, t.skill), 100)
+      FROM (SELECT NULLIF(NULLIF(regexp_replace(lower(trim(raw)), '\s+', ' ', 'g'), ''), '+') AS skill) t
+      LEFT JOIN skill_aliases a ON a.alias = t.skill
+$$ LANGUAGE sql STABLE;
+
+-- o backfill da V8 gravou os tokens sem aliases: reescreve com o nome canônico
+INSERT INTO job_skills (job_id, skill)
+SELECT js.job_id, a.skill
+  FROM job_skills js
+  JOIN skill_aliases a ON a.alias = js.skill
+ON CONFLICT DO NOTHING;
+
+DELETE FROM job_skills js
+ USING skill_aliases a
+ WHERE js.skill = a.alias;
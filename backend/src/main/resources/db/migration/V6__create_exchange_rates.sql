@@ -0,0 +1,16 @@
+CREATE TABLE exchange_rates (
+    id BIGSERIAL PRIMARY KEY,
+    base_currency CHAR(3) NOT NULL,
+    quote_currency CHAR(3) NOT NULL,
+    rate DECIMAL(12,6) NOT NULL,
+    source VARCHAR(50) NOT NULL,
+    fetched_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    recorded_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX idx_exchange_rates_pair_fetched ON exchange_rates(base_currency, quote_currency, fetched_at DESC);
+
+-- cotação usada na conversão de cada vaga em USD (NULL para orçamentos em BRL)
+ALTER TABLE scraped_jobs ADD COLUMN exchange_rate_id BIGINT REFERENCES exchange_rates(id);
+
+CREATE INDEX idx_scraped_jobs_exchange_rate ON scraped_jobs(exchange_rate_id);
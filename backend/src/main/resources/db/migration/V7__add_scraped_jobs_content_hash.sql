@@ -0,0 +1,9 @@
+-- impressão digital do conteúdo (título, descrição, skills, orçamento; as propostas
+-- ficam de fora): o upsert do scraper só reescreve a linha quando ela muda
+ALTER TABLE scraped_jobs ADD COLUMN content_hash CHAR(64);
+
+-- última vez em que a vaga apareceu numa listagem; sem índice de propósito,
+-- para o toque em lote ser um HOT update (sem tocar índices)
+ALTER TABLE scraped_jobs ADD COLUMN last_seen_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP;
+
+UPDATE scraped_jobs SET last_seen_at = scraped_at;
@@ -0,0 +1,16 @@
+-- skills normalizadas (minúsculas, espaços colapsados, aliases resolvidos pela função
+-- normalize_skill da V11), uma linha por vaga/skill, gravadas na mesma transação do upsert da vaga
+CREATE TABLE job_skills (
+    job_id BIGINT NOT NULL REFERENCES scraped_jobs(id) ON DELETE CASCADE,
+    skill VARCHAR(100) NOT NULL,
+    PRIMARY KEY (job_id, skill)
+);
+
+CREATE INDEX idx_job_skills_skill ON job_skills(skill, job_id);
+
+-- backfill das vagas já gravadas; os aliases são aplicados a estas linhas pela V11
+INSERT INTO job_skills (job_id, skill)
+SELECT DISTINCT sj.id, LEFT(regexp_replace(lower(trim(s.skill)), '\s+', ' ', 'g'), 100)
+  FROM scraped_jobs sj,
+       regexp_split_to_table(sj.skills, '\s*\|\s*') AS s(skill)
+ WHERE trim(s.skill) NOT IN ('', '+');
@@ -0,0 +1,15 @@
+-- vetor de busca textual, preenchido pelo scraper a cada gravação (search_index.py):
+-- título (A), skills (B) e descrição (C), com os dicionários portuguese e simple;
+-- da descrição sai só o link "Ver mais" no fim do texto (como listing_parser.strip_ver_mais)
+ALTER TABLE scraped_jobs ADD COLUMN search_vector TSVECTOR;
+
+UPDATE scraped_jobs
+   SET search_vector =
+       setweight(to_tsvector('portuguese', coalesce(title, '')), 'A') ||
+       setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+       setweight(to_tsvector('portuguese', coalesce(skills, '')), 'B') ||
+       setweight(to_tsvector('simple', coalesce(skills, '')), 'B') ||
+       setweight(to_tsvector('portuguese', coalesce(regexp_replace(description, '\s*\m(ver|mostrar) (mais|menos)( detalhes)?\M\s*$', '', 'i'), '')), 'C') ||
+       setweight(to_tsvector('simple', coalesce(regexp_replace(description, '\s*\m(ver|mostrar) (mais|menos)( detalhes)?\M\s*$', '', 'i'), '')), 'C');
+
+CREATE INDEX idx_scraped_jobs_search_vector ON scraped_jobs USING GIN (search_vector);
@@ -0,0 +1,253 @@
+"""
+Workly - Motor assíncrono (--engine async).
+
+Busca listagens (todas as páginas `&page=N`, em janelas) e páginas de detalhe
+via HTTP (httpx), todas concorrentes sob um semáforo, sem navegador. A extração é a mesma do motor Selenium: os cards
+vêm de `parse_listing_html`, as páginas de detalhe de `parse_detail_html` e o
+projeto (descrição, habilidades, orçamento e conversão) de `build_project`,
+alimentado com a página já baixada. Os projetos seguem para o banco por um
+escritor em lote assíncrono.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+from db_writer import AsyncBatchedDBWriter
+from detail_fetcher import HTTP_HEADERS, DetailPage, absolute_link, parse_detail_html
+from exchange_rates import RateLookup
+from language_matcher import LanguageMatcher
+from listing_parser import parse_listing_html
+from near_duplicates import NearDuplicateIndex
+from page_crawler import (
+    DEFAULT_MAX_PAGES, DEFAULT_PAGE_WINDOW, LISTING_MODE_PAGES, MAX_FAILED_PAGES, PAGE_RETRIES, new_cards, retry_delay,
+)
+from query_planner import ListingQuery, plan_queries
+from run_metrics import metrics
+from workana_scraper import (
+    PARTIAL_KEY, build_project, cycle_known_hashes, cycle_writer_options, detail_fields_needed, duplicate_record,
+    generate_link_hash, load_duplicate_index, log_card_error, merge_listings, open_cycle_journal, prepare_record, project_hash,
+    record_run_rate, split_known, split_near_duplicates, write_run_report,
+)
+
+logger = logging.getLogger("workly-scraper")
+
+DEFAULT_TIMEOUT = 15.0
+
+
+class PrefetchedDetailFetcher:
+    """Entrega a `build_project` a página de detalhe já baixada pelo motor assíncrono."""
+
+    name = "async"
+
+    def __init__(self, pages: Dict[str, DetailPage]):
+        self.pages = pages
+
+    def fetch(self, link: str, fields=None) -> DetailPage:
+        return self.pages.get(link) or DetailPage(backend=self.name)
+
+    def log_stats(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class AsyncScraper:
+    def __init__(self, concurrency: int, timeout: float = DEFAULT_TIMEOUT):
+        self.concurrency = max(1, concurrency)
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.client = httpx.AsyncClient(
+            headers=HTTP_HEADERS, timeout=timeout, follow_redirects=True,
+            limits=httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency),
+        )
+
+    async def aclose(self):
+        await self.client.aclose()
+
+    async def get_html(self, url: str) -> str:
+        async with self.semaphore:
+            r = await self.client.get(url)
+        r.raise_for_status()
+        return r.text
+
+    async def read_listing(self, query: ListingQuery, page: int = 1) -> Optional[List[dict]]:
+        """Cards de uma página da listagem, com novas tentativas; None se ela falhou em todas."""
+        for attempt in range(PAGE_RETRIES + 1):
+            if attempt:
+                await asyncio.sleep(retry_delay(attempt))
+            try:
+                with metrics.stage("listing_load"):
+                    html = await self.get_html(query.page_url(page))
+                break
+            except httpx.TimeoutException:
+                metrics.inc("timeouts")
+                logger.warning("Timeout ao ler listagem %s, página %d (tentativa %d).", query.label, page, attempt + 1)
+            except Exception as e:
+                metrics.inc("errors")
+                logger.warning("Erro ao ler listagem %s, página %d (tentativa %d): %s", query.label, page, attempt + 1, e)
+        else:
+            logger.error("Página %d de %s pulada após %d tentativas.", page, query.label, PAGE_RETRIES + 1)
+            return None
+        # parsing fora do loop: o lxml libera o GIL e as requisições seguem andando
+        stubs = await asyncio.to_thread(parse_listing_html, html)
+        metrics.inc("cards_seen", len(stubs))
+        for stub in stubs:
+            stub["query"] = query.label
+        return stubs
+
+    async def read_pages(self, query: ListingQuery, max_pages: int) -> List[dict]:
+        """
+        Páginas `&page=N` da consulta em janelas de até DEFAULT_PAGE_WINDOW,
+        até a primeira lida com sucesso sem nenhum link novo (mesmas regras de
+        page_crawler.crawl_queries, inclusive para páginas que falham).
+        """
+        window = max(1, min(DEFAULT_PAGE_WINDOW, self.concurrency))
+        seen = set()
+        stubs = []
+        page = 1
+        failed = 0
+        while page <= max_pages:
+            batch = range(page, min(page + window, max_pages + 1))
+            results = await asyncio.gather(*(self.read_listing(query, n) for n in batch))
+            for found in results:
+                if found is None:
+                    failed += 1
+                    if failed >= MAX_FAILED_PAGES:
+                        logger.error("%d páginas seguidas falharam em %s; consulta interrompida.", failed, query.label)
+                        return stubs
+                    page += 1
+                    continue
+                failed = 0
+                new = new_cards(found, seen, generate_link_hash)
+                if not new:
+                    logger.info("[PÁGINAS] %s: %d páginas, %d cards.", query.label, page - 1, len(stubs))
+                    return stubs
+                stubs.extend(new)
+                page += 1
+        logger.info("Limite de páginas (MAX=%d) atingido em %s.", max_pages, query.label)
+        return stubs
+
+    async def read_listings(self, queries: List[ListingQuery], listing_mode: str = LISTING_MODE_PAGES,
+                            max_pages: int = DEFAULT_MAX_PAGES) -> List[dict]:
+        if listing_mode == LISTING_MODE_PAGES:
+            results = await asyncio.gather(*(self.read_pages(q, max_pages) for q in queries))
+        else:
+            results = await asyncio.gather(*(self.read_listing(q) for q in queries))
+        return merge_listings(queries, [found or [] for found in results])
+
+    async def fetch_detail(self, link: str) -> Optional[DetailPage]:
+        started = time.perf_counter()
+        try:
+            html = await self.get_html(absolute_link(link))
+        except httpx.TimeoutException:
+            metrics.inc("timeouts")
+            return None
+        except Exception as e:
+            logger.debug("Falha ao baixar detalhe %s: %s", link, e)
+            return None
+        page = await asyncio.to_thread(parse_detail_html, html)
+        page.backend = PrefetchedDetailFetcher.name
+        elapsed = time.perf_counter() - started
+        metrics.add_stage("detail_pages", elapsed)
+        metrics.observe("detail_page_seconds", elapsed)
+        metrics.inc("detail_navigations")
+        return page
+
+    async def enrich(self, stub: dict, usd_to_brl: float) -> Optional[dict]:
+        started = time.perf_counter()
+        try:
+            pages = {}
+            if stub["link"] and detail_fields_needed(stub):
+                page = await self.fetch_detail(stub["link"])
+                if page is not None:
+                    pages[stub["link"]] = page
+            # mesmas regras do motor Selenium, sobre a página já baixada
+            return build_project(stub, PrefetchedDetailFetcher(pages), usd_to_brl)
+        except Exception as e:
+            log_card_error(stub["idx"], e)
+            return None
+        finally:
+            elapsed = time.perf_counter() - started
+            metrics.add_stage("enrich", elapsed)
+            metrics.observe("card_seconds", elapsed)
+
+
+async def scrape_async(args, db, stop_event: threading.Event = None, resume: bool = False,
+                       duplicates: NearDuplicateIndex = None) -> int:
+    journal, resumed = await asyncio.to_thread(open_cycle_journal, args, db, resume)
+    duplicates = await asyncio.to_thread(load_duplicate_index, args, db, duplicates)
+    known_hashes = await asyncio.to_thread(cycle_known_hashes, args, db)
+    if resumed:
+        known_hashes = (known_hashes or set()) | resumed
+    rate_lookup = RateLookup.start()
+    queries = plan_queries(args.linguagem, args.categoria, args.publicacao)
+    matcher = LanguageMatcher(args.linguagem or [])
+    logger.info("[ASYNC] Iniciando %d consulta(s) com até %d requisições simultâneas.", len(queries), args.concurrency)
+
+    writer = AsyncBatchedDBWriter(**cycle_writer_options(args, db, journal))
+    writer.start()
+    scraper = AsyncScraper(args.concurrency)
+    total = 0
+    started = time.time()
+    try:
+        stubs = await scraper.read_listings(queries, args.listing_mode, args.max_pages)
+        logger.info("Após deduplicação: %d cards", len(stubs))
+        stubs, known_projetos = split_known(stubs, known_hashes)
+        stubs, duplicate_stubs = split_near_duplicates(stubs, duplicates)
+
+        with metrics.stage("exchange_rate"):
+            quote = await asyncio.to_thread(rate_lookup.result)
+        rate_id = await asyncio.to_thread(record_run_rate, db, quote)
+
+        for projeto in known_projetos:
+            await writer.put(projeto)
+            total += 1
+        for stub in duplicate_stubs:
+            projeto = duplicate_record(stub, quote.rate)
+            if prepare_record(projeto, matcher, args.estrito, rate_id):
+                journal.append(project_hash(projeto), projeto)
+                await writer.put(projeto)
+                total += 1
+
+        tasks = [asyncio.ensure_future(scraper.enrich(stub, quote.rate)) for stub in stubs]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                projeto = await next_done
+                if projeto is None or not prepare_record(projeto, matcher, args.estrito, rate_id):
+                    continue
+                if not projeto.get(PARTIAL_KEY):
+                    journal.append(project_hash(projeto), projeto)
+                await writer.put(projeto)
+                total += 1
+                if stop_event is not None and stop_event.is_set():
+                    logger.info("Parada solicitada; encerrando o ciclo atual.")
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        await scraper.aclose()
+        await writer.close()
+        journal.close()
+
+    elapsed = time.time() - started
+    logger.info("[ASYNC] %d projetos em %.1fs (%.0f/min).", total, elapsed, total * 60 / elapsed if elapsed else 0.0)
+    return total
+
+
+def run_async_cycle(args, db, stop_event: threading.Event = None, resume: bool = False,
+                    duplicates: NearDuplicateIndex = None) -> int:
+    """Equivalente assíncrono de `run_cycle`: mesmo incremental, diário, duplicatas, filtros, cotação e relatório."""
+    metrics.reset()
+    try:
+        total = asyncio.run(scrape_async(args, db, stop_event, resume, duplicates))
+    finally:
+        write_run_report(args.metrics_dir)
+    logger.info("Scraping finalizado — total coletado: %d", total)
+    return total
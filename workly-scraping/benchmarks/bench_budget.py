@@ -0,0 +1,138 @@
+"""
+Benchmark e regressão do parser de orçamentos.
+
+Confere budget_parser contra o corpus em benchmarks/data (sai com código 1 se
+algum caso divergir) e compara o throughput com as versões anteriores de
+tratar_orcamento/normalize_value, reproduzidas aqui como referência.
+
+    python benchmarks/bench_budget.py --repeat 200
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from budget_parser import parse_budget, parse_budgets, tratar_orcamento  # noqa: E402
+from normalize import normalize_value  # noqa: E402
+
+DATA_DIR = os.path.join(BENCH_DIR, "data")
+
+
+def legacy_tratar_orcamento(orcamento_texto: str):
+    if not orcamento_texto:
+        return "DESCONHECIDO", None, None, ""
+    texto = orcamento_texto.upper().strip()
+    texto = re.sub(r"/\s*HORA", "", texto)
+    texto = re.sub(r"\s*POR\s*HORA", "", texto)
+    texto = texto.replace("POR HORA", "")
+    texto = texto.strip()
+    moeda = "DESCONHECIDO"
+    if "US$" in texto or texto.startswith("USD") or "USD " in texto:
+        moeda = "USD"
+    elif "R$" in texto or texto.startswith("BRL") or "BRL " in texto:
+        moeda = "BRL"
+    valores = re.sub(r"(US\$|USD|R\$|BRL)", "", texto).strip()
+    numeros = re.findall(r"[\d\.,]+", valores)
+    try:
+        numeros = [float(n.replace(".", "").replace(",", ".")) for n in numeros]
+    except Exception:
+        numeros = []
+    minimo = maximo = None
+    if len(numeros) == 1:
+        minimo = numeros[0]
+    elif len(numeros) >= 2:
+        minimo, maximo = numeros[0], numeros[1]
+    return moeda, minimo, maximo, texto
+
+
+def legacy_normalize_value(value, target_type="str"):
+    if value in ("", None, "None", "null"):
+        return None
+    try:
+        if target_type == "int":
+            if isinstance(value, str):
+                m = re.search(r"\d+", value)
+                if not m:
+                    return None
+                return int(m.group(0))
+            return int(value)
+        elif target_type == "float":
+            if isinstance(value, str):
+                v = re.sub(r"[^\d\.,-]", "", value).strip()
+                if not v:
+                    return None
+                v = v.replace(".", "").replace(",", ".") if v.count(",") and v.count(".") == 0 else v.replace(",", "")
+                return float(v)
+            return float(value)
+        elif target_type == "str":
+            return str(value).strip()
+    except (ValueError, TypeError):
+        return None
+    return value
+
+
+def load(name: str):
+    with open(os.path.join(DATA_DIR, name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def check(budgets, values) -> int:
+    falhas = 0
+    for case in budgets:
+        b = parse_budget(case["text"])
+        got = (b.currency, b.minimum, b.maximum, b.hourly)
+        want = (case["currency"], case["min"], case["max"], case["hourly"])
+        old = legacy_tratar_orcamento(case["text"])[:3]
+        if got != want:
+            falhas += 1
+            print(f"FALHA  {case['text']!r}: esperado {want}, obtido {got}")
+        elif old != want[:3]:
+            print(f"CORRIGIDO  {case['text']!r}: antes {old}")
+    for case in values:
+        got = normalize_value(case["value"], case["type"])
+        if got != case["expected"]:
+            falhas += 1
+            print(f"FALHA  normalize_value({case['value']!r}, {case['type']!r}): "
+                  f"esperado {case['expected']!r}, obtido {got!r}")
+    return falhas
+
+
+def timed(label: str, fn, n: int):
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<34} {n:>8} chamadas  {elapsed:8.3f}s  {n / elapsed:12.0f} /s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regressão e throughput do parser de orçamentos.")
+    parser.add_argument("--repeat", type=int, default=500, help="Quantas vezes percorrer o corpus.")
+    args = parser.parse_args(argv)
+
+    budgets = load("budget_corpus.json")
+    values = load("normalize_corpus.json")
+    falhas = check(budgets, values)
+    print(f"Corpus: {len(budgets)} orçamentos, {len(values)} valores, {falhas} falha(s).\n")
+
+    textos = [c["text"] for c in budgets] * args.repeat
+    pares = [(c["value"], c["type"]) for c in values] * args.repeat
+
+    timed("tratar_orcamento (anterior)", lambda: [legacy_tratar_orcamento(t) for t in textos], len(textos))
+    parse_budget.cache_clear()
+    timed("tratar_orcamento (budget_parser)", lambda: [tratar_orcamento(t) for t in textos], len(textos))
+    parse_budget.cache_clear()
+    timed("parse_budgets (lote)", lambda: parse_budgets(textos), len(textos))
+    timed("normalize_value (anterior)", lambda: [legacy_normalize_value(v, t) for v, t in pares], len(pares))
+    timed("normalize_value (atual)", lambda: [normalize_value(v, t) for v, t in pares], len(pares))
+
+    sys.exit(1 if falhas else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark: save_to_db (execute_values) x bulk_save_to_db (COPY + merge).
+
+Gera N projetos sintéticos, grava com os dois caminhos (carga inicial e
+regravação com conflito) e mostra linhas/s. Usa o banco configurado no .env
+(DB_NAME, DB_USER, ...) e remove as linhas sintéticas ao final.
+
+    python benchmarks/bench_db_load.py --rows 20000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import psycopg2  # noqa: E402
+
+from settings import DB_CONFIG  # noqa: E402
+
+BENCH_LINK_PREFIX = "https://bench.workly.local/job/"
+
+
+def synthetic_projects(n: int, prefix: str, revision: int = 0):
+    """`revision` muda o título, forçando o upsert a reescrever as linhas."""
+    for i in range(n):
+        yield {
+            "Título": f"Projeto sintético {i}" + (f" (rev. {revision})" if revision else ""),
+            "Link": f"{BENCH_LINK_PREFIX}{prefix}-{i}",
+            "Descrição": "Desenvolvimento de API REST em Python e PostgreSQL. " * 8,
+            "Habilidades": "Python | PostgreSQL | Django",
+            "Orçamento Original": "USD 250 - 500",
+            "Mínimo (BRL)": 1400.0,
+            "Máximo (BRL)": 2800.0,
+            "Propostas": "Propostas: 12",
+            "Metodo": "convert_api",
+        }
+
+
+def cleanup(conn):
+    with conn.cursor() as cur:
+        cur.execute("DELETE FROM scraped_jobs WHERE link LIKE %s", (BENCH_LINK_PREFIX + "%",))
+    conn.commit()
+
+
+def timed(label: str, fn, n: int):
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<34} {n:>8} linhas  {elapsed:8.2f}s  {n / elapsed:10.0f} linhas/s")
+    return elapsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compara execute_values e COPY + merge no scraped_jobs.")
+    parser.add_argument("--rows", type=int, default=10000)
+    args = parser.parse_args(argv)
+    n = args.rows
+    from workana_scraper import bulk_save_to_db, save_to_db
+
+    conn = psycopg2.connect(**DB_CONFIG)
+    try:
+        cleanup(conn)
+        timed("execute_values (insert)", lambda: save_to_db(conn, list(synthetic_projects(n, "ev"))), n)
+        timed("execute_values (sem mudança)", lambda: save_to_db(conn, list(synthetic_projects(n, "ev"))), n)
+        timed("execute_values (update)", lambda: save_to_db(conn, list(synthetic_projects(n, "ev", 1))), n)
+        timed("COPY + merge (insert)", lambda: bulk_save_to_db(conn, synthetic_projects(n, "copy")), n)
+        timed("COPY + merge (sem mudança)", lambda: bulk_save_to_db(conn, synthetic_projects(n, "copy")), n)
+        timed("COPY + merge (update)", lambda: bulk_save_to_db(conn, synthetic_projects(n, "copy", 1)), n)
+    finally:
+        cleanup(conn)
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark: páginas de detalhe com e sem bloqueio de recursos (resource_blocking).
+
+Abre os mesmos links com cada perfil e mede, pela Navigation/Resource Timing
+API do navegador, o tempo de carregamento e os bytes transferidos por página
+(recursos bloqueados não aparecem; terceiros sem Timing-Allow-Origin contam 0).
+
+    python benchmarks/bench_resource_blocking.py --from-db 10
+    python benchmarks/bench_resource_blocking.py --links https://www.workana.com/job/... --profiles none default
+"""
+
+import argparse
+import os
+import statistics
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from resource_blocking import BLOCK_PROFILES  # noqa: E402
+from settings import DB_CONFIG  # noqa: E402
+
+PAGE_STATS_JS = """
+const nav = performance.getEntriesByType('navigation')[0] || {};
+const res = performance.getEntriesByType('resource');
+return {
+  load_ms: nav.loadEventEnd ? nav.loadEventEnd - nav.startTime : nav.duration || 0,
+  dcl_ms: nav.domContentLoadedEventEnd ? nav.domContentLoadedEventEnd - nav.startTime : 0,
+  bytes: (nav.transferSize || 0) + res.reduce((s, r) => s + (r.transferSize || 0), 0),
+  requests: res.length + 1,
+};
+"""
+
+
+def links_from_db(n: int):
+    import psycopg2
+    conn = psycopg2.connect(**DB_CONFIG)
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT link FROM scraped_jobs WHERE link IS NOT NULL ORDER BY scraped_at DESC LIMIT %s", (n,))
+            return [r[0] for r in cur.fetchall()]
+    finally:
+        conn.close()
+
+
+def measure_profile(profile: str, links):
+    from workana_scraper import setup_driver
+    driver = setup_driver(headless=True, block_profile=profile)
+    try:
+        # aquece o navegador (cache de DNS/TLS) com o primeiro link, fora da medição
+        driver.get(links[0])
+        stats = []
+        for link in links:
+            driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            driver.get(link)
+            stats.append(driver.execute_script(PAGE_STATS_JS))
+        return stats
+    finally:
+        driver.quit()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tempo de carga e bytes por página de detalhe, por perfil de bloqueio.")
+    parser.add_argument("--links", nargs="+", help="Links de vagas a abrir.")
+    parser.add_argument("--from-db", type=int, default=0, help="Usa os N links mais recentes do scraped_jobs.")
+    parser.add_argument("--profiles", nargs="+", default=["none", "default"], choices=sorted(BLOCK_PROFILES))
+    args = parser.parse_args(argv)
+
+    links = list(args.links or [])
+    if args.from_db:
+        links += links_from_db(args.from_db)
+    if not links:
+        parser.error("informe --links ou --from-db")
+
+    print(f"{'perfil':<10} {'páginas':>8} {'load (ms)':>12} {'DCL (ms)':>10} {'KB/página':>11} {'requisições':>12}")
+    for profile in args.profiles:
+        stats = measure_profile(profile, links)
+        print(f"{profile:<10} {len(stats):>8} "
+              f"{statistics.median(s['load_ms'] for s in stats):>12.0f} "
+              f"{statistics.median(s['dcl_ms'] for s in stats):>10.0f} "
+              f"{statistics.mean(s['bytes'] for s in stats) / 1024:>11.1f} "
+              f"{statistics.mean(s['requests'] for s in stats):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
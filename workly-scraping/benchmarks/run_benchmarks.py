@@ -0,0 +1,233 @@
+"""
+Suíte de microbenchmarks offline do scraper.
+
+Mede as funções puras, a extração de cards e da página de detalhe sobre os HTMLs
+salvos em benchmarks/fixtures (sem acessar a Workana) e, se houver um Postgres
+configurado no .env, o save_to_db. O resultado vai para um JSON estável (chaves
+ordenadas), que pode ser versionado e comparado entre commits:
+
+    python benchmarks/run_benchmarks.py --output bench.json
+    python benchmarks/run_benchmarks.py --compare bench.json --skip-db
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from budget_parser import parse_budget, tratar_orcamento  # noqa: E402
+from detail_parser import DetailPage, parse_detail_html  # noqa: E402
+from language_matcher import match_languages  # noqa: E402
+from listing_parser import parse_listing_html  # noqa: E402
+from near_duplicates import NearDuplicateIndex, signature  # noqa: E402
+from normalize import generate_link_hash, normalize_url_for_hash, normalize_value  # noqa: E402
+
+FIXTURES_DIR = os.path.join(BENCH_DIR, "fixtures")
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, "results.json")
+USD_TO_BRL = 5.5
+
+
+def load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+class FixtureDetailFetcher:
+    """Fetcher que devolve sempre a página de detalhe salva, já parseada a cada chamada."""
+    name = "fixture"
+
+    def __init__(self, html: str):
+        self.html = html
+
+    def fetch(self, link, fields=None) -> DetailPage:
+        return parse_detail_html(self.html)
+
+    def close(self):
+        pass
+
+
+def measure(fn, number: int, repeat: int) -> dict:
+    """Executa `fn` `number` vezes por rodada; guarda o tempo por chamada de cada rodada."""
+    per_call = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        per_call.append((time.perf_counter() - started) / number)
+    best = min(per_call)
+    return {
+        "number": number,
+        "repeat": repeat,
+        "best_us": round(best * 1e6, 3),
+        "median_us": round(statistics.median(per_call) * 1e6, 3),
+        "ops_per_sec": round(1 / best, 1) if best else None,
+    }
+
+
+def pure_benchmarks(scale: int) -> dict:
+    listing = parse_listing_html(load_fixture("listing.html"))
+    orcamentos = [c["orcamento"] for c in listing]
+    links = [c["link"] for c in listing]
+    projeto = {"Título": listing[0]["titulo"], "Descrição": listing[0]["descricao"],
+               "Habilidades": " | ".join(listing[0]["habilidades"])}
+    languages = ["java", "python", "react"]
+    duplicates = NearDuplicateIndex()
+    for c in listing:
+        duplicates.add(generate_link_hash(c["link"]), signature(c["titulo"], c["descricao"]))
+
+    def run_budget():
+        for o in orcamentos:
+            tratar_orcamento(o)
+
+    def run_budget_cold():
+        parse_budget.cache_clear()
+        for o in orcamentos:
+            tratar_orcamento(o)
+
+    def run_normalize():
+        normalize_value("Propostas: 12", "int")
+        normalize_value("1.500,50", "float")
+        normalize_value(1400.0, "float")
+        normalize_value("  texto  ", "str")
+
+    def run_url():
+        for link in links:
+            normalize_url_for_hash(link)
+
+    def run_hash():
+        for link in links:
+            generate_link_hash(link)
+
+    def run_near_duplicates():
+        for c in listing:
+            duplicates.query(signature(c["titulo"], c["descricao"]))
+
+    return {
+        "tratar_orcamento": measure(run_budget, 200 * scale, 5),
+        "tratar_orcamento_cold": measure(run_budget_cold, 50 * scale, 5),
+        "normalize_value": measure(run_normalize, 500 * scale, 5),
+        "normalize_url_for_hash": measure(run_url, 200 * scale, 5),
+        "generate_link_hash": measure(run_hash, 200 * scale, 5),
+        "match_languages": measure(lambda: match_languages(projeto, languages), 1000 * scale, 5),
+        "near_duplicate_check": measure(run_near_duplicates, 20 * scale, 5),
+    }
+
+
+def extraction_benchmarks(scale: int) -> dict:
+    # enrich_card mora no scraper (Selenium/psycopg2): importado só quando medido
+    from workana_scraper import enrich_card
+
+    listing_html = load_fixture("listing.html")
+    detail_html = load_fixture("detail.html")
+    stubs = parse_listing_html(listing_html)
+    fetcher = FixtureDetailFetcher(detail_html)
+
+    def run_cards():
+        for stub in stubs:
+            enrich_card(dict(stub), fetcher, USD_TO_BRL)
+
+    return {
+        "parse_listing_html": measure(lambda: parse_listing_html(listing_html), 10 * scale, 5),
+        "parse_detail_html": measure(lambda: parse_detail_html(detail_html), 20 * scale, 5),
+        "enrich_card_listing": measure(run_cards, 2 * scale, 5),
+    }
+
+
+def db_benchmarks(rows: int) -> dict:
+    import psycopg2
+    from bench_db_load import cleanup, synthetic_projects
+    from settings import DB_CONFIG
+    from workana_scraper import save_to_db
+
+    conn = psycopg2.connect(**DB_CONFIG)
+    try:
+        cleanup(conn)
+        results = {}
+        for label, revision in (("insert", 0), ("unchanged", 0), ("update", 1)):
+            projetos = list(synthetic_projects(rows, "suite", revision))
+            started = time.perf_counter()
+            save_to_db(conn, projetos)
+            elapsed = time.perf_counter() - started
+            results[f"save_to_db_{label}"] = {
+                "rows": rows,
+                "seconds": round(elapsed, 4),
+                "rows_per_sec": round(rows / elapsed, 1),
+            }
+        return results
+    finally:
+        cleanup(conn)
+        conn.close()
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=BENCH_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return ""
+
+
+def compare(current: dict, baseline_path: str):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    print(f"\n{'benchmark':<28} {'antes':>12} {'agora':>12} {'razão':>8}")
+    for name, res in current.items():
+        old = baseline.get(name)
+        key = "best_us" if "best_us" in res else "seconds"
+        if not old or key not in old or not res.get(key):
+            continue
+        print(f"{name:<28} {old[key]:>12} {res[key]:>12} {old[key] / res[key]:>7.2f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Microbenchmarks offline do scraper (fixtures em benchmarks/fixtures).")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="Arquivo JSON de saída.")
+    parser.add_argument("--compare", help="JSON de uma execução anterior para comparar.")
+    parser.add_argument("--scale", type=int, default=1, help="Multiplica o número de iterações.")
+    parser.add_argument("--db-rows", type=int, default=2000, help="Linhas sintéticas para o save_to_db.")
+    parser.add_argument("--skip-db", action="store_true", help="Não mede o save_to_db.")
+    args = parser.parse_args(argv)
+
+    results = {}
+    results.update(pure_benchmarks(args.scale))
+    results.update(extraction_benchmarks(args.scale))
+    if not args.skip_db:
+        try:
+            results.update(db_benchmarks(args.db_rows))
+        except Exception as e:
+            print(f"save_to_db ignorado: {e}")
+
+    for name, res in results.items():
+        if "best_us" in res:
+            print(f"{name:<28} {res['best_us']:>12.2f} µs  {res['ops_per_sec']:>12.0f} /s")
+        else:
+            print(f"{name:<28} {res['seconds']:>12.3f} s   {res['rows_per_sec']:>12.0f} linhas/s")
+
+    report = {
+        "meta": {
+            "git": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True, ensure_ascii=False)
+        f.write("\n")
+    print(f"\nResultados gravados em {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
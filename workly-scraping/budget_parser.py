@@ -0,0 +1,104 @@
+"""
+Workly - Parser de orçamentos e valores da Workana.
+
+Regexes pré-compiladas e cache por texto (os mesmos orçamentos se repetem muito
+na listagem). Entende separadores brasileiros e americanos ("1.500,00",
+"USD 1,000 - 3,000"), faixas abertas ("Mais de", "Menos de") e valores por hora.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, List, NamedTuple, Optional
+
+CURRENCY_UNKNOWN = "DESCONHECIDO"
+
+_HOURLY_RE = re.compile(r"\s*(?:/\s*(?:HORA|HR|H)\b|POR\s*HORA|PER\s*HOUR)", re.IGNORECASE)
+# sem \b depois do código: "USD50" (valor colado) também é USD
+_USD_RE = re.compile(r"US\$|\bUSD(?![A-Z])")
+_BRL_RE = re.compile(r"R\$|\bBRL(?![A-Z])")
+_CURRENCY_RE = re.compile(r"US\$|USD|R\$|BRL")
+_NUMBER_RE = re.compile(r"\d[\d.,]*")
+_MAX_ONLY_RE = re.compile(r"\b(?:MENOS\s+DE|AT[EÉ]|LESS\s+THAN|UP\s+TO)\b")
+_THOUSANDS_GROUP_RE = re.compile(r"^\d{1,3}(?:[.,]\d{3})+$")
+_DIGITS_RE = re.compile(r"\d+")
+_NON_NUMERIC_RE = re.compile(r"[^\d.,-]")
+
+
+class Budget(NamedTuple):
+    currency: str
+    minimum: Optional[float]
+    maximum: Optional[float]
+    hourly: bool
+    text: str
+
+
+def parse_number(token: str) -> Optional[float]:
+    """
+    Converte um número com separadores BR ou US em float.
+    O último separador é o decimal quando os dois aparecem; um separador único
+    seguido de exatamente 3 dígitos é de milhar ("1.500", "1,000").
+    """
+    if token is None:
+        return None
+    token = _NON_NUMERIC_RE.sub("", str(token)).strip(".,")
+    if not token or token == "-":
+        return None
+    try:
+        if "." in token and "," in token:
+            decimal = "," if token.rfind(",") > token.rfind(".") else "."
+            thousands = "." if decimal == "," else ","
+            return float(token.replace(thousands, "").replace(decimal, "."))
+        if _THOUSANDS_GROUP_RE.match(token.lstrip("-")):
+            return float(token.replace(".", "").replace(",", ""))
+        return float(token.replace(",", "."))
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def parse_budget(orcamento_texto: str) -> Budget:
+    """Extrai moeda, mínimo, máximo e se o valor é por hora."""
+    if not orcamento_texto:
+        return Budget(CURRENCY_UNKNOWN, None, None, False, "")
+
+    texto = orcamento_texto.upper().strip()
+    hourly = bool(_HOURLY_RE.search(texto))
+    if hourly:
+        texto = _HOURLY_RE.sub("", texto).strip()
+
+    if _USD_RE.search(texto):
+        moeda = "USD"
+    elif _BRL_RE.search(texto):
+        moeda = "BRL"
+    else:
+        moeda = CURRENCY_UNKNOWN
+
+    numeros = [n for n in (parse_number(t) for t in _NUMBER_RE.findall(_CURRENCY_RE.sub(" ", texto))) if n is not None]
+
+    minimo = maximo = None
+    if len(numeros) >= 2:
+        minimo, maximo = numeros[0], numeros[1]
+    elif len(numeros) == 1:
+        if _MAX_ONLY_RE.search(texto):
+            maximo = numeros[0]
+        else:
+            minimo = numeros[0]
+
+    return Budget(moeda, minimo, maximo, hourly, texto)
+
+
+def parse_budgets(textos: Iterable[str]) -> List[Budget]:
+    """Versão em lote (backfills): aproveita o cache para textos repetidos."""
+    return [parse_budget(t or "") for t in textos]
+
+
+def tratar_orcamento(orcamento_texto: str):
+    """Retorna (moeda, minimo, maximo, texto_normalizado) — interface antiga do scraper."""
+    b = parse_budget(orcamento_texto or "")
+    return b.currency, b.minimum, b.maximum, b.text
+
+
+def parse_int(value) -> Optional[int]:
+    """Primeiro inteiro do texto ("Propostas: 12" -> 12)."""
+    m = _DIGITS_RE.search(value)
+    return int(m.group(0)) if m else None
@@ -0,0 +1,79 @@
+"""
+Workly - Carga em massa via COPY FROM STDIN + merge set-based.
+
+As linhas são enviadas em blocos para uma tabela temporária de staging (com a
+mesma estrutura das colunas do destino) e depois mescladas num único
+INSERT ... SELECT ... ON CONFLICT. Só um bloco fica em memória por vez.
+"""
+
+import csv
+import io
+import time
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_COPY_CHUNK_ROWS = 10000
+STAGING_TABLE = "bulk_staging"
+
+
+def _csv_chunk(rows: List[tuple]) -> io.StringIO:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        # None vira campo vazio sem aspas, que o COPY (FORMAT csv) lê como NULL
+        writer.writerow(["" if v is None else v for v in row])
+    buf.seek(0)
+    return buf
+
+
+def copy_merge(conn, table: str, columns: List[str], rows: Iterable[tuple], conflict_key: str,
+               conflict_sql: str, chunk_rows: int = DEFAULT_COPY_CHUNK_ROWS, returning: Optional[str] = None,
+               on_merged: Optional[Callable[[object, List[tuple]], None]] = None,
+               computed: Optional[Dict[str, str]] = None) -> Tuple[int, int, float]:
+    """
+    Carrega `rows` (na ordem de `columns`) em `table` numa única transação.
+    Linhas repetidas por `conflict_key` ficam com a última ocorrência.
+    `computed` (coluna -> expressão SQL sobre as colunas do staging) preenche
+    colunas derivadas no merge.
+    Com `returning`, as linhas mescladas vão para `on_merged(cursor, linhas)`
+    antes do commit (tabelas dependentes na mesma transação).
+    Retorna (linhas copiadas, linhas mescladas, segundos).
+    """
+    cols = ", ".join(columns)
+    computed = computed or {}
+    target_cols = ", ".join([*columns, *computed])
+    select_exprs = ", ".join([*columns, *computed.values()])
+    started = time.time()
+    loaded = 0
+    cur = conn.cursor()
+    try:
+        cur.execute(f"CREATE TEMP TABLE {STAGING_TABLE} ON COMMIT DROP AS SELECT {cols} FROM {table} WITH NO DATA")
+        cur.execute(f"ALTER TABLE {STAGING_TABLE} ADD COLUMN seq BIGSERIAL")
+
+        copy_sql = f"COPY {STAGING_TABLE} ({cols}) FROM STDIN WITH (FORMAT csv)"
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, chunk_rows))
+            if not chunk:
+                break
+            cur.copy_expert(copy_sql, _csv_chunk(chunk))
+            loaded += len(chunk)
+
+        cur.execute(f"""
+            INSERT INTO {table} ({target_cols})
+            SELECT DISTINCT ON ({conflict_key}) {select_exprs}
+              FROM {STAGING_TABLE}
+             ORDER BY {conflict_key}, seq DESC
+            {conflict_sql}
+            {f"RETURNING {returning}" if returning else ""}
+        """)
+        merged = cur.rowcount
+        if returning and on_merged is not None:
+            on_merged(cur, cur.fetchall())
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cur.close()
+    return loaded, merged, time.time() - started
@@ -0,0 +1,201 @@
+"""
+Workly - CLI única do scraper.
+
+    python cli.py scrape [opções do workana_scraper]   # scraping (Selenium/async, banco, daemon)
+    python cli.py export --out vagas.csv --window 48   # scraped_jobs -> CSV (formato do --bulk-load)
+    python cli.py reparse benchmarks/fixtures/listing.html
+    python cli.py bench [micro|budget|db-load|resource-blocking] [opções]
+    python cli.py rates [--history 10] [--reconvert]
+    python cli.py langs java python --out linguagens.jsonl  # linguagens citadas nas vagas já gravadas
+
+Cada subcomando importa só o que usa: Selenium, requests e httpx entram apenas
+no `scrape` (e nos benchmarks que medem o scraper), então export, reparse e
+rates sobem rápido e sem a pilha do navegador (confira com `python -X importtime`).
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+from collections import Counter
+from typing import List
+
+from project_csv import CSV_FILENAME
+from settings import BASE_DIR, setup_logging
+
+logger = logging.getLogger("workly-scraper")
+
+BENCH_DIR = os.path.join(BASE_DIR, "benchmarks")
+# suíte -> módulo em benchmarks/
+BENCH_SUITES = {
+    "micro": "run_benchmarks",
+    "budget": "bench_budget",
+    "db-load": "bench_db_load",
+    "resource-blocking": "bench_resource_blocking",
+}
+REPARSE_KINDS = ("listing", "detail")
+DEFAULT_RATE_HISTORY = 10
+
+
+def cmd_scrape(args):
+    from workana_scraper import main as scrape_main
+    scrape_main(args.options)
+
+
+def cmd_export(args):
+    import psycopg2
+
+    from project_csv import export_jobs
+    from settings import DB_CONFIG
+
+    conn = psycopg2.connect(**DB_CONFIG)
+    try:
+        export_jobs(conn, args.out, args.window, args.include_duplicates)
+    finally:
+        conn.close()
+
+
+def cmd_reparse(args):
+    out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    try:
+        for filename in args.files:
+            with open(filename, encoding="utf-8") as f:
+                html = f.read()
+            if args.kind == "listing":
+                from listing_parser import parse_listing_html
+                records = parse_listing_html(html)
+            else:
+                from dataclasses import asdict
+
+                from detail_parser import parse_detail_html
+                records = [asdict(parse_detail_html(html))]
+            for record in records:
+                record["arquivo"] = filename
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            logger.info("[REPARSE] %s: %d registro(s).", filename, len(records))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+def cmd_bench(args):
+    import importlib
+    sys.path.insert(0, BENCH_DIR)
+    importlib.import_module(BENCH_SUITES[args.suite]).main(args.options)
+
+
+def cmd_rates(args):
+    from exchange_rates import get_usd_brl_quote
+
+    quote = get_usd_brl_quote()
+    print(f"1 USD = {quote.rate:.4f} BRL ({quote.source}, {quote.fetched_datetime:%Y-%m-%d %H:%M})")
+    if not args.history and not args.reconvert:
+        return
+
+    import psycopg2
+
+    from exchange_rates import record_rate, reconvert_usd_budgets
+    from settings import DB_CONFIG
+
+    conn = psycopg2.connect(**DB_CONFIG)
+    try:
+        if args.reconvert:
+            rate_id = record_rate(conn, quote)
+            updated = reconvert_usd_budgets(conn, rate_id)
+            logger.info("[COTAÇÃO] %d vagas em USD reconvertidas com a cotação id=%d.", updated, rate_id)
+        if args.history:
+            with conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT id, rate, source, fetched_at FROM exchange_rates
+                     WHERE base_currency = 'USD' AND quote_currency = 'BRL'
+                     ORDER BY fetched_at DESC LIMIT %s
+                    """,
+                    (args.history,),
+                )
+                for rate_id, rate, source, fetched_at in cur.fetchall():
+                    print(f"{rate_id:>6}  {rate:>8.4f}  {fetched_at:%Y-%m-%d %H:%M}  {source}")
+    finally:
+        conn.close()
+
+
+def cmd_langs(args):
+    import psycopg2
+
+    from language_matcher import LanguageMatcher, scan_db
+    from settings import DB_CONFIG
+
+    matcher = LanguageMatcher(args.languages)
+    counts = Counter()
+    scanned = matched = 0
+    out = open(args.out, "w", encoding="utf-8") if args.out else sys.stdout
+    conn = psycopg2.connect(**DB_CONFIG)
+    try:
+        for link_hash, languages in scan_db(conn, matcher):
+            scanned += 1
+            if languages:
+                matched += 1
+                counts.update(languages)
+            elif not args.all:
+                continue
+            out.write(json.dumps({"link_hash": link_hash.strip(), "linguagens": languages}, ensure_ascii=False) + "\n")
+    finally:
+        conn.close()
+        if out is not sys.stdout:
+            out.close()
+    logger.info("[LINGUAGENS] %d vagas lidas, %d citam alguma linguagem (%s).", scanned, matched,
+                ", ".join(f"{language}={counts[language]}" for language in matcher.languages))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Workly - scraper Workana e ferramentas de manutenção.")
+    sub = parser.add_subparsers(dest="command", metavar="COMANDO", required=True)
+
+    # scrape e bench repassam as opções restantes ao parser do próprio módulo
+    p = sub.add_parser("scrape", help="Roda o scraper (opções: python cli.py scrape --help).", add_help=False)
+    p.set_defaults(func=cmd_scrape, passthrough=True)
+
+    p = sub.add_parser("export", help="Exporta scraped_jobs para CSV (recarregável com scrape --bulk-load).")
+    p.add_argument("--out", default=CSV_FILENAME, help="Arquivo CSV de saída.")
+    p.add_argument("--window", type=int, default=0, help="Só vagas vistas nas últimas N horas (0 = todas).")
+    p.add_argument("--include-duplicates", action="store_true", help="Inclui as quase duplicatas (duplicate_of preenchido).")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("reparse", help="Extrai cards ou detalhes de HTMLs salvos (JSON Lines), sem rede nem navegador.")
+    p.add_argument("files", nargs="+", metavar="HTML")
+    p.add_argument("--kind", choices=REPARSE_KINDS, default="listing", help="listing (cards da listagem) ou detail (página de detalhe).")
+    p.add_argument("--out", help="Arquivo JSON Lines de saída (padrão: stdout).")
+    p.set_defaults(func=cmd_reparse)
+
+    p = sub.add_parser("bench", help="Roda uma suíte de benchmarks/ (opções: python cli.py bench SUITE --help).", add_help=False)
+    p.add_argument("suite", nargs="?", choices=sorted(BENCH_SUITES), default="micro")
+    p.set_defaults(func=cmd_bench, passthrough=True)
+
+    p = sub.add_parser("rates", help="Mostra a cotação USD -> BRL atual; registra e reconverte as vagas em USD com --reconvert.")
+    p.add_argument("--history", type=int, nargs="?", const=DEFAULT_RATE_HISTORY, default=0, help="Lista as últimas N cotações registradas no banco.")
+    p.add_argument("--reconvert", action="store_true", help="Registra a cotação atual e reconverte os orçamentos em USD já gravados.")
+    p.set_defaults(func=cmd_rates)
+
+    p = sub.add_parser("langs", help="Backfill: linguagens citadas em cada vaga do scraped_jobs (JSON Lines).")
+    p.add_argument("languages", nargs="+", metavar="LINGUAGEM", help="Linguagens procuradas (ex: java python c#).")
+    p.add_argument("--out", help="Arquivo JSON Lines de saída (padrão: stdout).")
+    p.add_argument("--all", action="store_true", help="Inclui as vagas que não citam nenhuma das linguagens.")
+    p.set_defaults(func=cmd_langs)
+    return parser
+
+
+def main(argv: List[str] = None):
+    parser = build_parser()
+    args, options = parser.parse_known_args(argv)
+    if not getattr(args, "passthrough", False) and options:
+        parser.error("argumentos não reconhecidos: " + " ".join(options))
+    args.options = options
+    if args.command != "scrape":
+        # o scrape configura o próprio log (com arquivo); os demais só escrevem no stderr
+        setup_logging()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
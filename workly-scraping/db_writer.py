@@ -0,0 +1,158 @@
+"""
+Workly - Escritor em lote, em segundo plano, para o scraped_jobs.
+
+O scraping produz registros um a um; esta thread os acumula e grava a cada
+`batch_size` registros ou `flush_interval` segundos, usando uma única conexão
+(obtida com `connect` e devolvida com `release` ao final). A fila é limitada,
+então um banco lento segura o scraper em vez de acumular memória.
+AsyncBatchedDBWriter faz o mesmo como tarefa asyncio, gravando numa thread.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from typing import Callable, List, Optional
+
+logger = logging.getLogger("workly-scraper")
+
+DEFAULT_BATCH_SIZE = 25
+DEFAULT_FLUSH_INTERVAL = 5.0  # segundos
+
+_STOP = object()
+
+
+class _BatchSink:
+    """Grava lotes numa conexão reaproveitada, com fallback quando o banco falha."""
+
+    def __init__(self, connect: Callable[[], object], save: Callable[[object, List[dict]], None],
+                 batch_size: int = DEFAULT_BATCH_SIZE, flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 fallback: Optional[Callable[[List[dict]], None]] = None,
+                 release: Optional[Callable[[object], None]] = None):
+        self.connect = connect
+        self.save = save
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.fallback = fallback
+        # devolve a conexão (ex.: ao pool do modo daemon); por padrão fecha
+        self.release = release or (lambda conn: conn.close())
+        self.conn = None
+        self.written = 0
+        self.batches = 0
+
+    def _flush(self, batch: List[dict]):
+        if not batch:
+            return
+        try:
+            if self.conn is None or self.conn.closed:
+                self.conn = self.connect()
+            self.save(self.conn, batch)
+            self.written += len(batch)
+            self.batches += 1
+        except Exception as e:
+            logger.exception("Erro ao conectar/salvar lote no DB: %s", e)
+            self._release()
+            if self.fallback:
+                try:
+                    self.fallback(batch)
+                except Exception as ex:
+                    logger.exception("Falha no fallback do lote: %s", ex)
+
+    def _release(self):
+        if self.conn is not None:
+            try:
+                self.release(self.conn)
+            except Exception:
+                pass
+        self.conn = None
+
+    def _finish(self):
+        self._release()
+        logger.info("[DB] Escritor finalizado: %d registros em %d lotes.", self.written, self.batches)
+
+
+class BatchedDBWriter(_BatchSink, threading.Thread):
+    def __init__(self, *args, **kwargs):
+        _BatchSink.__init__(self, *args, **kwargs)
+        threading.Thread.__init__(self, name="db-writer", daemon=True)
+        self.queue = queue.Queue(maxsize=self.batch_size * 4)
+
+    def put(self, projeto: dict):
+        self.queue.put(projeto)
+
+    def close(self):
+        """Grava o que restou no buffer e aguarda a thread terminar."""
+        self.queue.put(_STOP)
+        self.join()
+
+    def run(self):
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        try:
+            while True:
+                try:
+                    item = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    item = None
+
+                if item is _STOP:
+                    break
+                if item is not None:
+                    batch.append(item)
+
+                if len(batch) >= self.batch_size or time.monotonic() >= deadline:
+                    self._flush(batch)
+                    batch = []
+                    deadline = time.monotonic() + self.flush_interval
+            self._flush(batch)
+        finally:
+            self._finish()
+
+
+class AsyncBatchedDBWriter(_BatchSink):
+    """
+    Versão asyncio: `await put()` com fila limitada (contrapressão no loop) e
+    gravação via asyncio.to_thread, para o psycopg2 não bloquear o loop.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        self.queue = asyncio.Queue(maxsize=self.batch_size * 4)
+        self._task = asyncio.create_task(self._run(), name="db-writer")
+
+    async def put(self, projeto: dict):
+        await self.queue.put(projeto)
+
+    async def close(self):
+        """Grava o que restou no buffer e aguarda a tarefa terminar."""
+        await self.queue.put(_STOP)
+        await self._task
+
+    async def _run(self):
+        batch = []
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout=max(0.0, deadline - loop.time()))
+                except asyncio.TimeoutError:
+                    item = None
+
+                if item is _STOP:
+                    break
+                if item is not None:
+                    batch.append(item)
+
+                if len(batch) >= self.batch_size or loop.time() >= deadline:
+                    await asyncio.to_thread(self._flush, batch)
+                    batch = []
+                    deadline = loop.time() + self.flush_interval
+            await asyncio.to_thread(self._flush, batch)
+        finally:
+            await asyncio.to_thread(self._finish)
@@ -0,0 +1,322 @@
+"""
+Workly - Camada de busca das páginas de detalhe da Workana.
+
+O backend padrão faz um GET simples (requests.Session com pool de conexões) e
+extrai descrição, habilidades e orçamento com BeautifulSoup. O Selenium só é
+usado quando o HTML estático não traz algum dos campos pedidos.
+"""
+
+import logging
+import threading
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List
+
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+from detail_parser import (
+    ALL_FIELDS, CURRENCY_MARKERS, DETAIL_BUDGET_SELECTORS, DETAIL_DESC_FALLBACK_SELECTOR, DETAIL_DESC_SELECTORS,
+    DETAIL_SKILL_SELECTORS, FIELD_BUDGET, FIELD_DESCRIPTION, FIELD_SKILLS, MAX_CURRENCY_TEXT_LEN,
+    DetailPage, absolute_link, parse_detail_html,
+)
+from resource_blocking import apply_to_current_tab
+from run_metrics import metrics
+
+logger = logging.getLogger("workly-scraper")
+
+# -----------------------
+# Config
+# -----------------------
+DEFAULT_HTTP_TIMEOUT = 10
+DEFAULT_HTTP_POOL_SIZE = 10
+DEFAULT_SELENIUM_WAIT = 8
+DEFAULT_CACHE_ENTRIES = 256  # páginas de detalhe mantidas pelo CachingDetailFetcher
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept-Language": "pt-BR,pt;q=0.9,en;q=0.8",
+}
+
+DETAIL_WAIT_SELECTORS = {
+    FIELD_DESCRIPTION: "div.html-desc, section.project-description, div.project-details",
+    FIELD_SKILLS: "div.skills, section.project-skills",
+    FIELD_BUDGET: "h4.budget, div.project-actions h4.budget",
+}
+
+
+# -----------------------
+# Fetchers
+# -----------------------
+class HttpDetailFetcher:
+    """Baixa a página de detalhe sem navegador, reaproveitando conexões."""
+
+    name = "http"
+
+    def __init__(self, pool_size: int = DEFAULT_HTTP_POOL_SIZE, timeout: float = DEFAULT_HTTP_TIMEOUT):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(HTTP_HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=1)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def fetch(self, link: str, fields: Iterable[str] = ALL_FIELDS) -> DetailPage:
+        r = self.session.get(absolute_link(link), timeout=self.timeout)
+        r.raise_for_status()
+        page = parse_detail_html(r.text)
+        page.backend = self.name
+        return page
+
+    def close(self):
+        self.session.close()
+
+
+class SeleniumDetailFetcher:
+    """
+    Abre a página de detalhe no driver, renderizando o JavaScript.
+    Com `new_tab=True` usa uma aba temporária para preservar a listagem aberta.
+    """
+
+    name = "selenium"
+
+    def __init__(self, driver, wait_seconds: float = DEFAULT_SELENIUM_WAIT, new_tab: bool = True):
+        self.driver = driver
+        self.wait_seconds = wait_seconds
+        self.new_tab = new_tab
+
+    def fetch(self, link: str, fields: Iterable[str] = ALL_FIELDS) -> DetailPage:
+        driver = self.driver
+        fields = list(fields)
+        wait_css = ", ".join(DETAIL_WAIT_SELECTORS[f] for f in fields if f in DETAIL_WAIT_SELECTORS)
+        if self.new_tab:
+            driver.execute_script("window.open('');")
+            driver.switch_to.window(driver.window_handles[-1])
+            apply_to_current_tab(driver)
+        try:
+            driver.get(absolute_link(link))
+            if wait_css:
+                try:
+                    WebDriverWait(driver, self.wait_seconds).until(
+                        lambda d: d.find_elements(By.CSS_SELECTOR, wait_css)
+                    )
+                except TimeoutException:
+                    metrics.inc("timeouts")
+            page = self._extract(fields)
+            page.backend = self.name
+            return page
+        finally:
+            if self.new_tab:
+                driver.close()
+                driver.switch_to.window(driver.window_handles[0])
+
+    def _first_texts(self, selectors: List[str]) -> List[str]:
+        for sel in selectors:
+            try:
+                elems = self.driver.find_elements(By.CSS_SELECTOR, sel)
+                if elems:
+                    return [t for t in (e.text.strip() for e in elems) if t]
+            except Exception:
+                continue
+        return []
+
+    def _extract(self, fields: List[str]) -> DetailPage:
+        driver = self.driver
+        page = DetailPage()
+        if FIELD_DESCRIPTION in fields:
+            page.descricao = " ".join(self._first_texts(DETAIL_DESC_SELECTORS))
+            if not page.descricao:
+                try:
+                    page.descricao = driver.find_element(By.CSS_SELECTOR, DETAIL_DESC_FALLBACK_SELECTOR).text.strip()
+                except Exception:
+                    pass
+        if FIELD_SKILLS in fields:
+            page.habilidades = self._first_texts(DETAIL_SKILL_SELECTORS)
+        if FIELD_BUDGET in fields:
+            for sel in DETAIL_BUDGET_SELECTORS:
+                texts = self._first_texts([sel])
+                if texts:
+                    page.orcamento = texts[0]
+                    break
+            if not page.orcamento:
+                possibles = driver.find_elements(By.XPATH, "//*[contains(text(),'R$') or contains(text(),'US$') or contains(text(),'USD')]")
+                for p in possibles:
+                    t = p.text.strip()
+                    if t and len(t) < MAX_CURRENCY_TEXT_LEN and any(m in t for m in CURRENCY_MARKERS):
+                        page.orcamento = t
+                        break
+        return page
+
+    def close(self):
+        # o driver pertence ao chamador
+        pass
+
+
+class FallbackDetailFetcher:
+    """
+    Tenta o fetcher primário e só recorre ao secundário quando faltam campos.
+    Conta quantas páginas cada backend efetivamente serviu na execução.
+    Pode ser compartilhado entre threads se os fetchers internos também puderem.
+    """
+
+    def __init__(self, primary, fallback=None):
+        self.primary = primary
+        self.fallback = fallback
+        self.stats = Counter()
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    def fetch(self, link: str, fields: Iterable[str] = ALL_FIELDS) -> DetailPage:
+        fields = list(fields)
+        page = DetailPage()
+        try:
+            page = self.primary.fetch(link, fields)
+        except Exception as e:
+            logger.debug("Fetcher %s falhou para %s: %s", self.primary.name, link, e)
+            self._count(f"{self.primary.name}_error")
+            if isinstance(e, (requests.Timeout, TimeoutException)):
+                metrics.inc("timeouts")
+
+        missing = page.missing(fields)
+        if not missing:
+            self._count(self.primary.name)
+            return page
+
+        if self.fallback is None:
+            self._count(f"{self.primary.name}_incomplete")
+            return page
+
+        try:
+            extra = self.fallback.fetch(link, missing)
+        except Exception as e:
+            logger.debug("Fetcher %s falhou para %s: %s", self.fallback.name, link, e)
+            self._count(f"{self.fallback.name}_error")
+            if isinstance(e, (requests.Timeout, TimeoutException)):
+                metrics.inc("timeouts")
+            return page
+        self._count(self.fallback.name)
+        return page.merge(extra)
+
+    def log_stats(self):
+        total = self.stats.get(self.primary.name, 0)
+        if self.fallback is not None:
+            total += self.stats.get(self.fallback.name, 0)
+        detalhes = ", ".join(f"{k}={v}" for k, v in sorted(self.stats.items())) or "nenhuma"
+        logger.info("[DETALHE] Páginas de detalhe servidas: %d (%s)", total, detalhes)
+
+    def close(self):
+        self.primary.close()
+        if self.fallback is not None:
+            self.fallback.close()
+
+
+class ListingOnlyFetcher:
+    """Não navega: o projeto fica só com o que o card da listagem trouxe."""
+
+    name = "listing"
+
+    def fetch(self, link: str, fields: Iterable[str] = ALL_FIELDS) -> DetailPage:
+        return DetailPage(backend=self.name)
+
+    def close(self):
+        pass
+
+
+DETAIL_BACKENDS = ("http", "selenium")
+
+
+def build_detail_fetcher(driver, backend: str = "http", selenium_fetcher=None,
+                         http_pool_size: int = DEFAULT_HTTP_POOL_SIZE) -> FallbackDetailFetcher:
+    """
+    Monta o fetcher de detalhe: 'http' (com fallback Selenium) ou 'selenium' puro.
+    `selenium_fetcher` substitui o fetcher de aba única (ex.: um pool de drivers).
+    """
+    if selenium_fetcher is None:
+        selenium_fetcher = SeleniumDetailFetcher(driver)
+    if backend == "selenium":
+        return FallbackDetailFetcher(selenium_fetcher)
+    if backend != "http":
+        raise ValueError(f"Backend de detalhe desconhecido: {backend}")
+    return FallbackDetailFetcher(HttpDetailFetcher(pool_size=http_pool_size), selenium_fetcher)
+
+
+class CachingDetailFetcher:
+    """
+    Memoiza as páginas de detalhe da execução, chaveadas por `key_func(link)`.
+    Cada URL é navegada uma única vez enquanto estiver no cache; pedidos
+    posteriores (mesmo de outros campos já tentados) são servidos do cache
+    (`hits`). A primeira leitura depois de uma navegação é a que o pré-carregamento
+    de `enrich_card` preparou e não conta como navegação evitada; as seguintes
+    contam (`saved`). O cache é um LRU de `max_entries`
+    páginas e os locks por URL só existem enquanto há alguém usando a URL, então
+    a memória não cresce com o tamanho da listagem.
+    """
+
+    def __init__(self, inner, key_func: Callable[[str], str], max_entries: int = DEFAULT_CACHE_ENTRIES):
+        self.inner = inner
+        self.key_func = key_func
+        self.max_entries = max(1, max_entries)
+        # key -> [página, campos já tentados, lida desde a última navegação]
+        self._cache: "OrderedDict[str, List]" = OrderedDict()
+        self._key_locks: Dict[str, List] = {}  # key -> [lock, usuários]
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.saved = 0
+        self.pages = 0
+
+    @contextmanager
+    def _key_lock(self, key: str):
+        with self._lock:
+            entry = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if not entry[1]:
+                    del self._key_locks[key]
+
+    def fetch(self, link: str, fields: Iterable[str] = ALL_FIELDS) -> DetailPage:
+        fields = set(fields)
+        key = self.key_func(absolute_link(link))
+        # serializa por URL: threads pedindo o mesmo link esperam a primeira navegação
+        with self._key_lock(key):
+            with self._lock:
+                cached = self._cache.get(key)
+                if cached:
+                    self._cache.move_to_end(key)
+                if cached and fields <= cached[1]:
+                    self.hits += 1
+                    if cached[2]:
+                        self.saved += 1
+                    cached[2] = True
+                    return cached[0]
+            page, attempted = cached[:2] if cached else (DetailPage(), set())
+            missing = fields - attempted
+            page = page.merge(self.inner.fetch(link, [f for f in ALL_FIELDS if f in missing]))
+            with self._lock:
+                if key not in self._cache:
+                    self.pages += 1
+                self._cache[key] = [page, attempted | missing, False]
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+            return page
+
+    def log_stats(self):
+        self.inner.log_stats()
+        logger.info("[DETALHE] Cache: %d páginas, %d leituras do cache, %d navegações evitadas.",
+                    self.pages, self.hits, self.saved)
+
+    def close(self):
+        self.inner.close()
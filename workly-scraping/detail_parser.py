@@ -0,0 +1,121 @@
+"""
+Workly - Extração da página de detalhe da Workana a partir do HTML.
+
+Só BeautifulSoup: o parsing é usado pelos fetchers (detail_fetcher), pelo
+motor async, pelo `reparse` da CLI e pelos benchmarks, sem carregar requests
+nem Selenium.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Iterable, List
+
+from bs4 import BeautifulSoup
+
+from listing_parser import HTML_PARSER
+
+WORKANA_BASE_URL = "https://www.workana.com"
+
+# Campos que um fetcher pode devolver
+FIELD_DESCRIPTION = "descricao"
+FIELD_SKILLS = "habilidades"
+FIELD_BUDGET = "orcamento"
+ALL_FIELDS = (FIELD_DESCRIPTION, FIELD_SKILLS, FIELD_BUDGET)
+
+# Seletores da página de detalhe (mesma ordem de prioridade do fluxo Selenium)
+DETAIL_DESC_SELECTORS = [
+    "div#project-detail div.html-desc p",
+    "section.project-description p",
+    "div.project-details p",
+    ".project-description p",
+    ".project-description",
+]
+DETAIL_DESC_FALLBACK_SELECTOR = "div.html-desc.project-details"
+DETAIL_SKILL_SELECTORS = [
+    "div#project-detail div.skills a",
+    "section.project-skills a",
+    "div.skills a",
+    ".skills a",
+]
+DETAIL_BUDGET_SELECTORS = [
+    "h4.budget span.values span",
+    "h4.budget .values span",
+    "h4.budget",
+    "div.project-actions h4.budget",
+    "div.project-header h4.budget",
+]
+CURRENCY_MARKERS = ("R$", "US$", "USD")
+CURRENCY_TEXT_RE = re.compile(r"R\$|US\$|USD")
+MAX_CURRENCY_TEXT_LEN = 120
+
+
+@dataclass
+class DetailPage:
+    """Dados extraídos de uma página de detalhe."""
+    descricao: str = ""
+    habilidades: List[str] = field(default_factory=list)
+    orcamento: str = ""
+    backend: str = ""
+
+    def missing(self, fields: Iterable[str]) -> List[str]:
+        return [f for f in fields if not getattr(self, f)]
+
+    def merge(self, other: "DetailPage") -> "DetailPage":
+        """Completa os campos vazios com os de `other`."""
+        return DetailPage(
+            descricao=self.descricao or other.descricao,
+            habilidades=self.habilidades or other.habilidades,
+            orcamento=self.orcamento or other.orcamento,
+            backend="+".join(b for b in (self.backend, other.backend) if b),
+        )
+
+
+def absolute_link(link: str) -> str:
+    if link and link.startswith("/"):
+        return WORKANA_BASE_URL + link
+    return link
+
+
+# -----------------------
+# Static HTML parsing
+# -----------------------
+def _clean(text: str) -> str:
+    return " ".join(text.split())
+
+
+def parse_detail_html(html: str) -> DetailPage:
+    """Extrai descrição, habilidades e orçamento de um HTML de detalhe já baixado."""
+    soup = BeautifulSoup(html or "", HTML_PARSER)
+    page = DetailPage()
+
+    for sel in DETAIL_DESC_SELECTORS:
+        elems = soup.select(sel)
+        if elems:
+            page.descricao = " ".join(t for t in (_clean(e.get_text(" ")) for e in elems) if t)
+            break
+    if not page.descricao:
+        main = soup.select_one(DETAIL_DESC_FALLBACK_SELECTOR)
+        if main:
+            page.descricao = _clean(main.get_text(" "))
+
+    for sel in DETAIL_SKILL_SELECTORS:
+        elems = soup.select(sel)
+        if elems:
+            page.habilidades = [t for t in (_clean(e.get_text(" ")) for e in elems) if t]
+            break
+
+    for sel in DETAIL_BUDGET_SELECTORS:
+        elem = soup.select_one(sel)
+        if elem:
+            text = _clean(elem.get_text(" "))
+            if text:
+                page.orcamento = text
+                break
+    if not page.orcamento:
+        for node in soup.find_all(string=CURRENCY_TEXT_RE):
+            t = _clean(node.parent.get_text(" ")) if node.parent else _clean(str(node))
+            if t and len(t) < MAX_CURRENCY_TEXT_LEN and any(m in t for m in CURRENCY_MARKERS):
+                page.orcamento = t
+                break
+
+    return page
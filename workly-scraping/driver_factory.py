@@ -0,0 +1,163 @@
+"""
+Workly - Fábrica única de WebDrivers do Chromium.
+
+Resolve os binários do navegador e do chromedriver uma vez (variáveis de
+ambiente, PATH, cache em disco e, só em último caso, o webdriver_manager, que
+usa a rede) e guarda o resultado, de modo que execuções seguintes e ciclos do
+daemon sobem o driver sem nenhuma consulta externa. Também pode se conectar a
+um Chromium já aberto com --remote-debugging-port (CHROME_DEBUGGER_ADDRESS).
+"""
+
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+
+from resource_blocking import DEFAULT_BLOCK_PROFILE, apply_blocking, configure_options
+from run_metrics import metrics
+
+logger = logging.getLogger("workly-scraper")
+
+# Binários fixos (opcional); no container vêm do apt (ver Dockerfile)
+CHROME_BINARY = os.getenv("CHROME_BINARY")
+CHROMEDRIVER_PATH = os.getenv("CHROMEDRIVER_PATH")
+# host:porta de um Chromium iniciado com --remote-debugging-port
+CHROME_DEBUGGER_ADDRESS = os.getenv("CHROME_DEBUGGER_ADDRESS")
+DRIVER_CACHE_FILE = os.getenv(
+    "DRIVER_CACHE_FILE", os.path.join(os.path.expanduser("~"), ".cache", "workly", "drivers.json")
+)
+
+CHROME_CANDIDATES = ("chromium", "chromium-browser", "google-chrome", "google-chrome-stable", "chrome")
+CHROMEDRIVER_CANDIDATES = ("chromedriver",)
+
+# flags que encurtam a subida do navegador (sem tarefas de primeiro uso/rede em segundo plano)
+FAST_START_ARGS = (
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-sync",
+    "--metrics-recording-only",
+)
+
+
+@dataclass
+class DriverBinaries:
+    chrome: Optional[str]
+    chromedriver: str
+
+
+_resolved: Optional[DriverBinaries] = None
+_resolve_lock = threading.Lock()
+
+
+def _executable(path: Optional[str]) -> bool:
+    return bool(path) and os.path.isfile(path) and os.access(path, os.X_OK)
+
+
+def _which(candidates) -> Optional[str]:
+    for name in candidates:
+        path = shutil.which(name)
+        if path:
+            return path
+    return None
+
+
+def _read_cache() -> Optional[DriverBinaries]:
+    try:
+        with open(DRIVER_CACHE_FILE, "r", encoding="utf-8") as f:
+            cached = DriverBinaries(**json.load(f))
+    except Exception:
+        return None
+    if _executable(cached.chromedriver) and (cached.chrome is None or _executable(cached.chrome)):
+        return cached
+    return None
+
+
+def _write_cache(binaries: DriverBinaries):
+    try:
+        os.makedirs(os.path.dirname(DRIVER_CACHE_FILE), exist_ok=True)
+        tmp = f"{DRIVER_CACHE_FILE}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(asdict(binaries), f)
+        os.replace(tmp, DRIVER_CACHE_FILE)
+    except Exception as e:
+        logger.debug("[DRIVER] Não foi possível gravar o cache de binários: %s", e)
+
+
+def resolve_binaries() -> DriverBinaries:
+    """Descobre (uma vez por processo) onde estão o Chromium e o chromedriver."""
+    global _resolved
+    with _resolve_lock:
+        if _resolved is not None:
+            return _resolved
+
+        started = time.perf_counter()
+        source = "env/PATH"
+        chrome = CHROME_BINARY if _executable(CHROME_BINARY) else None
+        chromedriver = CHROMEDRIVER_PATH if _executable(CHROMEDRIVER_PATH) else None
+        if chromedriver is None:
+            cached = _read_cache()
+            if cached is not None:
+                source = "cache"
+                chromedriver = cached.chromedriver
+                chrome = chrome or cached.chrome
+        chrome = chrome or _which(CHROME_CANDIDATES)
+        chromedriver = chromedriver or _which(CHROMEDRIVER_CANDIDATES)
+        if chromedriver is None:
+            # último recurso: download/consulta de versão pela rede
+            from webdriver_manager.chrome import ChromeDriverManager
+            source = "webdriver_manager"
+            chromedriver = ChromeDriverManager().install()
+
+        _resolved = DriverBinaries(chrome=chrome, chromedriver=chromedriver)
+        if source != "cache":
+            _write_cache(_resolved)
+        logger.info("[DRIVER] Binários resolvidos via %s em %.2fs (chromedriver=%s, chromium=%s).",
+                    source, time.perf_counter() - started, chromedriver, chrome or "padrão do driver")
+        return _resolved
+
+
+def build_options(headless: bool = True, block_profile: str = DEFAULT_BLOCK_PROFILE,
+                  debugger_address: Optional[str] = None) -> webdriver.ChromeOptions:
+    options = webdriver.ChromeOptions()
+    if debugger_address:
+        # navegador já em execução: só dá para anexar, não para mudar flags
+        options.add_experimental_option("debuggerAddress", debugger_address)
+        return options
+    if headless:
+        options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--log-level=3")
+    for arg in FAST_START_ARGS:
+        options.add_argument(arg)
+    configure_options(options, block_profile)
+    chrome = resolve_binaries().chrome
+    if chrome:
+        options.binary_location = chrome
+    return options
+
+
+def create_driver(headless: bool = True, block_profile: str = DEFAULT_BLOCK_PROFILE,
+                  debugger_address: Optional[str] = CHROME_DEBUGGER_ADDRESS):
+    """Sobe (ou anexa) um Chrome WebDriver e registra a latência de inicialização."""
+    started = time.perf_counter()
+    with metrics.stage("driver_startup", histogram="driver_startup_seconds"):
+        options = build_options(headless, block_profile, debugger_address)
+        service = Service(resolve_binaries().chromedriver)
+        driver = webdriver.Chrome(service=service, options=options)
+        apply_blocking(driver, block_profile)
+    logger.info("[DRIVER] %s em %.2fs.",
+                f"Anexado ao Chromium em {debugger_address}" if debugger_address else "Chromium iniciado",
+                time.perf_counter() - started)
+    return driver
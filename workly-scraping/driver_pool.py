@@ -0,0 +1,135 @@
+"""
+Workly - Pool limitado de WebDrivers para o enriquecimento paralelo das vagas.
+
+Os drivers são criados sob demanda (até `size`) e devolvidos ao pool após cada
+uso, de modo que N threads compartilham no máximo N navegadores. No modo daemon
+o mesmo pool atravessa vários ciclos, mantendo os navegadores aquecidos.
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, Iterable
+
+from detail_fetcher import SeleniumDetailFetcher
+
+logger = logging.getLogger("workly-scraper")
+
+
+class DriverPool:
+    """
+    Até `size` drivers vivos, contados por um contador (não por posição). Um
+    driver que sai do `acquire` com exceção é encerrado e descartado, e os que
+    estavam emprestados durante um `close()` são encerrados ao voltar.
+    """
+
+    def __init__(self, factory: Callable[[], object], size: int, initial: Iterable = ()):
+        if size < 1:
+            raise ValueError("O pool precisa de pelo menos 1 driver.")
+        self.factory = factory
+        self.size = size
+        self._idle = []  # LIFO: o driver usado por último é o mais aquecido
+        self._count = 0  # drivers vivos ou em criação
+        self._generation = 0  # incrementada a cada close()
+        self._born = {}  # id(driver) -> geração em que foi criado
+        self._cond = threading.Condition()
+        for driver in initial:
+            self._idle.append(driver)
+            self._born[id(driver)] = self._generation
+            self._count += 1
+
+    def _checkout(self):
+        """(driver ocioso, False) ou (None, True) se há vaga para criar um novo."""
+        with self._cond:
+            while True:
+                if self._idle:
+                    return self._idle.pop(), False
+                if self._count < self.size:
+                    # reserva a vaga antes de criar, para não estourar o limite
+                    self._count += 1
+                    return None, True
+                self._cond.wait()
+
+    def _create(self):
+        try:
+            driver = self.factory()
+        except Exception:
+            with self._cond:
+                self._count -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._born[id(driver)] = self._generation
+            count = self._count
+        logger.info("[POOL] Driver %d/%d iniciado.", count, self.size)
+        return driver
+
+    def _release(self, driver, broken: bool):
+        with self._cond:
+            keep = not broken and self._born.get(id(driver)) == self._generation
+            if keep:
+                self._idle.append(driver)
+            else:
+                self._born.pop(id(driver), None)
+                self._count -= 1
+            self._cond.notify()
+        if not keep:
+            if broken:
+                logger.warning("[POOL] Driver descartado após erro; um novo será criado sob demanda.")
+            _quit(driver)
+
+    @contextmanager
+    def acquire(self):
+        """Empresta um driver ocioso (ou cria um novo, se houver vaga)."""
+        driver, create = self._checkout()
+        if create:
+            driver = self._create()
+        broken = False
+        try:
+            yield driver
+        except Exception:
+            # sessão possivelmente morta: não volta para o pool
+            broken = True
+            raise
+        finally:
+            self._release(driver, broken)
+
+    def close(self):
+        """
+        Encerra os drivers ociosos; os emprestados são encerrados ao voltar.
+        O pool continua utilizável e recria drivers sob demanda.
+        """
+        with self._cond:
+            drivers, self._idle = self._idle, []
+            for driver in drivers:
+                self._born.pop(id(driver), None)
+            self._count -= len(drivers)
+            self._generation += 1
+            self._cond.notify_all()
+        for driver in drivers:
+            _quit(driver)
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class PooledSeleniumDetailFetcher:
+    """Fetcher Selenium que pega um driver do pool a cada página de detalhe."""
+
+    name = "selenium"
+
+    def __init__(self, pool: DriverPool, wait_seconds: float):
+        self.pool = pool
+        self.wait_seconds = wait_seconds
+
+    def fetch(self, link, fields):
+        with self.pool.acquire() as driver:
+            return SeleniumDetailFetcher(driver, self.wait_seconds, new_tab=False).fetch(link, fields)
+
+    def close(self):
+        # o pool pertence ao chamador (pode sobreviver a várias execuções)
+        pass
@@ -0,0 +1,217 @@
+"""
+Workly - Cotação USD -> BRL.
+
+As fontes são consultadas de forma escalonada (hedged): a primeira sai na hora,
+a seguinte só se a anterior não responder em `hedge_delay`, e vence a primeira
+resposta válida. A consulta pode rodar em segundo plano (RateLookup) enquanto
+os navegadores sobem. O cache local é gravado de forma atômica e a cotação
+usada em cada execução fica registrada na tabela exchange_rates, referenciada
+pelas vagas convertidas, para reconversões em SQL sem novo scraping.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Callable, List, Optional, Tuple
+
+logger = logging.getLogger("workly-scraper")
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RATE_CACHE_FILE = os.getenv("RATE_CACHE_FILE", os.path.join(BASE_DIR, "usd_brl_cache.json"))
+CACHE_TTL_SECONDS = 3600  # 1 hora
+DEFAULT_USD_TO_BRL = 5.60
+DEFAULT_TIMEOUT = 6
+DEFAULT_HEDGE_DELAY = 0.5  # segundos até disparar a próxima fonte
+
+SOURCE_CACHE = "cache"
+SOURCE_FALLBACK = "fallback"
+
+PROVIDERS: List[Tuple[str, str, Callable[[dict], float]]] = [
+    ("awesomeapi", "https://economia.awesomeapi.com.br/json/last/USD-BRL", lambda d: float(d["USDBRL"]["bid"])),
+    ("frankfurter", "https://api.frankfurter.app/latest?from=USD&to=BRL", lambda d: float(d["rates"]["BRL"])),
+]
+
+
+@dataclass
+class RateQuote:
+    rate: float
+    source: str
+    fetched_at: float  # epoch
+
+    @property
+    def fetched_datetime(self) -> datetime:
+        return datetime.utcfromtimestamp(self.fetched_at)
+
+
+# -----------------------
+# Cache
+# -----------------------
+def read_cached_quote(ttl: float = CACHE_TTL_SECONDS) -> Optional[RateQuote]:
+    try:
+        with open(RATE_CACHE_FILE, "r", encoding="utf-8") as f:
+            quote = RateQuote(**json.load(f))
+    except Exception:
+        return None
+    if time.time() - quote.fetched_at < ttl and quote.rate > 0:
+        return quote
+    return None
+
+
+def write_cached_quote(quote: RateQuote):
+    """Grava num temporário e troca com os.replace: leitores nunca veem o arquivo pela metade."""
+    tmp = f"{RATE_CACHE_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(asdict(quote), f)
+        os.replace(tmp, RATE_CACHE_FILE)
+    except Exception as e:
+        logger.debug("[COTAÇÃO] Falha ao gravar cache: %s", e)
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+# -----------------------
+# Consulta
+# -----------------------
+def _query_provider(name: str, url: str, extract: Callable[[dict], float], timeout: float) -> RateQuote:
+    # importado só quando o cache não basta: `cli.py rates` com cache válido não carrega o requests
+    import requests
+    r = requests.get(url, timeout=timeout)
+    r.raise_for_status()
+    rate = extract(r.json())
+    if not rate or rate <= 0:
+        raise ValueError(f"cotação inválida de {name}: {rate}")
+    return RateQuote(rate=rate, source=name, fetched_at=time.time())
+
+
+def fetch_rate_hedged(timeout: float = DEFAULT_TIMEOUT, hedge_delay: float = DEFAULT_HEDGE_DELAY,
+                      providers=None) -> Optional[RateQuote]:
+    """Primeira cotação válida entre as fontes, disparadas de forma escalonada; None se todas falharem."""
+    providers = list(providers or PROVIDERS)
+    deadline = time.monotonic() + timeout
+    executor = ThreadPoolExecutor(max_workers=len(providers), thread_name_prefix="rate")
+    pending = set()
+    try:
+        for i, (name, url, extract) in enumerate(providers):
+            pending.add(executor.submit(_query_provider, name, url, extract, timeout))
+            last = i == len(providers) - 1
+            # espera o atraso do hedge (ou, na última fonte, o prazo total) por uma resposta válida
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                done, pending = wait(pending, timeout=remaining if last else min(hedge_delay, remaining),
+                                     return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+                for future in done:
+                    try:
+                        return future.result()
+                    except Exception as e:
+                        logger.debug("[COTAÇÃO] Fonte falhou: %s", e)
+                if not last:
+                    # a fonte em voo falhou: dispara a próxima sem esperar o atraso
+                    break
+        return None
+    finally:
+        # respostas atrasadas são descartadas; não segura a execução esperando por elas
+        executor.shutdown(wait=False)
+
+
+def get_usd_brl_quote(timeout: float = DEFAULT_TIMEOUT, hedge_delay: float = DEFAULT_HEDGE_DELAY) -> RateQuote:
+    cached = read_cached_quote()
+    if cached:
+        logger.info("[COTAÇÃO] Usando cotação em cache (%s): 1 USD = %s BRL", cached.source, cached.rate)
+        return RateQuote(cached.rate, SOURCE_CACHE, cached.fetched_at)
+
+    started = time.monotonic()
+    quote = fetch_rate_hedged(timeout, hedge_delay)
+    if quote is not None:
+        logger.info("[COTAÇÃO] %s: 1 USD = %s BRL (%.2fs)", quote.source, quote.rate, time.monotonic() - started)
+        write_cached_quote(quote)
+        return quote
+
+    logger.warning("[COTAÇÃO] APIs de câmbio falharam; usando fallback fixo: 1 USD = %s BRL", DEFAULT_USD_TO_BRL)
+    # o fallback não vai para o cache: a próxima execução tenta as APIs de novo
+    return RateQuote(DEFAULT_USD_TO_BRL, SOURCE_FALLBACK, time.time())
+
+
+def get_usd_brl_rate(timeout: float = DEFAULT_TIMEOUT) -> float:
+    """Interface antiga (bloqueante): só o valor da cotação."""
+    return get_usd_brl_quote(timeout).rate
+
+
+class RateLookup:
+    """Consulta a cotação numa thread em segundo plano; `result()` espera por ela."""
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, hedge_delay: float = DEFAULT_HEDGE_DELAY):
+        self._future: Future = Future()
+        self._thread = threading.Thread(target=self._run, args=(timeout, hedge_delay),
+                                        name="rate-lookup", daemon=True)
+
+    @classmethod
+    def start(cls, **kwargs) -> "RateLookup":
+        lookup = cls(**kwargs)
+        lookup._thread.start()
+        return lookup
+
+    def _run(self, timeout, hedge_delay):
+        try:
+            self._future.set_result(get_usd_brl_quote(timeout, hedge_delay))
+        except Exception as e:
+            logger.exception("[COTAÇÃO] Erro inesperado na consulta: %s", e)
+            self._future.set_result(RateQuote(DEFAULT_USD_TO_BRL, SOURCE_FALLBACK, time.time()))
+
+    def result(self) -> RateQuote:
+        return self._future.result()
+
+
+# -----------------------
+# Histórico no banco
+# -----------------------
+def record_rate(conn, quote: RateQuote, base: str = "USD", quote_currency: str = "BRL") -> int:
+    """Registra a cotação usada numa execução; devolve o id (exchange_rates.id)."""
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            INSERT INTO exchange_rates (base_currency, quote_currency, rate, source, fetched_at)
+            VALUES (%s, %s, %s, %s, %s)
+            RETURNING id
+            """,
+            (base, quote_currency, quote.rate, quote.source, quote.fetched_datetime),
+        )
+        rate_id = cur.fetchone()[0]
+    conn.commit()
+    return rate_id
+
+
+def reconvert_usd_budgets(conn, rate_id: int) -> int:
+    """
+    Reconverte, num único UPDATE, as vagas em USD convertidas com outra cotação
+    para a cotação `rate_id`. Devolve o número de vagas alteradas.
+    """
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            UPDATE scraped_jobs AS sj
+               SET min_budget = ROUND(sj.min_budget * novo.rate / antigo.rate, 2),
+                   max_budget = ROUND(sj.max_budget * novo.rate / antigo.rate, 2),
+                   exchange_rate_id = novo.id
+              FROM exchange_rates AS antigo, exchange_rates AS novo
+             WHERE novo.id = %s
+               AND antigo.id = sj.exchange_rate_id
+               AND antigo.id <> novo.id
+               AND sj.conversion_method LIKE 'convert\\_api%%'
+            """,
+            (rate_id,),
+        )
+        updated = cur.rowcount
+    conn.commit()
+    return updated
@@ -0,0 +1,63 @@
+"""
+Workly - Skills normalizadas das vagas (tabela job_skills).
+
+A coluna scraped_jobs.skills guarda as skills como texto ("Python | Django");
+aqui cada uma vira um token (minúsculas, espaços colapsados) e vai para
+job_skills(job_id, skill), que a busca por skill do backend consulta pelo
+índice em vez de varrer a tabela. As grafias alternativas ("node", "aws") são
+resolvidas no banco pela função normalize_skill (tabela skill_aliases, V11),
+a mesma que a busca aplica ao termo pesquisado.
+"""
+
+import re
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
+
+from psycopg2.extras import execute_values
+
+SKILL_MAX_LENGTH = 100  # job_skills.skill VARCHAR(100)
+
+_SEPARATOR = re.compile(r"\s*\|\s*")
+_IGNORED = {"", "+"}
+
+
+@lru_cache(maxsize=4096)
+def normalize_skill(token: str) -> Optional[str]:
+    """Token em minúsculas e espaços colapsados; None para tokens vazios ou de ruído ("+")."""
+    skill = " ".join((token or "").lower().split())
+    if skill in _IGNORED:
+        return None
+    return skill[:SKILL_MAX_LENGTH]
+
+
+def parse_skills(text: str) -> List[str]:
+    """'Python | Django | python' -> ['python', 'django'] (sem repetições, na ordem original)."""
+    if not text:
+        return []
+    skills = []
+    for token in _SEPARATOR.split(text):
+        skill = normalize_skill(token)
+        if skill and skill not in skills:
+            skills.append(skill)
+    return skills
+
+
+def replace_job_skills(cur, jobs: Iterable[Tuple[int, str]]) -> int:
+    """
+    Regrava as skills das vagas `jobs` (pares job_id, texto de skills) com um
+    DELETE e um INSERT em lote. Não faz commit: roda na transação do upsert.
+    Devolve o número de linhas gravadas em job_skills.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return 0
+    cur.execute("DELETE FROM job_skills WHERE job_id = ANY(%s)", ([job_id for job_id, _ in jobs],))
+    rows = [(job_id, skill) for job_id, text in jobs for skill in parse_skills(text)]
+    if rows:
+        # aliases resolvidos pelo banco, com a mesma função usada na busca
+        execute_values(cur, """
+            INSERT INTO job_skills (job_id, skill)
+            SELECT v.job_id, normalize_skill(v.skill) FROM (VALUES %s) AS v (job_id, skill)
+            ON CONFLICT DO NOTHING
+        """, rows, template="(%s::bigint, %s)", page_size=500)
+    return len(rows)
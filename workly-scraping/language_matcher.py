@@ -0,0 +1,125 @@
+"""
+Workly - Matcher de linguagens por palavra-chave.
+
+Compila, uma vez por execução, uma única regex de alternância com todas as
+grafias (aliases) das linguagens pedidas, com fronteiras de token: "java" não
+casa com "javascript" e "go" não casa com "google". Cada registro volta com a
+lista das linguagens encontradas.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+MATCHES_KEY = "Linguagens"
+
+# nome canônico -> grafias aceitas (todas em minúsculas)
+DEFAULT_ALIASES: Dict[str, Sequence[str]] = {
+    "javascript": ("javascript", "js", "ecmascript"),
+    "typescript": ("typescript", "ts"),
+    "python": ("python", "python3"),
+    "java": ("java",),
+    "c#": ("c#", "csharp", "c sharp"),
+    "c++": ("c++", "cpp"),
+    "c": ("c",),
+    ".net": (".net", "dotnet", "asp.net"),
+    "go": ("go", "golang"),
+    "node": ("node", "nodejs", "node.js"),
+    "php": ("php",),
+    "ruby": ("ruby", "rails", "ruby on rails"),
+    "kotlin": ("kotlin",),
+    "swift": ("swift",),
+    "rust": ("rust",),
+    "sql": ("sql", "mysql", "postgresql", "postgres"),
+    "react": ("react", "reactjs", "react.js"),
+    "vue": ("vue", "vuejs", "vue.js"),
+    "angular": ("angular", "angularjs"),
+    "flutter": ("flutter", "dart"),
+}
+
+# caracteres que fazem parte de um token de linguagem (c#, c++, node.js, ...)
+_TOKEN_CHARS = r"\w#+"
+
+
+def _canonical_index(aliases: Dict[str, Sequence[str]]) -> Dict[str, str]:
+    index = {}
+    for canonical, spellings in aliases.items():
+        for spelling in (canonical, *spellings):
+            index[spelling.lower()] = canonical
+    return index
+
+
+class LanguageMatcher:
+    """Construído uma vez a partir da lista de linguagens; seguro para uso entre threads."""
+
+    def __init__(self, languages: Iterable[str], aliases: Optional[Dict[str, Sequence[str]]] = None):
+        aliases = DEFAULT_ALIASES if aliases is None else aliases
+        index = _canonical_index(aliases)
+
+        # grafia -> linguagem como o usuário pediu (java, js -> "js", ...)
+        self.languages: List[str] = []
+        self._spelling_to_language: Dict[str, str] = {}
+        for lang in languages:
+            lang = (lang or "").strip()
+            if not lang or lang in self.languages:
+                continue
+            self.languages.append(lang)
+            canonical = index.get(lang.lower())
+            spellings = [lang.lower()]
+            if canonical is not None:
+                spellings += [canonical, *aliases.get(canonical, ())]
+            for spelling in spellings:
+                self._spelling_to_language.setdefault(spelling.lower(), lang)
+
+        self._order = {lang: i for i, lang in enumerate(self.languages)}
+        self._pattern = None
+        if self._spelling_to_language:
+            # mais longas primeiro, para "node.js" vencer "node"
+            alternation = "|".join(
+                re.escape(s).replace(r"\ ", r"\s+")
+                for s in sorted(self._spelling_to_language, key=len, reverse=True)
+            )
+            self._pattern = re.compile(rf"(?<![{_TOKEN_CHARS}])({alternation})(?![{_TOKEN_CHARS}])", re.IGNORECASE)
+
+    def match_text(self, text: str) -> List[str]:
+        """Linguagens encontradas em `text`, na ordem em que foram pedidas."""
+        if self._pattern is None or not text:
+            return []
+        found = set()
+        for m in self._pattern.finditer(text):
+            found.add(self._spelling_to_language[" ".join(m.group(1).lower().split())])
+            if len(found) == len(self.languages):
+                break
+        return sorted(found, key=self._order.__getitem__)
+
+    def match(self, projeto: dict) -> List[str]:
+        return self.match_text("\n".join((
+            projeto.get("Título") or "",
+            projeto.get("Descrição") or "",
+            projeto.get("Habilidades") or "",
+        )))
+
+    def match_rows(self, rows: Iterable[Tuple[str, str, str, str]]) -> Iterator[Tuple[str, List[str]]]:
+        """Para backfills no banco: linhas (link_hash, title, description, skills) -> (link_hash, linguagens)."""
+        for link_hash, title, description, skills in rows:
+            yield link_hash, self.match_text("\n".join((title or "", description or "", skills or "")))
+
+
+@lru_cache(maxsize=32)
+def _cached_matcher(languages: Tuple[str, ...]) -> LanguageMatcher:
+    return LanguageMatcher(languages)
+
+
+def match_languages(projeto: dict, languages: List[str]) -> bool:
+    """Compatível com a versão antiga: True se o projeto cita alguma das linguagens."""
+    if not languages:
+        return True
+    return bool(_cached_matcher(tuple(languages)).match(projeto))
+
+
+def scan_db(conn, matcher: LanguageMatcher, batch_size: int = 2000) -> Iterator[Tuple[str, List[str]]]:
+    """Percorre o scraped_jobs com cursor no servidor, em lotes, devolvendo (link_hash, linguagens)."""
+    with conn.cursor(name="language_scan") as cur:
+        cur.itersize = batch_size
+        cur.execute("SELECT link_hash, title, description, skills FROM scraped_jobs")
+        yield from matcher.match_rows(cur)
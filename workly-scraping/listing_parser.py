@@ -0,0 +1,96 @@
+"""
+Workly - Parser da listagem da Workana a partir de um snapshot do HTML.
+
+Substitui as dezenas de chamadas find_elements/get_attribute por card (cada uma
+um round-trip ao WebDriver) por um único `driver.page_source` processado em
+memória. Também serve para testar a extração em HTML salvo.
+"""
+
+import re
+from typing import List
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+WORKANA_BASE_URL = "https://www.workana.com/jobs"
+
+CARD_SELECTOR = "div.project-item"
+TITLE_SELECTORS = ["h2.project-title a", "h2.h3.project-title a", "h2 a"]
+DESC_SELECTORS = ["div.html-desc.project-details p", "div.project-details p", ".project-body p", "p"]
+SKILLS_SELECTOR = ".project-skills a, .project-skills span, div.skills a, div.skills span"
+BUDGET_SELECTORS = ["h4.budget span.values span", "h4.budget .values span", "h4.budget", ".budget"]
+BIDS_SELECTORS = ["div.project-main-details span.bids", "span.bids", ".bids"]
+VER_MAIS_SELECTORS = ["a.link.small", "a.link.link-small", "a.link"]
+# link "Ver mais"/"Ver menos" que o texto do card traz no fim (só o sufixo: o meio é conteúdo)
+_VER_MAIS_SUFFIX = re.compile(r"\s*\b(?:ver|mostrar) (?:mais|menos)(?: detalhes)?\s*$", re.IGNORECASE)
+
+
+def _text(node) -> str:
+    return " ".join(node.get_text(" ").split())
+
+
+def _first_text(node, selectors: List[str]) -> str:
+    """Equivalente ao safe_find_text: primeiro seletor cujo primeiro elemento tem texto."""
+    for sel in selectors:
+        elem = node.select_one(sel)
+        if elem is not None:
+            text = _text(elem)
+            if text:
+                return text
+    return ""
+
+
+def strip_ver_mais(text: str) -> str:
+    """Remove o 'Ver mais'/'Ver menos' do fim da descrição do card; None/vazio continuam como estão."""
+    if not text:
+        return text
+    return _VER_MAIS_SUFFIX.sub("", text)
+
+
+def _has_ver_mais(card) -> bool:
+    for sel in VER_MAIS_SELECTORS:
+        elem = card.select_one(sel)
+        if elem is not None and "ver" in _text(elem).lower():
+            return True
+    return False
+
+
+def parse_card(card, idx: int, base_url: str = WORKANA_BASE_URL) -> dict:
+    """Extrai um card da listagem no formato consumido por `enrich_card`."""
+    titulo = ""
+    link = ""
+    for sel in TITLE_SELECTORS:
+        anchor = card.select_one(sel)
+        if anchor is not None:
+            span = anchor.find("span")
+            if span is not None:
+                titulo = (span.get("title") or "").strip() or _text(span)
+            else:
+                titulo = _text(anchor)
+            href = anchor.get("href") or ""
+            # o Selenium devolve o href absoluto; mantém o mesmo link (e link_hash)
+            link = urljoin(base_url, href) if href else ""
+            break
+
+    return {
+        "idx": idx,
+        "titulo": titulo,
+        "link": link,
+        "descricao": strip_ver_mais(_first_text(card, DESC_SELECTORS)),
+        "habilidades": [t for t in (_text(e) for e in card.select(SKILLS_SELECTOR)) if t],
+        "orcamento": _first_text(card, BUDGET_SELECTORS),
+        "propostas": _first_text(card, BIDS_SELECTORS),
+        "ver_mais": _has_ver_mais(card),
+    }
+
+
+def parse_listing_html(html: str, base_url: str = WORKANA_BASE_URL) -> List[dict]:
+    """Retorna um dict por `div.project-item`, na ordem do documento (idx começa em 1)."""
+    soup = BeautifulSoup(html or "", HTML_PARSER)
+    return [parse_card(card, idx, base_url) for idx, card in enumerate(soup.select(CARD_SELECTOR), start=1)]
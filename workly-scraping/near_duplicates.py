@@ -0,0 +1,206 @@
+"""
+Workly - Detecção de vagas quase duplicadas (MinHash + LSH).
+
+Clientes repostam o mesmo projeto com outro link; a deduplicação por URL não
+pega esses casos. Cada vaga vira uma assinatura MinHash sobre trigramas de
+palavras do título e das primeiras palavras da descrição, poucas o bastante
+para caberem no trecho que o card da listagem já traz: a checagem acontece
+antes de qualquer página de detalhe e assina o mesmo texto que a descrição
+completa gravada no banco. A
+assinatura usa um único hash por trigrama (one permutation hashing, com
+densificação por rotação), o que a mantém bem abaixo de 1 ms por vaga em
+Python puro. O índice LSH em bandas devolve candidatos em tempo constante e a
+similaridade estimada confirma. O índice é carregado das vagas recentes do
+banco, cresce com as vagas novas da execução e descarta (prune) as que saíram
+da janela, para o daemon não acumular vagas antigas.
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from listing_parser import strip_ver_mais
+
+logger = logging.getLogger("workly-scraper")
+
+NUM_BINS = 64  # posições da assinatura (potência de 2)
+LSH_BANDS = 16  # 16 bandas x 4 posições: candidatas a partir de ~50% de similaridade
+LSH_ROWS = NUM_BINS // LSH_BANDS
+DEFAULT_THRESHOLD = 0.8  # similaridade de Jaccard estimada para considerar duplicata
+DESCRIPTION_WORDS = 25  # só o início da descrição: menos palavras que o trecho do card da listagem
+SHINGLE_SIZE = 3
+MIN_SHINGLES = 8  # textos curtos demais ("Site institucional") não são comparados
+DEFAULT_WINDOW_HOURS = 24 * 7
+
+_BIN_BITS = NUM_BINS.bit_length() - 1
+_EMPTY = 1 << (64 - _BIN_BITS)  # maior que qualquer valor de posição
+_WORD = re.compile(r"\w+")
+_TRUNCATED = ("...", "…")
+
+Signature = Tuple[int, ...]
+
+
+def _words(text: str) -> List[str]:
+    text = unicodedata.normalize("NFKD", (text or "").lower())
+    return _WORD.findall(text.encode("ascii", "ignore").decode("ascii"))
+
+
+def _description_words(description: str) -> List[str]:
+    """
+    Primeiras DESCRIPTION_WORDS palavras, iguais no trecho do card e na descrição
+    completa: sem o 'Ver mais' final e sem a palavra cortada antes das reticências.
+    """
+    description = strip_ver_mais(description or "").rstrip()
+    words = _words(description)
+    if description.endswith(_TRUNCATED) and len(words) <= DESCRIPTION_WORDS:
+        words = words[:-1]
+    return words[:DESCRIPTION_WORDS]
+
+
+def shingles(title: str, description: str) -> Set[int]:
+    """Trigramas de palavras (título + início da descrição), como hashes de 64 bits estáveis entre execuções."""
+    words = _words(title) + _description_words(description)
+    if len(words) < SHINGLE_SIZE:
+        grams = words
+    else:
+        grams = [" ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+    return {int.from_bytes(hashlib.blake2b(g.encode("utf-8"), digest_size=8).digest(), "little") for g in grams}
+
+
+def signature(title: str, description: str) -> Optional[Signature]:
+    """Assinatura MinHash; None se o texto for curto demais para comparar."""
+    hashes = shingles(title, description)
+    if len(hashes) < MIN_SHINGLES:
+        return None
+    # os bits baixos escolhem a posição, os altos competem pelo mínimo nela
+    mins = [_EMPTY] * NUM_BINS
+    for h in hashes:
+        pos, value = h & (NUM_BINS - 1), h >> _BIN_BITS
+        if value < mins[pos]:
+            mins[pos] = value
+    # posições vazias herdam da próxima preenchida (circular), deslocadas pela distância
+    sig = list(mins)
+    for i in range(NUM_BINS):
+        if sig[i] == _EMPTY:
+            for step in range(1, NUM_BINS):
+                source = mins[(i + step) % NUM_BINS]
+                if source != _EMPTY:
+                    sig[i] = source + step * _EMPTY
+                    break
+    return tuple(sig)
+
+
+def similarity(a: Signature, b: Signature) -> float:
+    """Estimativa da similaridade de Jaccard entre os conjuntos de trigramas."""
+    return sum(x == y for x, y in zip(a, b)) / NUM_BINS
+
+
+class NearDuplicateIndex:
+    """Índice LSH de assinaturas por link_hash, com a hora em que cada vaga foi vista; seguro para uso entre threads."""
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, window_hours: int = DEFAULT_WINDOW_HOURS):
+        self.threshold = threshold
+        self.window_hours = window_hours
+        self.loaded = False  # True depois que load_recent trouxe as vagas do banco
+        self._signatures: Dict[str, Signature] = {}
+        self._seen_at: Dict[str, float] = {}
+        self._buckets: List[Dict[int, List[str]]] = [defaultdict(list) for _ in range(LSH_BANDS)]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._signatures
+
+    @staticmethod
+    def _band_keys(sig: Signature):
+        for band in range(LSH_BANDS):
+            yield band, hash(sig[band * LSH_ROWS:(band + 1) * LSH_ROWS])
+
+    def add(self, key: str, sig: Signature, seen_at: float = None):
+        with self._lock:
+            self._seen_at[key] = time.time() if seen_at is None else seen_at
+            if key in self._signatures:
+                return
+            self._signatures[key] = sig
+            for band, bucket in self._band_keys(sig):
+                self._buckets[band][bucket].append(key)
+
+    def prune(self, now: float = None) -> int:
+        """Remove as vagas vistas antes da janela de `window_hours`; devolve quantas saíram."""
+        cutoff = (time.time() if now is None else now) - self.window_hours * 3600
+        with self._lock:
+            expired = [key for key, seen_at in self._seen_at.items() if seen_at < cutoff]
+            for key in expired:
+                del self._seen_at[key]
+                sig = self._signatures.pop(key)
+                for band, bucket in self._band_keys(sig):
+                    keys = self._buckets[band][bucket]
+                    keys.remove(key)
+                    if not keys:
+                        del self._buckets[band][bucket]
+        return len(expired)
+
+    def query(self, sig: Signature) -> Optional[Tuple[str, float]]:
+        """(link_hash, similaridade) da vaga indexada mais parecida acima do limiar, ou None."""
+        best = None
+        with self._lock:
+            seen = set()
+            for band, bucket in self._band_keys(sig):
+                for key in self._buckets[band].get(bucket, ()):
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    score = similarity(sig, self._signatures[key])
+                    if score >= self.threshold and (best is None or score > best[1]):
+                        best = (key, score)
+        return best
+
+    def check(self, key: str, title: str, description: str) -> Optional[str]:
+        """
+        link_hash da vaga original se `key` for quase duplicata de uma já indexada;
+        senão indexa `key` (para as próximas da execução) e devolve None.
+        """
+        sig = signature(title, description)
+        if sig is None:
+            return None
+        if key in self:
+            # vista de novo: continua na janela
+            self.add(key, sig)
+            return None
+        match = self.query(sig)
+        if match is not None:
+            return match[0]
+        self.add(key, sig)
+        return None
+
+
+def load_recent(conn, window_hours: int = DEFAULT_WINDOW_HOURS, threshold: float = DEFAULT_THRESHOLD,
+                index: NearDuplicateIndex = None) -> NearDuplicateIndex:
+    """Índice (novo ou `index`) com as vagas originais (não duplicatas) vistas na janela recente."""
+    if index is None:
+        index = NearDuplicateIndex(threshold, window_hours)
+    now = time.time()
+    with conn.cursor(name="near_duplicate_scan") as cur:
+        cur.itersize = 2000
+        cur.execute(
+            """
+            SELECT link_hash, title, description, EXTRACT(EPOCH FROM NOW() - last_seen_at) FROM scraped_jobs
+             WHERE duplicate_of IS NULL
+               AND last_seen_at >= NOW() - INTERVAL '1 hour' * %s
+            """,
+            (window_hours,),
+        )
+        # idade calculada no banco: last_seen_at é TIMESTAMP sem fuso
+        for link_hash, title, description, age_seconds in cur:
+            sig = signature(title, description)
+            if sig is not None:
+                index.add(link_hash.strip(), sig, now - float(age_seconds))
+    index.loaded = True
+    return index
@@ -0,0 +1,49 @@
+"""
+Workly - Normalização de valores e links (sem dependências pesadas).
+
+Funções puras usadas pelo scraper, pela gravação no banco, pelos benchmarks
+e pelos testes. Só biblioteca padrão e budget_parser: importar daqui não
+puxa Selenium, requests nem psycopg2.
+"""
+
+import hashlib
+from urllib.parse import urlparse, urlunparse
+
+from budget_parser import parse_int, parse_number
+
+
+def normalize_value(value, target_type="str"):
+    """Normalize/convert values safely. Returns None when value is empty/non-convertible."""
+    if value in ("", None, "None", "null"):
+        return None
+    try:
+        if target_type == "int":
+            if isinstance(value, str):
+                return parse_int(value)
+            return int(value)
+        elif target_type == "float":
+            if isinstance(value, str):
+                return parse_number(value)
+            return float(value)
+        elif target_type == "str":
+            return str(value).strip()
+    except (ValueError, TypeError):
+        return None
+    return value
+
+
+def normalize_url_for_hash(url: str) -> str:
+    """Remove query/fragment and trailing slash, lowercase host."""
+    if not url:
+        return ""
+    parsed = urlparse(url)
+    scheme = parsed.scheme or "https"
+    netloc = parsed.netloc.lower()
+    path = parsed.path.rstrip("/") or "/"
+    clean = urlunparse((scheme, netloc, path, "", "", ""))
+    return clean
+
+
+def generate_link_hash(link: str) -> str:
+    clean = normalize_url_for_hash(link)
+    return hashlib.sha256(clean.encode("utf-8")).hexdigest()
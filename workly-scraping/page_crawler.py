@@ -0,0 +1,186 @@
+"""
+Workly - Listagem paginada (&page=N) percorrida em paralelo.
+
+Em vez de rolar uma única aba até o fim, busca as páginas da listagem em uma
+janela deslizante de `concurrency` páginas simultâneas (por HTTP ou por um
+pool de navegadores), compartilhada por todas as consultas, e entrega os
+cards de cada página, na ordem das páginas da consulta, assim que ela fica
+pronta. Para na primeira página lida com sucesso que não traz nenhum
+link novo (fim da listagem, ou a Workana repetindo a última página) ou em
+`max_pages`. Uma página que falha (timeout, erro HTTP) é tentada de novo com
+espera crescente e, se ainda falhar, é pulada: falha não é fim de listagem.
+"""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.common.exceptions import TimeoutException
+
+from detail_fetcher import DEFAULT_HTTP_TIMEOUT, HTTP_HEADERS
+from listing_parser import parse_listing_html
+from query_planner import ListingQuery
+from run_metrics import metrics
+
+logger = logging.getLogger("workly-scraper")
+
+LISTING_MODE_PAGES = "pages"
+LISTING_MODE_SCROLL = "scroll"
+LISTING_MODES = (LISTING_MODE_PAGES, LISTING_MODE_SCROLL)
+LISTING_BACKENDS = ("http", "selenium")
+DEFAULT_MAX_PAGES = 40
+DEFAULT_PAGE_WINDOW = 8  # páginas em voo no motor async (além do fim, no máximo isso é desperdiçado)
+PAGE_RETRIES = 2  # novas tentativas por página, além da primeira
+PAGE_RETRY_BACKOFF = 1.0  # segundos antes da 1ª nova tentativa; dobra a cada uma
+MAX_FAILED_PAGES = 3  # páginas seguidas que falham mesmo com as tentativas: desiste da consulta
+
+
+def retry_delay(attempt: int) -> float:
+    """Espera antes da nova tentativa `attempt` (1, 2, ...) de ler uma página."""
+    return PAGE_RETRY_BACKOFF * 2 ** (attempt - 1)
+
+
+class HttpListingFetcher:
+    """Baixa e parseia uma página da listagem sem navegador, reaproveitando conexões."""
+
+    def __init__(self, pool_size: int, timeout: float = DEFAULT_HTTP_TIMEOUT):
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(HTTP_HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=1)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def __call__(self, url: str) -> List[dict]:
+        with metrics.stage("listing_load"):
+            r = self.session.get(url, timeout=self.timeout)
+            r.raise_for_status()
+        with metrics.stage("listing_parse"):
+            return parse_listing_html(r.text)
+
+    def close(self):
+        self.session.close()
+
+
+def new_cards(stubs: List[dict], seen: set, key_func: Callable[[str], str]) -> List[dict]:
+    """Cards cujo link ainda não apareceu na consulta (e os registra em `seen`)."""
+    new = []
+    for stub in stubs:
+        key = key_func(stub["link"] or "")
+        if key not in seen:
+            seen.add(key)
+            new.append(stub)
+    return new
+
+
+def fetch_with_retries(fetch_page: Callable[[str], List[dict]], query: ListingQuery, page: int) -> Optional[List[dict]]:
+    """Cards da página `page` de `query`; None se ela falhou em todas as tentativas."""
+    for attempt in range(PAGE_RETRIES + 1):
+        if attempt:
+            time.sleep(retry_delay(attempt))
+        try:
+            return fetch_page(query.page_url(page))
+        except (requests.Timeout, TimeoutException):
+            metrics.inc("timeouts")
+            logger.warning("Timeout ao ler %s, página %d (tentativa %d).", query.label, page, attempt + 1)
+        except Exception as e:
+            metrics.inc("errors")
+            logger.warning("Erro ao ler %s, página %d (tentativa %d): %s", query.label, page, attempt + 1, e)
+    return None
+
+
+class _QueryCrawl:
+    """Estado de uma consulta no crawl: próxima página a disparar e páginas prontas fora de ordem."""
+
+    def __init__(self, query: ListingQuery, window: int, max_pages: int):
+        self.query = query
+        self.window = window
+        self.max_pages = max_pages
+        self.next_page = 1  # próxima a disparar
+        self.expected = 1  # próxima a entregar
+        self.ready: Dict[int, Optional[List[dict]]] = {}
+        self.seen = set()
+        self.pages = 0
+        self.failed = 0
+        self.done = False
+
+    def can_submit(self) -> bool:
+        return not self.done and self.next_page <= self.max_pages and self.next_page - self.expected < self.window
+
+    def drain(self, key_func: Callable[[str], str]) -> Iterator[List[dict]]:
+        """Cards novos das páginas prontas em sequência; marca `done` no fim da listagem."""
+        while not self.done and self.expected in self.ready:
+            page = self.expected
+            stubs = self.ready.pop(page)
+            self.expected += 1
+            if stubs is None:
+                self.failed += 1
+                logger.error("Página %d de %s pulada após %d tentativas.", page, self.query.label, PAGE_RETRIES + 1)
+                if self.failed >= MAX_FAILED_PAGES:
+                    logger.error("%d páginas seguidas falharam em %s; consulta interrompida.", self.failed, self.query.label)
+                    self.done = True
+                continue
+            self.failed = 0
+            metrics.inc("cards_seen", len(stubs))
+            new = new_cards(stubs, self.seen, key_func)
+            if not new:
+                self.done = True
+                break
+            self.pages = page
+            for stub in new:
+                stub["query"] = self.query.label
+            yield new
+        if not self.done and self.expected > self.max_pages:
+            logger.info("Limite de páginas (MAX=%d) atingido em %s.", self.max_pages, self.query.label)
+            self.done = True
+        if self.done:
+            self.ready.clear()
+
+
+def crawl_queries(queries: List[ListingQuery], fetch_page: Callable[[str], List[dict]], concurrency: int,
+                  key_func: Callable[[str], str], max_pages: int = DEFAULT_MAX_PAGES) -> Iterator[Tuple[ListingQuery, List[dict]]]:
+    """
+    Gera (consulta, cards novos) de cada página, com todas as consultas
+    percorridas ao mesmo tempo em um único executor de `concurrency` páginas.
+    Cada consulta é entregue na ordem das suas páginas; `fetch_page(url)`
+    devolve os cards de uma página e `key_func(link)` é a chave de deduplicação
+    (link_hash) dentro da consulta. Páginas além do fim já disparadas são descartadas.
+    """
+    concurrency = max(1, concurrency)
+    crawls = [_QueryCrawl(query, concurrency, max_pages) for query in queries]
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="listing-page") as executor:
+        running: Dict[Future, Tuple[_QueryCrawl, int]] = {}
+
+        def _submit():
+            # uma página por consulta a cada volta: as vagas do executor ficam repartidas entre elas
+            while len(running) < concurrency:
+                open_crawls = [crawl for crawl in crawls if crawl.can_submit()]
+                if not open_crawls:
+                    return
+                for crawl in open_crawls[:concurrency - len(running)]:
+                    future = executor.submit(fetch_with_retries, fetch_page, crawl.query, crawl.next_page)
+                    running[future] = (crawl, crawl.next_page)
+                    crawl.next_page += 1
+
+        _submit()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                crawl, page = running.pop(future)
+                if crawl.done or future.cancelled():
+                    continue
+                crawl.ready[page] = future.result()
+                for new in crawl.drain(key_func):
+                    yield crawl.query, new
+                if crawl.done:
+                    # fim da listagem: o que ainda não começou é cancelado
+                    for other, (owner, _) in running.items():
+                        if owner is crawl:
+                            other.cancel()
+            _submit()
+
+    for crawl in crawls:
+        logger.info("[PÁGINAS] %s: %d páginas, %d cards novos.", crawl.query.label, crawl.pages, len(crawl.seen))
@@ -0,0 +1,74 @@
+"""
+Workly - CSV dos projetos.
+
+Formato único para o fallback do escritor em lote (save_csv), para a carga em
+massa (--bulk-load lê com load_csv) e para a exportação do banco (export_jobs):
+um CSV exportado volta para o banco pelo --bulk-load sem conversão.
+"""
+
+import csv
+import logging
+import os
+from typing import Iterator, List
+
+logger = logging.getLogger("workly-scraper")
+
+CSV_FILENAME = "projetos_workana.csv"
+PARTIAL_KEY = "Parcial"  # registro só com os dados da listagem (vaga já conhecida)
+CSV_FIELDS = [
+    "Título", "Link", "Descrição", "Habilidades", "Orçamento Original",
+    "Mínimo (BRL)", "Máximo (BRL)", "Propostas", "Metodo", PARTIAL_KEY,
+]
+# colunas de scraped_jobs na ordem de CSV_FIELDS (sem PARTIAL_KEY: o banco só guarda vagas completas)
+EXPORT_COLUMNS = [
+    "title", "link", "description", "skills", "original_budget",
+    "min_budget", "max_budget", "proposals", "conversion_method",
+]
+EXPORT_FETCH_SIZE = 2000
+
+
+def load_csv(filename: str) -> Iterator[dict]:
+    """Lê um CSV no formato de save_csv, linha a linha."""
+    with open(filename, newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+def save_csv(projetos: List[dict], filename: str = CSV_FILENAME, append: bool = False):
+    if not projetos:
+        logger.warning("Nenhum projeto para salvar.")
+        return
+    write_header = not append or not os.path.exists(filename)
+    with open(filename, "a" if append else "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, restval="", extrasaction="ignore")
+        if write_header:
+            writer.writeheader()
+        writer.writerows(projetos)
+    logger.info("CSV salvo: %s (registros: %d)", filename, len(projetos))
+
+
+def export_jobs(conn, filename: str, window_hours: int = 0, include_duplicates: bool = False) -> int:
+    """
+    Exporta scraped_jobs para `filename` (formato de save_csv) com um cursor do
+    lado do servidor, sem carregar a tabela na memória. `window_hours` limita às
+    vagas vistas nas últimas horas (0 = todas). Devolve o número de linhas.
+    """
+    where, params = [], []
+    if window_hours:
+        where.append("last_seen_at >= NOW() - INTERVAL '1 hour' * %s")
+        params.append(window_hours)
+    if not include_duplicates:
+        where.append("duplicate_of IS NULL")
+    sql = "SELECT {} FROM scraped_jobs{} ORDER BY id".format(
+        ", ".join(EXPORT_COLUMNS), " WHERE " + " AND ".join(where) if where else "")
+
+    total = 0
+    with open(filename, "w", newline="", encoding="utf-8") as f, conn.cursor(name="export_jobs") as cur:
+        cur.itersize = EXPORT_FETCH_SIZE
+        cur.execute(sql, params)
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDS)
+        for row in cur:
+            writer.writerow(["" if v is None else v for v in row] + [""])
+            total += 1
+    logger.info("CSV exportado: %s (registros: %d)", filename, total)
+    return total
@@ -0,0 +1,51 @@
+"""
+Workly - Planejador de consultas da listagem da Workana.
+
+Expande linguagens x categorias x janelas de publicação em URLs de listagem
+independentes, que podem ser percorridas em paralelo e deduplicadas entre si.
+"""
+
+from dataclasses import dataclass
+from itertools import product
+from typing import Iterable, List, Optional
+from urllib.parse import urlencode
+
+LISTING_BASE_URL = "https://www.workana.com/jobs"
+DEFAULT_CATEGORIES = ["it-programming"]
+DEFAULT_PUBLICATIONS = ["1d"]
+LISTING_LANGUAGE = "pt"
+
+
+@dataclass(frozen=True)
+class ListingQuery:
+    category: str
+    publication: str
+    language: Optional[str] = None
+
+    @property
+    def url(self) -> str:
+        return self.page_url(1)
+
+    def page_url(self, page: int) -> str:
+        """URL da página `page` (1 = primeira, sem o parâmetro) da listagem paginada."""
+        params = {"category": self.category, "language": LISTING_LANGUAGE, "publication": self.publication}
+        if self.language:
+            params["query"] = self.language
+        if page > 1:
+            params["page"] = page
+        # mantém o formato das URLs antigas (query=java+spring)
+        return f"{LISTING_BASE_URL}?{urlencode(params)}"
+
+    @property
+    def label(self) -> str:
+        return f"{self.category}/{self.publication}/{self.language or '*'}"
+
+
+def plan_queries(languages: Optional[Iterable[str]] = None,
+                 categories: Optional[Iterable[str]] = None,
+                 publications: Optional[Iterable[str]] = None) -> List[ListingQuery]:
+    """Produto cartesiano das dimensões, sem repetições. Sem linguagens, busca a categoria toda."""
+    langs = list(dict.fromkeys(l.strip() for l in (languages or []) if l and l.strip())) or [None]
+    cats = list(dict.fromkeys(categories or DEFAULT_CATEGORIES))
+    pubs = list(dict.fromkeys(publications or DEFAULT_PUBLICATIONS))
+    return [ListingQuery(category=c, publication=p, language=l) for c, p, l in product(cats, pubs, langs)]
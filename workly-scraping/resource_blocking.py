@@ -0,0 +1,82 @@
+"""
+Workly - Bloqueio de recursos no Chromium (imagens, fontes, mídia, analytics e anúncios).
+
+Aplicado na criação do driver: as preferências de conteúdo do Chrome cortam
+imagens por tipo (inclusive URLs sem extensão) e o CDP `Network.setBlockedURLs`
+barra o resto por padrão de URL. A extração só precisa do texto das páginas.
+"""
+
+import logging
+from typing import Dict, List, Sequence
+
+logger = logging.getLogger("workly-scraper")
+
+CATEGORY_IMAGES = "images"
+CATEGORY_FONTS = "fonts"
+CATEGORY_MEDIA = "media"
+CATEGORY_ANALYTICS = "analytics"
+CATEGORY_ADS = "ads"
+
+BLOCKED_URL_PATTERNS: Dict[str, Sequence[str]] = {
+    CATEGORY_IMAGES: ("*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico", "*.bmp"),
+    CATEGORY_FONTS: ("*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"),
+    CATEGORY_MEDIA: ("*.mp4", "*.webm", "*.ogg", "*.mp3", "*.m4a", "*.wav", "*.m3u8"),
+    CATEGORY_ANALYTICS: (
+        "*google-analytics.com*", "*googletagmanager.com*", "*analytics.google.com*",
+        "*hotjar.com*", "*clarity.ms*", "*segment.io*", "*segment.com*", "*mixpanel.com*",
+        "*connect.facebook.net*", "*facebook.com/tr*", "*newrelic.com*", "*nr-data.net*",
+    ),
+    CATEGORY_ADS: (
+        "*doubleclick.net*", "*googlesyndication.com*", "*googleadservices.com*",
+        "*adservice.google.*", "*amazon-adsystem.com*", "*taboola.com*", "*outbrain.com*",
+        "*criteo.com*", "*criteo.net*", "*adnxs.com*",
+    ),
+}
+
+BLOCK_PROFILES: Dict[str, Sequence[str]] = {
+    "none": (),
+    "assets": (CATEGORY_IMAGES, CATEGORY_FONTS, CATEGORY_MEDIA),
+    "trackers": (CATEGORY_ANALYTICS, CATEGORY_ADS),
+    "default": (CATEGORY_IMAGES, CATEGORY_FONTS, CATEGORY_MEDIA, CATEGORY_ANALYTICS, CATEGORY_ADS),
+}
+DEFAULT_BLOCK_PROFILE = "default"
+
+# padrões aplicados ao driver, para reaplicar em abas novas (cada aba é um alvo CDP)
+BLOCKED_URLS_ATTR = "_workly_blocked_urls"
+
+
+def blocked_urls(profile: str) -> List[str]:
+    if profile not in BLOCK_PROFILES:
+        raise ValueError(f"Perfil de bloqueio desconhecido: {profile}")
+    return [p for category in BLOCK_PROFILES[profile] for p in BLOCKED_URL_PATTERNS[category]]
+
+
+def configure_options(options, profile: str):
+    """Preferências por tipo de recurso; precisam estar nas options, antes do driver subir."""
+    if CATEGORY_IMAGES in BLOCK_PROFILES[profile]:
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+        options.add_argument("--blink-settings=imagesEnabled=false")
+    if CATEGORY_MEDIA in BLOCK_PROFILES[profile]:
+        options.add_argument("--autoplay-policy=user-gesture-required")
+
+
+def apply_blocking(driver, profile: str):
+    """Ativa o Network.setBlockedURLs do perfil na aba atual do driver."""
+    urls = blocked_urls(profile)
+    setattr(driver, BLOCKED_URLS_ATTR, urls)
+    if urls:
+        apply_to_current_tab(driver)
+        logger.debug("[BLOQUEIO] Perfil %s: %d padrões de URL bloqueados.", profile, len(urls))
+
+
+def apply_to_current_tab(driver):
+    """Reaplica os padrões do driver na aba corrente (chamar após abrir uma aba nova)."""
+    urls = getattr(driver, BLOCKED_URLS_ATTR, None)
+    if not urls:
+        return
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+    except Exception as e:
+        # drivers remotos/sem CDP seguem sem bloqueio por URL
+        logger.debug("[BLOQUEIO] CDP indisponível: %s", e)
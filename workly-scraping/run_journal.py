@@ -0,0 +1,129 @@
+"""
+Workly - Diário (journal) de checkpoint das execuções.
+
+Arquivo JSON Lines só de acréscimo: cada projeto concluído entra como
+{"op": "record", "link_hash", "data"} e cada lote confirmado no banco como
+{"op": "saved", "link_hashes"}. O fsync é feito em lotes (a cada
+`fsync_every` linhas ou `fsync_interval` segundos). Se a execução cair, o
+--resume relê o arquivo: grava no banco o que ficou pendente e pula os links
+já enriquecidos. Uma execução que termina com tudo gravado apaga o diário.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+logger = logging.getLogger("workly-scraper")
+
+DEFAULT_FSYNC_EVERY = 25
+DEFAULT_FSYNC_INTERVAL = 2.0  # segundos
+
+OP_RECORD = "record"
+OP_SAVED = "saved"
+
+
+class RunJournal:
+    def __init__(self, path: str, fsync_every: int = DEFAULT_FSYNC_EVERY,
+                 fsync_interval: float = DEFAULT_FSYNC_INTERVAL):
+        self.path = path
+        self.fsync_every = max(1, fsync_every)
+        self.fsync_interval = fsync_interval
+        self._file = None
+        self._lock = threading.Lock()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._pending: Set[str] = set()
+
+    def replay(self) -> Tuple[Dict[str, dict], Set[str]]:
+        """Lê o diário existente: (projetos ainda não gravados no banco, todos os link_hash concluídos)."""
+        records: Dict[str, dict] = {}
+        saved: Set[str] = set()
+        if not os.path.exists(self.path):
+            return {}, set()
+        with open(self.path, "r", encoding="utf-8") as f:
+            for n, line in enumerate(f, start=1):
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # última linha cortada por uma queda no meio da escrita
+                    logger.warning("[JOURNAL] Linha %d ilegível em %s; ignorada.", n, self.path)
+                    continue
+                if entry.get("op") == OP_RECORD:
+                    records[entry["link_hash"]] = entry["data"]
+                    saved.discard(entry["link_hash"])
+                elif entry.get("op") == OP_SAVED:
+                    saved.update(entry["link_hashes"])
+        pending = {h: p for h, p in records.items() if h not in saved}
+        with self._lock:
+            self._pending = set(pending)
+        return pending, set(records)
+
+    def open(self, resume: bool):
+        """Abre para acréscimo; sem `resume`, um diário antigo é descartado."""
+        if not resume and os.path.exists(self.path):
+            logger.info("[JOURNAL] Descartando diário anterior (%s); use --resume para retomá-lo.", self.path)
+            os.remove(self.path)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        if self._file.tell() and not self._ends_with_newline():
+            # isola a linha cortada para o próximo registro não ser colado nela
+            self._file.write("\n")
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _write(self, entry: dict, force_sync: bool = False):
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+            self._unsynced += 1
+            if (force_sync or self._unsynced >= self.fsync_every
+                    or time.monotonic() - self._last_sync >= self.fsync_interval):
+                self._sync_locked()
+
+    def _sync_locked(self):
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def append(self, link_hash: str, projeto: dict):
+        with self._lock:
+            self._pending.add(link_hash)
+        self._write({"op": OP_RECORD, "link_hash": link_hash, "data": projeto})
+
+    def mark_saved(self, link_hashes: Iterable[str]):
+        hashes = [h for h in link_hashes if h]
+        if not hashes:
+            return
+        with self._lock:
+            self._pending.difference_update(hashes)
+        self._write({"op": OP_SAVED, "link_hashes": hashes})
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def close(self, complete: Optional[bool] = None):
+        """Fecha com fsync. Se tudo foi gravado (ou `complete=True`), remove o diário."""
+        with self._lock:
+            if self._file is None:
+                return
+            if self._unsynced:
+                self._sync_locked()
+            self._file.close()
+            self._file = None
+            done = not self._pending if complete is None else complete
+        if done:
+            os.remove(self.path)
+        else:
+            logger.warning("[JOURNAL] %d projetos não confirmados no banco; retome com --resume (%s).",
+                           self.pending, self.path)
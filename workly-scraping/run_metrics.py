@@ -0,0 +1,159 @@
+"""
+Workly - Métricas de execução do scraper.
+
+Cronômetros por etapa (driver, scroll, "Ver mais", detalhe, cotação, banco),
+histogramas de latência por card e por página de detalhe e contadores. Ao fim
+de cada execução o relatório é gravado em JSON e no formato textfile do
+Prometheus (node_exporter --collector.textfile.directory).
+"""
+
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, Optional, Sequence
+
+METRICS_PREFIX = "workly_scraper"
+REPORT_FILENAME = "run_report.json"
+PROMETHEUS_FILENAME = "workly_scraper.prom"
+
+# segundos; cobre de um GET rápido a uma página Selenium lenta
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# contadores conhecidos (sempre presentes no relatório, mesmo zerados)
+COUNTERS = (
+    "cards_seen", "detail_navigations", "timeouts",
+    "db_rows_inserted", "db_rows_updated", "db_rows_unchanged", "near_duplicates", "errors",
+)
+
+
+class Histogram:
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # último = +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """Pares (limite, contagem acumulada), como nos buckets `le` do Prometheus."""
+        total = 0
+        for bound, n in zip((*self.buckets, float("inf")), self.counts):
+            total += n
+            yield bound, total
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "avg": round(self.sum / self.count, 6) if self.count else None,
+            "buckets": {("+Inf" if b == float("inf") else str(b)): n for b, n in self.cumulative()},
+        }
+
+
+class RunMetrics:
+    """Acumula as métricas de uma execução; seguro para uso entre threads."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started_at = datetime.utcnow()
+            self._started = time.monotonic()
+            self.counters = Counter({name: 0 for name in COUNTERS})
+            self.stages: Dict[str, float] = {}
+            self.histograms: Dict[str, Histogram] = {}
+
+    def inc(self, name: str, n: int = 1):
+        with self._lock:
+            self.counters[name] += n
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            hist = self.histograms.get(name)
+            if hist is None:
+                hist = self.histograms[name] = Histogram(self.buckets)
+            hist.observe(seconds)
+
+    def add_stage(self, name: str, seconds: float):
+        with self._lock:
+            self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, name: str, histogram: Optional[str] = None):
+        """Soma o tempo do bloco na etapa `name` (e, opcionalmente, num histograma)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.add_stage(name, elapsed)
+            if histogram:
+                self.observe(histogram, elapsed)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "started_at": self.started_at.isoformat(timespec="seconds") + "Z",
+                "duration_seconds": round(time.monotonic() - self._started, 3),
+                "stages_seconds": {k: round(v, 6) for k, v in sorted(self.stages.items())},
+                "counters": dict(sorted(self.counters.items())),
+                "histograms": {k: h.to_dict() for k, h in sorted(self.histograms.items())},
+            }
+
+    def to_prometheus(self, prefix: str = METRICS_PREFIX) -> str:
+        snap = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_run_duration_seconds Duração da última execução.",
+            f"# TYPE {prefix}_run_duration_seconds gauge",
+            f"{prefix}_run_duration_seconds {snap['duration_seconds']}",
+            f"# HELP {prefix}_last_run_timestamp_seconds Fim da última execução (epoch).",
+            f"# TYPE {prefix}_last_run_timestamp_seconds gauge",
+            f"{prefix}_last_run_timestamp_seconds {time.time():.0f}",
+            f"# HELP {prefix}_stage_seconds Tempo gasto por etapa na última execução.",
+            f"# TYPE {prefix}_stage_seconds gauge",
+        ]
+        lines += [f'{prefix}_stage_seconds{{stage="{k}"}} {v}' for k, v in snap["stages_seconds"].items()]
+        for name, value in snap["counters"].items():
+            lines += [f"# TYPE {prefix}_{name} gauge", f"{prefix}_{name} {value}"]
+        with self._lock:
+            histograms = sorted(self.histograms.items())
+            for name, hist in histograms:
+                metric = f"{prefix}_{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for bound, total in hist.cumulative():
+                    le = "+Inf" if bound == float("inf") else repr(bound)
+                    lines.append(f'{metric}_bucket{{le="{le}"}} {total}')
+                lines += [f"{metric}_sum {hist.sum:.6f}", f"{metric}_count {hist.count}"]
+        return "\n".join(lines) + "\n"
+
+    def write_reports(self, directory: str) -> dict:
+        """Grava o JSON e o textfile do Prometheus (troca atômica, sem leitura parcial)."""
+        os.makedirs(directory, exist_ok=True)
+        report = self.snapshot()
+        _atomic_write(os.path.join(directory, REPORT_FILENAME),
+                      json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+        _atomic_write(os.path.join(directory, PROMETHEUS_FILENAME), self.to_prometheus())
+        return report
+
+
+def _atomic_write(path: str, content: str):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp, path)
+
+
+# instância da execução corrente (como o logger, compartilhada pelos módulos)
+metrics = RunMetrics()
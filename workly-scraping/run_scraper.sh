@@ -1,3 +1,3 @@
 #!/bin/bash
 cd /app
-python main.py
\ No newline at end of file
+exec python cli.py scrape "$@"
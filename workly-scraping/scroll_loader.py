@@ -0,0 +1,86 @@
+"""
+Workly - Carregamento do scroll infinito da listagem orientado a eventos.
+
+Em vez de dormir um tempo fixo após cada rolagem, injeta um MutationObserver
+que responde assim que novos cards aparecem (ou após um timeout curto). Sem
+novos cards, o timeout cresce exponencialmente; o fim é declarado quando a
+contagem de cards fica estável por `stable_rounds` passos seguidos.
+"""
+
+import logging
+import time
+
+logger = logging.getLogger("workly-scraper")
+
+DEFAULT_ITEM_SELECTOR = "div.project-item"
+DEFAULT_SETTLE_TIMEOUT = 0.75  # segundos
+DEFAULT_MAX_SETTLE_TIMEOUT = 6.0
+DEFAULT_STABLE_ROUNDS = 2
+
+COUNT_ITEMS_JS = "return document.querySelectorAll(arguments[0]).length;"
+SCROLL_TO_END_JS = "window.scrollTo(0, document.body.scrollHeight);"
+
+# Resolve com a nova contagem assim que ela passar de `before`, ou no timeout.
+WAIT_FOR_ITEMS_JS = """
+const selector = arguments[0], before = arguments[1], timeoutMs = arguments[2];
+const done = arguments[arguments.length - 1];
+const count = () => document.querySelectorAll(selector).length;
+if (count() > before) { done(count()); return; }
+let timer = null;
+const observer = new MutationObserver(() => {
+    if (count() > before) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(count());
+    }
+});
+observer.observe(document.body, {childList: true, subtree: true});
+timer = setTimeout(() => { observer.disconnect(); done(count()); }, timeoutMs);
+"""
+
+
+def count_items(driver, selector: str = DEFAULT_ITEM_SELECTOR) -> int:
+    return driver.execute_script(COUNT_ITEMS_JS, selector)
+
+
+def wait_for_new_items(driver, before: int, timeout: float, selector: str = DEFAULT_ITEM_SELECTOR) -> int:
+    """Bloqueia até surgirem cards além de `before` (ou até `timeout`) e retorna a contagem."""
+    return driver.execute_async_script(WAIT_FOR_ITEMS_JS, selector, before, int(timeout * 1000))
+
+
+def scroll_until_end(driver, max_attempts: int, selector: str = DEFAULT_ITEM_SELECTOR,
+                     settle_timeout: float = DEFAULT_SETTLE_TIMEOUT,
+                     max_settle_timeout: float = DEFAULT_MAX_SETTLE_TIMEOUT,
+                     stable_rounds: int = DEFAULT_STABLE_ROUNDS) -> bool:
+    """
+    Rola até o fim da listagem, até max_attempts passos.
+    Retorna True se a contagem de cards estabilizou (fim natural da lista).
+    """
+    driver.set_script_timeout(max_settle_timeout + 5)
+    timeout = settle_timeout
+    stable = 0
+    total = count_items(driver, selector)
+    started = time.time()
+
+    for step in range(1, max_attempts + 1):
+        step_started = time.time()
+        before = total
+        driver.execute_script(SCROLL_TO_END_JS)
+        total = wait_for_new_items(driver, before, timeout, selector)
+        gained = total - before
+        logger.info("[SCROLL] passo %d: +%d cards (total %d) em %.2fs (timeout %.2fs)",
+                    step, gained, total, time.time() - step_started, timeout)
+
+        if gained > 0:
+            stable = 0
+            timeout = settle_timeout
+            continue
+
+        stable += 1
+        if stable >= stable_rounds:
+            logger.info("[SCROLL] Lista estável após %d passos (%d cards, %.1fs).", step, total, time.time() - started)
+            return True
+        timeout = min(timeout * 2, max_settle_timeout)
+
+    logger.info("[SCROLL] Limite de passos atingido (%d cards, %.1fs).", total, time.time() - started)
+    return False
@@ -0,0 +1,45 @@
+"""
+Workly - Vetor de busca textual (scraped_jobs.search_vector).
+
+O tsvector é calculado no próprio INSERT/upsert do scraper (e na carga em
+massa), a partir de título, skills e descrição, com os dicionários portuguese
+(radicais: "desenvolvedor" casa com "desenvolvimento") e simple (termos
+exatos, como nomes de tecnologias). O link "Ver mais" no fim da descrição é
+removido só do texto indexado, como no backfill da V9 e em
+listing_parser.strip_ver_mais; as colunas gravadas ficam como vieram. O índice GIN vem da migração V9.
+"""
+
+from typing import Dict, List
+
+SEARCH_VECTOR_COLUMN = "search_vector"
+SEARCH_CONFIGS = ("portuguese", "simple")
+# coluna -> peso no ranking (A pesa mais)
+SEARCH_WEIGHTS = (("title", "A"), ("skills", "B"), ("description", "C"))
+
+# colunas cujo texto indexado perde o "Ver mais" final (mesma expressão da V9)
+SEARCH_CLEANED_COLUMNS = ("description",)
+VER_MAIS_SUFFIX_SQL = r"'\s*\m(ver|mostrar) (mais|menos)( detalhes)?\M\s*$'"
+
+
+def _indexed_text(column: str, ref: str) -> str:
+    if column in SEARCH_CLEANED_COLUMNS:
+        return f"regexp_replace({ref}, {VER_MAIS_SUFFIX_SQL}, '', 'i')"
+    return ref
+
+
+def search_vector_sql(refs: Dict[str, str]) -> str:
+    """
+    Expressão SQL do tsvector. `refs` diz como referenciar cada coluna de
+    SEARCH_WEIGHTS: o nome da coluna (INSERT ... SELECT) ou "%s" (VALUES, com
+    os parâmetros na ordem de `search_vector_params`).
+    """
+    return " || ".join(
+        f"setweight(to_tsvector('{config}', coalesce({_indexed_text(column, refs[column])}, '')), '{weight}')"
+        for column, weight in SEARCH_WEIGHTS
+        for config in SEARCH_CONFIGS
+    )
+
+
+def search_vector_params(values: Dict[str, str]) -> List[str]:
+    """Parâmetros de `search_vector_sql` com placeholders, na ordem em que aparecem."""
+    return [values[column] for column, _ in SEARCH_WEIGHTS for _ in SEARCH_CONFIGS]
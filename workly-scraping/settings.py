@@ -0,0 +1,32 @@
+"""
+Workly - Configuração compartilhada (.env, banco e logging).
+
+Só biblioteca padrão e python-dotenv: importado pela CLI antes de qualquer
+subcomando, então não pode puxar Selenium, requests ou psycopg2.
+"""
+
+import logging
+import os
+
+from dotenv import load_dotenv
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+load_dotenv(dotenv_path=os.path.join(BASE_DIR, ".env"), override=True)
+
+DB_CONFIG = {
+    "dbname": os.getenv("DB_NAME"),
+    "user": os.getenv("DB_USER"),
+    "password": os.getenv("DB_PASSWORD"),
+    "host": os.getenv("DB_HOST"),
+    "port": os.getenv("DB_PORT", "5432"),
+}
+
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(message)s"
+
+
+def setup_logging(log_file: str = None, level: int = logging.INFO):
+    """Configura o logging da execução; o arquivo de log só é aberto aqui, nunca no import."""
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.insert(0, logging.FileHandler(log_file, encoding="utf-8"))
+    logging.basicConfig(level=level, format=LOG_FORMAT, handlers=handlers)
@@ -0,0 +1,24 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(ROOT, "benchmarks", "fixtures")
+# os módulos do scraper são scripts soltos na raiz de workly-scraping
+sys.path.insert(0, ROOT)
+
+
+def read_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture
+def listing_html() -> str:
+    return read_fixture("listing.html")
+
+
+@pytest.fixture
+def detail_html() -> str:
+    return read_fixture("detail.html")
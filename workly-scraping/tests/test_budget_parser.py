@@ -0,0 +1,65 @@
+import json
+import os
+
+import pytest
+
+from budget_parser import CURRENCY_UNKNOWN, parse_budget, parse_budgets, parse_number, tratar_orcamento
+from conftest import ROOT
+from normalize import normalize_value
+
+DATA_DIR = os.path.join(ROOT, "benchmarks", "data")
+
+
+def load_corpus(name: str):
+    with open(os.path.join(DATA_DIR, name), encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("case", load_corpus("budget_corpus.json"), ids=lambda c: c["text"] or "<vazio>")
+def test_budget_corpus(case):
+    budget = parse_budget(case["text"])
+    assert (budget.currency, budget.minimum, budget.maximum, budget.hourly) == (
+        case["currency"], case["min"], case["max"], case["hourly"]
+    )
+
+
+@pytest.mark.parametrize("case", load_corpus("normalize_corpus.json"), ids=lambda c: f"{c['type']}:{c['value']!r}")
+def test_normalize_corpus(case):
+    assert normalize_value(case["value"], case["type"]) == case["expected"]
+
+
+@pytest.mark.parametrize("text, currency", [
+    ("USD50", "USD"),  # regressão: o parser antigo (startswith) reconhecia o código colado ao valor
+    ("Menos de USD50", "USD"),
+    ("BRL1.500", "BRL"),
+    ("R$500", "BRL"),
+    ("USDT 50", CURRENCY_UNKNOWN),
+])
+def test_currency_code_next_to_value(text, currency):
+    assert parse_budget(text).currency == currency
+
+
+@pytest.mark.parametrize("value, target_type, expected", [
+    ("USD 1,000", "float", 1000.0),
+    ("1.500,00", "float", 1500.0),
+    ("R$ 1.500,00", "float", 1500.0),
+    ("Propostas: 0", "int", 0),
+    ("None", "int", None),
+    ("null", "str", None),
+    (None, "float", None),
+])
+def test_normalize_value_budget_formats(value, target_type, expected):
+    assert normalize_value(value, target_type) == expected
+
+
+def test_parse_number_separators():
+    assert parse_number("1.500") == 1500.0
+    assert parse_number("1,5") == 1.5
+    assert parse_number("-") is None
+
+
+def test_batch_matches_single_and_legacy_interface():
+    textos = ["USD 15 - 45 / hora", "R$ 1.500 - 3.000", None, "Mais de USD 5,000"]
+    assert parse_budgets(textos) == [parse_budget(t or "") for t in textos]
+    assert tratar_orcamento("USD 15 - 45 / hora")[:3] == ("USD", 15.0, 45.0)
+    assert parse_budget("USD 15 - 45 / hora").hourly
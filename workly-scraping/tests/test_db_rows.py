@@ -0,0 +1,27 @@
+from workana_scraper import DB_COLUMNS, build_db_row
+
+PROJETO = {
+    "Título": "API REST em Python",
+    "Link": "https://www.workana.com/job/api-rest-em-python",
+    "Descrição": "Desenvolvimento de API REST em Python e PostgreSQL.",
+    "Habilidades": "Python | PostgreSQL",
+    "Orçamento Original": "USD 250 - 500",
+    "Propostas": "Propostas: 12",
+}
+
+CONTENT_HASH = DB_COLUMNS.index("content_hash")
+PROPOSALS = DB_COLUMNS.index("proposals")
+
+
+def test_proposals_stay_out_of_the_fingerprint():
+    row = build_db_row(PROJETO)
+    later = build_db_row(dict(PROJETO, Propostas="Propostas: 40"))
+    assert (row[PROPOSALS], later[PROPOSALS]) == (12, 40)
+    assert row[CONTENT_HASH] == later[CONTENT_HASH]
+
+
+def test_fingerprint_changes_with_content_not_whitespace():
+    row = build_db_row(PROJETO)
+    assert build_db_row(dict(PROJETO, Descrição="  Desenvolvimento de API REST\nem Python e PostgreSQL. "))[CONTENT_HASH] \
+        == row[CONTENT_HASH]
+    assert build_db_row(dict(PROJETO, **{"Orçamento Original": "USD 500 - 1000"}))[CONTENT_HASH] != row[CONTENT_HASH]
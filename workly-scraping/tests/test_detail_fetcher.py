@@ -0,0 +1,54 @@
+from detail_fetcher import FIELD_DESCRIPTION, CachingDetailFetcher
+from detail_parser import DetailPage, parse_detail_html
+from listing_parser import parse_listing_html
+from workana_scraper import build_project, enrich_cards, generate_link_hash
+
+
+class CountingFetcher:
+    """Fetcher de detalhe falso: devolve a página salva e conta as navegações."""
+
+    def __init__(self, page: DetailPage):
+        self.page = page
+        self.calls = 0
+
+    def fetch(self, link, fields=None):
+        self.calls += 1
+        return self.page
+
+    def log_stats(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_saved_navigations_match_inner_fetcher(listing_html, detail_html):
+    page = parse_detail_html(detail_html)
+    stubs = parse_listing_html(listing_html)
+
+    # sem cache nem pré-carregamento: cada leitura de build_project é uma navegação
+    baseline = CountingFetcher(page)
+    for stub in stubs:
+        build_project(dict(stub), baseline, 5.0)
+
+    inner = CountingFetcher(page)
+    cache = CachingDetailFetcher(inner, generate_link_hash)
+    projetos = enrich_cards([dict(stub) for stub in stubs], cache, 5.0, workers=1)
+
+    assert len(projetos) == len(stubs)
+    assert inner.calls == cache.pages
+    assert cache.saved == baseline.calls - inner.calls
+    assert cache.hits > cache.saved
+
+
+def test_repeated_link_is_served_from_cache(detail_html):
+    inner = CountingFetcher(parse_detail_html(detail_html))
+    cache = CachingDetailFetcher(inner, generate_link_hash)
+    link = "https://www.workana.com/job/api-graphql-go?ref=projects_12"
+
+    cache.fetch(link, [FIELD_DESCRIPTION])
+    cache.fetch(link, [FIELD_DESCRIPTION])  # leitura do pré-carregamento
+    cache.fetch(link + "&utm=x", [FIELD_DESCRIPTION])
+
+    assert inner.calls == 1
+    assert (cache.hits, cache.saved) == (2, 1)
@@ -0,0 +1,71 @@
+import time
+
+from near_duplicates import (
+    DEFAULT_THRESHOLD, DESCRIPTION_WORDS, NUM_BINS, NearDuplicateIndex, signature, similarity,
+)
+
+TITLE = "Desenvolvedor Python para API REST com Django"
+DESCRIPTION = (
+    "Preciso de um desenvolvedor para criar uma API REST com Django REST Framework, autenticação JWT e "
+    "integração com PostgreSQL. A API terá endpoints de cadastro de clientes, pedidos e relatórios, com "
+    "paginação e filtros. Entregáveis: código no GitHub, documentação OpenAPI e deploy em Docker."
+)
+OTHER_TITLE = "Aplicativo Flutter para delivery"
+OTHER_DESCRIPTION = (
+    "App de delivery com cadastro de produtos, carrinho, pagamento via Pix e painel administrativo para "
+    "o restaurante acompanhar pedidos, entregadores e relatórios de vendas por dia da semana."
+)
+
+
+def test_identical_text_has_full_similarity():
+    assert similarity(signature(TITLE, DESCRIPTION), signature(TITLE, DESCRIPTION)) == 1.0
+
+
+def test_short_text_is_not_signed():
+    assert signature("Site institucional", "") is None
+
+
+def test_card_excerpt_signs_like_full_description():
+    words = DESCRIPTION.split()
+    excerpt = " ".join(words[:DESCRIPTION_WORDS + 5]) + "... Ver mais"
+    assert signature(TITLE, excerpt) == signature(TITLE, DESCRIPTION)
+
+
+def test_threshold_separates_repost_from_different_job():
+    index = NearDuplicateIndex()
+    assert index.check("original", TITLE, DESCRIPTION) is None
+
+    # repostagem: outra caixa e pontuação e uma palavra trocada
+    repost = DESCRIPTION.upper().replace(",", "").replace("CADASTRO", "REGISTRO")
+    score = similarity(signature(TITLE, DESCRIPTION), signature(TITLE, repost))
+    assert DEFAULT_THRESHOLD <= score < 1.0
+    assert index.check("repost", TITLE, repost) == "original"
+
+    assert similarity(signature(TITLE, DESCRIPTION), signature(OTHER_TITLE, OTHER_DESCRIPTION)) < DEFAULT_THRESHOLD
+    assert index.check("other", OTHER_TITLE, OTHER_DESCRIPTION) is None
+    assert len(index) == 2
+
+
+def test_threshold_is_inclusive_and_configurable():
+    sig = signature(TITLE, DESCRIPTION)
+    changed = sig[:NUM_BINS // 2] + tuple(v + 1 for v in sig[NUM_BINS // 2:])
+    assert similarity(sig, changed) == 0.5
+
+    strict = NearDuplicateIndex(threshold=0.9)
+    strict.add("a", sig)
+    assert strict.query(changed) is None
+
+    loose = NearDuplicateIndex(threshold=0.5)
+    loose.add("a", sig)
+    assert loose.query(changed) == ("a", 0.5)
+
+
+def test_prune_drops_entries_outside_window():
+    index = NearDuplicateIndex(window_hours=1)
+    now = time.time()
+    index.add("old", signature(TITLE, DESCRIPTION), now - 2 * 3600)
+    index.add("new", signature(OTHER_TITLE, OTHER_DESCRIPTION), now)
+
+    assert index.prune(now) == 1
+    assert "old" not in index and "new" in index
+    assert index.check("repost", TITLE, DESCRIPTION) is None
@@ -0,0 +1,110 @@
+import re
+
+import pytest
+import requests
+
+import page_crawler
+from page_crawler import MAX_FAILED_PAGES, PAGE_RETRIES, crawl_queries
+from query_planner import plan_queries
+from workana_scraper import iter_listing_pages, merge_listings
+
+QUERIES = plan_queries(["java", "python"], ["it-programming"], ["1d"])
+_PAGE = re.compile(r"[?&]page=(\d+)")
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(page_crawler, "PAGE_RETRY_BACKOFF", 0)
+
+
+class FakeListing:
+    """Listagem falsa: `last` páginas com cards próprios; depois repete a última, como a Workana."""
+
+    def __init__(self, last=3, cards=3, failures=None):
+        self.last = last
+        self.cards = cards
+        self.failures = dict(failures or {})  # página -> quantas vezes falha antes de carregar
+        self.calls = {}
+
+    def __call__(self, url):
+        match = _PAGE.search(url)
+        page = int(match.group(1)) if match else 1
+        self.calls[page] = self.calls.get(page, 0) + 1
+        if self.failures.get(page, 0) > 0:
+            self.failures[page] -= 1
+            raise requests.Timeout(url)
+        query = "java" if "query=java" in url else "python"
+        page = min(page, self.last)
+        return [{"link": f"/job/{query}-{page}-{i}"} for i in range(self.cards)]
+
+
+def crawl(fetch, queries=QUERIES[:1], concurrency=3, max_pages=20):
+    return [(q.label, [c["link"] for c in cards]) for q, cards in
+            crawl_queries(queries, fetch, concurrency, lambda link: link, max_pages)]
+
+
+def test_stops_at_first_page_without_new_links():
+    fetch = FakeListing(last=3)
+    pages = crawl(fetch)
+
+    assert [links[0] for _, links in pages] == ["/job/java-1-0", "/job/java-2-0", "/job/java-3-0"]
+    # a página 4 (repetida) encerra; além dela, no máximo a janela já disparada
+    assert max(fetch.calls) <= 4 + 3
+
+
+def test_stops_at_max_pages():
+    pages = crawl(FakeListing(last=50), max_pages=5)
+    assert len(pages) == 5
+
+
+def test_empty_page_ends_listing():
+    pages = crawl(FakeListing(last=2, cards=0))
+    assert pages == []
+
+
+def test_transient_failure_is_retried():
+    fetch = FakeListing(last=3, failures={2: PAGE_RETRIES})
+    pages = crawl(fetch)
+
+    assert len(pages) == 3
+    assert fetch.calls[2] == PAGE_RETRIES + 1
+
+
+def test_failed_page_is_skipped_not_end_of_listing():
+    fetch = FakeListing(last=4, failures={2: PAGE_RETRIES + 1})
+    pages = crawl(fetch)
+
+    assert [links[0] for _, links in pages] == ["/job/java-1-0", "/job/java-3-0", "/job/java-4-0"]
+    assert fetch.calls[2] == PAGE_RETRIES + 1
+
+
+def test_consecutive_failures_abort_query():
+    failures = {page: PAGE_RETRIES + 1 for page in range(2, 2 + MAX_FAILED_PAGES)}
+    pages = crawl(FakeListing(last=10, failures=failures), concurrency=1)
+
+    assert [links[0] for _, links in pages] == ["/job/java-1-0"]
+
+
+def test_queries_crawled_together_in_page_order():
+    pages = crawl(FakeListing(last=3), queries=QUERIES, concurrency=4)
+
+    for query in QUERIES:
+        own = [links[0] for label, links in pages if label == query.label]
+        assert own == [f"/job/{query.language}-{page}-0" for page in (1, 2, 3)]
+
+
+def test_links_shared_between_queries_counted_once(caplog):
+    def fetch(url):
+        return FakeListing(last=1)(url) + [{"link": "/job/shared"}]
+
+    caplog.set_level("INFO", logger="workly-scraper")
+    streamed = [stub["link"] for stubs in iter_listing_pages(QUERIES, fetch, 4) for stub in stubs]
+    streamed_log = [r.getMessage() for r in caplog.records if r.getMessage().startswith("[CONSULTAS]")]
+    caplog.clear()
+    merged = [stub["link"] for stub in merge_listings(QUERIES, [fetch(q.url) for q in QUERIES])]
+    merged_log = [r.getMessage() for r in caplog.records if r.getMessage().startswith("[CONSULTAS]")]
+
+    assert streamed.count("/job/shared") == merged.count("/job/shared") == 1
+    assert sorted(streamed) == sorted(merged)
+    assert streamed_log == merged_log
+    assert merged_log[1].endswith("4 cards, 3 novos na execução.")
@@ -0,0 +1,71 @@
+import pytest
+
+from detail_parser import ALL_FIELDS, parse_detail_html
+from listing_parser import parse_listing_html, strip_ver_mais
+
+
+def test_listing_fixture_cards(listing_html):
+    cards = parse_listing_html(listing_html)
+
+    assert len(cards) == 12
+    assert [c["idx"] for c in cards] == list(range(1, 13))
+    assert all(c["titulo"] and c["link"].startswith("https://www.workana.com/job/") for c in cards)
+    assert cards[0] == {
+        "idx": 1,
+        "titulo": "Desenvolvedor Python para API REST com Django",
+        "link": "https://www.workana.com/job/desenvolvedor-python-api-rest-django?ref=projects_1",
+        "descricao": "Preciso de um desenvolvedor para criar uma API REST com Django REST Framework, "
+                     "autenticação JWT e integração com PostgreSQL.",
+        "habilidades": ["Python", "Django", "PostgreSQL"],
+        "orcamento": "USD 250 - 500",
+        "propostas": "Propostas: 7",
+        "ver_mais": True,
+    }
+
+
+def test_listing_ver_mais_link_is_not_part_of_description(listing_html):
+    cards = parse_listing_html(listing_html)
+
+    assert [c["idx"] for c in cards if c["ver_mais"]] == [1, 4, 5, 8, 10]
+    assert not any(c["descricao"].lower().endswith(("ver mais", "ver mais detalhes")) for c in cards)
+
+
+def test_listing_relative_link_uses_base_url():
+    html = '<div class="project-item"><h2><a href="/job/x?ref=1">Título</a></h2></div>'
+    (card,) = parse_listing_html(html, base_url="https://example.test/jobs")
+
+    assert card["link"] == "https://example.test/job/x?ref=1"
+    assert card["titulo"] == "Título"
+    assert (card["descricao"], card["habilidades"], card["orcamento"]) == ("", [], "")
+
+
+def test_listing_without_cards():
+    assert parse_listing_html("<html><body><p>Nenhum projeto</p></body></html>") == []
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Preciso de um site... Ver mais", "Preciso de um site..."),
+    ("Integração com ERP. Ver mais detalhes", "Integração com ERP."),
+    ("Quero ver mais vendas no site", "Quero ver mais vendas no site"),
+    ("App de delivery ver menos ", "App de delivery"),
+    ("", ""),
+    (None, None),
+])
+def test_strip_ver_mais(text, expected):
+    assert strip_ver_mais(text) == expected
+
+
+def test_detail_fixture(detail_html):
+    page = parse_detail_html(detail_html)
+
+    assert page.descricao.startswith("Preciso de um desenvolvedor para criar uma API REST")
+    assert page.descricao.endswith("deploy em Docker.")
+    assert page.habilidades == ["Python", "Django", "PostgreSQL", "Docker"]
+    assert page.orcamento == "R$ 1.500 - 3.000"
+    assert page.missing(ALL_FIELDS) == []
+
+
+def test_detail_empty_page_reports_missing_fields():
+    page = parse_detail_html("<html><body></body></html>")
+
+    assert page.missing(ALL_FIELDS) == list(ALL_FIELDS)
@@ -1,194 +1,108 @@
 """
 Workly - Scraper híbrido (Selenium) para Workana (categoria TI/Programação)
 - Uso:
-    python main.py --linguagem java
-    python main.py            # busca todas as vagas TI (modo padrão)
+    python cli.py scrape --linguagem java
+    python cli.py scrape      # busca todas as vagas TI (modo padrão)
 """
 
 import os
 import time
-import re
-import csv
 import hashlib
+import itertools
 import logging
-import requests
+import random
+import signal
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Tuple
-from urllib.parse import urlparse, urlunparse
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
 
-from dotenv import load_dotenv
-from selenium import webdriver
 from selenium.common.exceptions import (
     NoSuchElementException, TimeoutException, WebDriverException, StaleElementReferenceException
 )
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
 
 import psycopg2
 from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
+
+from detail_fetcher import (
+    DEFAULT_HTTP_POOL_SIZE, DETAIL_BACKENDS, FIELD_BUDGET, FIELD_DESCRIPTION, FIELD_SKILLS,
+    CachingDetailFetcher, ListingOnlyFetcher, SeleniumDetailFetcher, build_detail_fetcher,
+)
+from exchange_rates import RateLookup, get_usd_brl_quote, reconvert_usd_budgets, record_rate
+from driver_factory import CHROME_DEBUGGER_ADDRESS, create_driver
+from driver_pool import DriverPool, PooledSeleniumDetailFetcher
+from budget_parser import tratar_orcamento
+from bulk_loader import copy_merge
+from db_writer import DEFAULT_BATCH_SIZE, DEFAULT_FLUSH_INTERVAL, BatchedDBWriter
+from job_skills import replace_job_skills
+from language_matcher import MATCHES_KEY, LanguageMatcher
+from listing_parser import CARD_SELECTOR, parse_listing_html, strip_ver_mais
+from page_crawler import (
+    DEFAULT_MAX_PAGES, LISTING_BACKENDS, LISTING_MODE_PAGES, LISTING_MODES,
+    HttpListingFetcher, crawl_queries,
+)
+from project_csv import CSV_FILENAME, PARTIAL_KEY, load_csv, save_csv
+from normalize import generate_link_hash, normalize_url_for_hash, normalize_value
+from near_duplicates import DEFAULT_WINDOW_HOURS as DEFAULT_DUPLICATE_WINDOW_HOURS, NearDuplicateIndex, load_recent
+from resource_blocking import BLOCK_PROFILES, DEFAULT_BLOCK_PROFILE
+from run_metrics import metrics
+from run_journal import RunJournal
+from search_index import SEARCH_VECTOR_COLUMN, search_vector_params, search_vector_sql
+from query_planner import DEFAULT_CATEGORIES, DEFAULT_PUBLICATIONS, ListingQuery, plan_queries
+from scroll_loader import scroll_until_end
+from settings import BASE_DIR, DB_CONFIG, setup_logging
 
 # -----------------------
 # Config & Environment
 # -----------------------
-BASE_DIR = os.path.dirname(__file__)
-env_path = os.path.join(BASE_DIR, ".env")
-load_dotenv(dotenv_path=env_path, override=True)
-
-DB_CONFIG = {
-    "dbname": os.getenv("DB_NAME"),
-    "user": os.getenv("DB_USER"),
-    "password": os.getenv("DB_PASSWORD"),
-    "host": os.getenv("DB_HOST"),
-    "port": os.getenv("DB_PORT", "5432"),
-}
-
-# URLs
-URL_TEMPLATE = "https://www.workana.com/jobs?category=it-programming&language=pt&publication=1d&query={query}"
-URL_ALL_TI = "https://www.workana.com/jobs?category=it-programming&language=pt&publication=1d"
+# .env e DB_CONFIG: ver settings
 
 # Defaults
-CSV_FILENAME = "projetos_workana.csv"
 LOG_FILE = "workana_scraper.log"
 ERROR_LOG = "workana_scraper_errors.log"
-DEFAULT_USD_TO_BRL = 5.60
 DEFAULT_MAX_SCROLL_ATTEMPTS = 15
 DEFAULT_WAIT_SHORT = 2
 DEFAULT_WAIT_MED = 4
 DEFAULT_WAIT_LONG = 8
-COTACAO_CACHE = os.path.join(BASE_DIR, "usd_brl_cache.txt")
-CACHE_TTL_SECONDS = 3600  # 1 hora
+DEFAULT_DETAIL_BACKEND = "http"
+DEFAULT_WORKERS = 4
+DEFAULT_KNOWN_WINDOW_HOURS = 48
+LAST_SEEN_GRANULARITY_MINUTES = 30  # last_seen_at só é regravado se estiver mais velho que isso
+RATE_ID_KEY = "exchange_rate_id"  # id da cotação (exchange_rates) usada na conversão
+DUPLICATE_KEY = "duplicate_of"  # link_hash da vaga original de uma quase duplicata
+DEFAULT_DAEMON_INTERVAL = 3600  # 1 hora
+DEFAULT_DAEMON_JITTER = 0.1
+DEFAULT_RECYCLE_EVERY = 12
+DB_POOL_MAX_CONNECTIONS = 4
+ENGINE_SELENIUM = "selenium"
+ENGINE_ASYNC = "async"
+DEFAULT_ASYNC_CONCURRENCY = 32
+METRICS_DIR = os.getenv("METRICS_DIR", os.path.join(BASE_DIR, "metrics"))
+# Diário de checkpoint (projetos concluídos e ainda não confirmados no banco)
+JOURNAL_FILE = os.getenv("JOURNAL_FILE", os.path.join(BASE_DIR, "run_journal.jsonl"))
+
+# Perfil de bloqueio de recursos do Chromium (ver resource_blocking.BLOCK_PROFILES)
+BLOCK_PROFILE = os.getenv("BLOCK_PROFILE", DEFAULT_BLOCK_PROFILE)
 
 # Headless forced (per your request)
 FORCE_HEADLESS = True
 
 # -----------------------
-# Logging
+# Logging (configurado em main(), não no import)
 # -----------------------
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_FILE, encoding="utf-8"),
-        logging.StreamHandler()
-    ]
-)
 logger = logging.getLogger("workly-scraper")
 
-# -----------------------
-# Utilities
-# -----------------------
-def normalize_value(value, target_type="str"):
-    """Normalize/convert values safely. Returns None when value is empty/non-convertible."""
-    if value in ("", None, "None", "null"):
-        return None
-    try:
-        if target_type == "int":
-            # extract digits
-            if isinstance(value, str):
-                m = re.search(r"\d+", value)
-                if not m:
-                    return None
-                return int(m.group(0))
-            return int(value)
-        elif target_type == "float":
-            if isinstance(value, str):
-                # remove currency symbols and whitespace
-                v = re.sub(r"[^\d\.,-]", "", value).strip()
-                if not v:
-                    return None
-                # normalize comma decimal
-                v = v.replace(".", "").replace(",", ".") if v.count(",") and v.count(".") == 0 else v.replace(",", "")
-                return float(v)
-            return float(value)
-        elif target_type == "str":
-            return str(value).strip()
-    except (ValueError, TypeError):
-        return None
-    return value
-
-def normalize_url_for_hash(url: str) -> str:
-    """Remove query/fragment and trailing slash, lowercase host."""
-    if not url:
-        return ""
-    parsed = urlparse(url)
-    scheme = parsed.scheme or "https"
-    netloc = parsed.netloc.lower()
-    path = parsed.path.rstrip("/") or "/"
-    clean = urlunparse((scheme, netloc, path, "", "", ""))
-    return clean
-
-def generate_link_hash(link: str) -> str:
-    clean = normalize_url_for_hash(link)
-    return hashlib.sha256(clean.encode("utf-8")).hexdigest()
-
-def get_cached_usd_brl():
-    try:
-        if os.path.exists(COTACAO_CACHE):
-            with open(COTACAO_CACHE, "r", encoding="utf-8") as f:
-                ts, rate = f.read().split(",")
-                if (time.time() - float(ts)) < CACHE_TTL_SECONDS:
-                    return float(rate)
-    except Exception:
-        pass
-    return None
-
-def set_cached_usd_brl(rate: float):
-    try:
-        with open(COTACAO_CACHE, "w", encoding="utf-8") as f:
-            f.write(f"{time.time()},{rate}")
-    except Exception:
-        pass
-
-def get_usd_brl_rate(timeout: int = 6) -> float:
-    """Tries multiple sources and caches rate for CACHE_TTL_SECONDS."""
-    cached = get_cached_usd_brl()
-    if cached:
-        logger.info("[COTAÇÃO] Usando cotação em cache: 1 USD = %s BRL", cached)
-        return cached
-
-    # Try AwesomeAPI
-    try:
-        r = requests.get("https://economia.awesomeapi.com.br/json/last/USD-BRL", timeout=timeout)
-        rate = float(r.json()["USDBRL"]["bid"])
-        logger.info("[COTAÇÃO] AwesomeAPI: 1 USD = %s BRL", rate)
-        set_cached_usd_brl(rate)
-        return rate
-    except Exception:
-        logger.debug("AwesomeAPI falhou; tentando Frankfurter...")
-
-    try:
-        r = requests.get("https://api.frankfurter.app/latest?from=USD&to=BRL", timeout=timeout)
-        rate = float(r.json()["rates"]["BRL"])
-        logger.info("[COTAÇÃO] Frankfurter: 1 USD = %s BRL", rate)
-        set_cached_usd_brl(rate)
-        return rate
-    except Exception:
-        logger.warning("APIs de câmbio falharam; usando fallback.")
-
-    logger.info("[COTAÇÃO] Usando fallback fixo: 1 USD = %s BRL", DEFAULT_USD_TO_BRL)
-    set_cached_usd_brl(DEFAULT_USD_TO_BRL)
-    return DEFAULT_USD_TO_BRL
-
 # -----------------------
 # Selenium driver setup
 # -----------------------
-def setup_driver(headless: bool = True):
-    options = webdriver.ChromeOptions()
-    if headless:
-        options.add_argument("--headless=new")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--log-level=3")
-    # Optional: reduce load by disabling images (uncomment if needed)
-    # prefs = {"profile.managed_default_content_settings.images": 2}
-    # options.add_experimental_option("prefs", prefs)
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-    return driver
+def setup_driver(headless: bool = True, block_profile: str = BLOCK_PROFILE):
+    """Binários resolvidos uma vez e em cache (ver driver_factory); anexa a CHROME_DEBUGGER_ADDRESS se definido."""
+    return create_driver(headless=headless, block_profile=block_profile)
 
 # -----------------------
 # Scraper helpers
@@ -205,75 +119,15 @@ def safe_find_text(el, selectors: List[str]) -> str:
             continue
     return ""
 
-def tratar_orcamento(orcamento_texto: str):
-    """Retorna (moeda, minimo, maximo, texto_normalizado)"""
-    if not orcamento_texto:
-        return "DESCONHECIDO", None, None, ""
-    texto = orcamento_texto.upper().strip()
-    texto = re.sub(r"/\s*HORA", "", texto)
-    texto = re.sub(r"\s*POR\s*HORA", "", texto)
-    texto = texto.replace("POR HORA", "")
-    texto = texto.strip()
-    moeda = "DESCONHECIDO"
-    if "US$" in texto or texto.startswith("USD") or "USD " in texto:
-        moeda = "USD"
-    elif "R$" in texto or texto.startswith("BRL") or "BRL " in texto:
-        moeda = "BRL"
-    valores = re.sub(r"(US\$|USD|R\$|BRL)", "", texto).strip()
-    numeros = re.findall(r"[\d\.,]+", valores)
-    try:
-        numeros = [float(n.replace(".", "").replace(",", ".")) for n in numeros]
-    except Exception:
-        numeros = []
-    minimo = maximo = None
-    if len(numeros) == 1:
-        minimo = numeros[0]
-    elif len(numeros) >= 2:
-        minimo, maximo = numeros[0], numeros[1]
-    return moeda, minimo, maximo, texto
-
-def open_link_in_new_tab_and_get_budget(driver, link: str, wait_seconds=3) -> str:
+def open_link_in_new_tab_and_get_budget(driver, link: str, wait_seconds=3, fetcher=None) -> str:
     if not link:
         return ""
-    if link.startswith("/"):
-        link = "https://www.workana.com" + link
-    driver.execute_script("window.open('');")
-    driver.switch_to.window(driver.window_handles[-1])
-    try:
-        driver.get(link)
-        try:
-            WebDriverWait(driver, wait_seconds).until(
-                lambda d: d.find_elements(By.CSS_SELECTOR, "h4.budget, div.project-actions h4.budget")
-            )
-        except TimeoutException:
-            pass
-        detail_selectors = [
-            "h4.budget span.values span",
-            "h4.budget .values span",
-            "h4.budget",
-            "div.project-actions h4.budget",
-            "div.project-header h4.budget",
-        ]
-        for sel in detail_selectors:
-            try:
-                elems = driver.find_elements(By.CSS_SELECTOR, sel)
-                if elems:
-                    text = elems[0].text.strip()
-                    if text:
-                        return text
-            except Exception:
-                continue
-        possibles = driver.find_elements(By.XPATH, "//*[contains(text(),'R$') or contains(text(),'US$') or contains(text(),'USD')]")
-        for p in possibles:
-            t = p.text.strip()
-            if t and len(t) < 120 and (("R$" in t) or ("USD" in t) or ("US$" in t)):
-                return t
-        return ""
-    finally:
-        driver.close()
-        driver.switch_to.window(driver.window_handles[0])
+    if fetcher is None:
+        fetcher = SeleniumDetailFetcher(driver, wait_seconds=wait_seconds)
+    return fetcher.fetch(link, [FIELD_BUDGET]).orcamento
 
-def get_full_description_and_skills(driver, card, link: str) -> Tuple[str, str]:
+def get_card_description_and_skills(driver, card) -> Tuple[str, List[str]]:
+    """Lê descrição (expandindo 'Ver mais') e skills direto do card da listagem."""
     descricao = ""
     habilidades = []
     initial_desc = safe_find_text(card, ["div.html-desc.project-details p", "div.project-details p", ".project-body p", "p"])
@@ -311,6 +165,7 @@ def get_full_description_and_skills(driver, card, link: str) -> Tuple[str, str]:
 
     if not descricao:
         descricao = initial_desc
+    descricao = strip_ver_mais(descricao)
 
     # Captura inicial de skills no card
     try:
@@ -319,107 +174,117 @@ def get_full_description_and_skills(driver, card, link: str) -> Tuple[str, str]:
     except Exception:
         habilidades = []
 
-    # Se faltarem dados, tenta abrir a página detalhada
-    need_detail = not descricao or len(descricao) < 80 or not habilidades
-    if need_detail and link:
-        if link.startswith("/"):
-            link = "https://www.workana.com" + link
-        driver.execute_script("window.open('');")
-        driver.switch_to.window(driver.window_handles[-1])
-        try:
-            driver.get(link)
-            try:
-                WebDriverWait(driver, DEFAULT_WAIT_LONG).until(
-                    lambda d: d.find_elements(By.CSS_SELECTOR, "div.html-desc, section.project-description, div.project-details")
-                )
-            except TimeoutException:
-                pass
+    return descricao, habilidades
 
-            # Descrição detalhada
-            for sel in ["div#project-detail div.html-desc p", "section.project-description p", "div.project-details p", ".project-description p"]:
-                elems = driver.find_elements(By.CSS_SELECTOR, sel)
-                if elems:
-                    descricao = " ".join([e.text.strip() for e in elems if e.text.strip()])
-                    break
+def needs_detail_description(descricao: str, habilidades: List[str]) -> bool:
+    return not descricao or len(descricao) < 80 or not habilidades
 
-            # Skills detalhadas
-            for sel in ["div#project-detail div.skills a", "section.project-skills a", "div.skills a", ".skills a"]:
-                elems = driver.find_elements(By.CSS_SELECTOR, sel)
-                if elems:
-                    habilidades = [e.text.strip() for e in elems if e.text.strip()]
-                    break
+def complete_description_and_skills(descricao: str, habilidades: List[str], link: str, fetcher) -> Tuple[str, str]:
+    """Se faltarem dados do card, completa descrição/skills com a página de detalhe."""
+    if needs_detail_description(descricao, habilidades) and link:
+        try:
+            detalhe = fetcher.fetch(link, [FIELD_DESCRIPTION, FIELD_SKILLS])
+            descricao = detalhe.descricao or descricao
+            habilidades = detalhe.habilidades or habilidades
         except Exception as e:
             logger.debug("Falha ao abrir detalhe da vaga: %s", e)
-        finally:
-            driver.close()
-            driver.switch_to.window(driver.window_handles[0])
 
     habilidades_str = " | ".join(habilidades) if habilidades else ""
     return (descricao or "").strip(), habilidades_str.strip()
 
+def get_full_description_and_skills(driver, card, link: str, fetcher=None) -> Tuple[str, str]:
+    descricao, habilidades = get_card_description_and_skills(driver, card)
+    if fetcher is None:
+        fetcher = SeleniumDetailFetcher(driver, wait_seconds=DEFAULT_WAIT_LONG)
+    return complete_description_and_skills(descricao, habilidades, link, fetcher)
 
-def scroll_until_end(driver, max_attempts: int = DEFAULT_MAX_SCROLL_ATTEMPTS, pause: float = 2.5) -> bool:
-    attempts = 0
-    last_height = driver.execute_script("return document.body.scrollHeight")
-    while attempts < max_attempts:
-        attempts += 1
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(pause)
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == last_height:
-            return True
-        last_height = new_height
-    return False
-
-def match_languages(projeto: dict, languages: List[str]) -> bool:
-    if not languages:
-        return True
-    text = " ".join([
-        projeto.get("Título", ""),
-        projeto.get("Descrição", ""),
-        projeto.get("Habilidades", "")
-    ]).lower()
-    for lang in languages:
-        if lang.lower() in text:
-            return True
-    return False
 
-# -----------------------
-# Database persistence
-# -----------------------
-def save_to_db(conn, projetos: List[dict]):
+def load_known_hashes(conn, window_hours: int = DEFAULT_KNOWN_WINDOW_HOURS) -> Set[str]:
+    """Carrega os link_hash das vagas vistas na janela recente (modo incremental)."""
+    with conn.cursor() as cur:
+        cur.execute(
+            "SELECT link_hash FROM scraped_jobs WHERE last_seen_at >= NOW() - INTERVAL '1 hour' * %s",
+            (window_hours,),
+        )
+        known = {row[0].strip() for row in cur.fetchall()}
+    logger.info("[INCREMENTAL] %d vagas conhecidas nas últimas %dh.", len(known), window_hours)
+    return known
+
+def update_proposals(cur, rows: List[tuple]) -> int:
     """
-    Salva os projetos em lote. Recebe uma conexão (reutilizada).
-    Usa ON CONFLICT (link_hash) DO UPDATE para manter dados atualizados.
+    Grava, num único UPDATE, o número de propostas de (link_hash, propostas) que mudou.
+    As propostas ficam fora da impressão digital: o content_hash não muda. Não faz commit.
     """
-    if not projetos:
-        logger.info("Nenhum projeto para salvar no banco.")
+    if not rows:
+        return 0
+    sql = """
+    UPDATE scraped_jobs AS sj
+       SET proposals = v.proposals
+      FROM (VALUES %s) AS v (link_hash, proposals)
+     WHERE sj.link_hash = v.link_hash
+       AND sj.proposals IS DISTINCT FROM v.proposals
+    ;
+    """
+    # char(64) como a coluna: com text o índice único de link_hash não é usado
+    execute_values(cur, sql, rows, template="(%s::char(64), %s::int)", page_size=200)
+    return cur.rowcount
+
+def refresh_proposals(conn, projetos: List[dict]):
+    """Atualização barata (só listagem) do número de propostas de vagas já gravadas."""
+    rows = [
+        (generate_link_hash(p.get("Link") or ""), normalize_value(p.get("Propostas"), "int"))
+        for p in projetos
+    ]
+    if not rows:
         return
+    cur = conn.cursor()
+    try:
+        update_proposals(cur, rows)
+        touch_last_seen(cur, [r[0] for r in rows])
+        conn.commit()
+        logger.info("[INCREMENTAL] Propostas atualizadas para %d vagas conhecidas.", len(rows))
+    except Exception as e:
+        conn.rollback()
+        logger.exception("Erro ao atualizar propostas: %s", e)
+    finally:
+        cur.close()
 
-    rows = []
-    for p in projetos:
-        link = normalize_value(p.get("Link"), "str")
-        link_hash = generate_link_hash(link or "")
-        rows.append((
-            "workana",
-            normalize_value(p.get("Título"), "str"),
-            link,
-            link_hash,
-            normalize_value(p.get("Descrição"), "str"),
-            normalize_value(p.get("Habilidades"), "str"),
-            normalize_value(p.get("Orçamento Original"), "str"),
-            normalize_value(p.get("Mínimo (BRL)"), "float"),
-            normalize_value(p.get("Máximo (BRL)"), "float"),
-            normalize_value(p.get("Propostas"), "int"),
-            normalize_value(p.get("Metodo"), "str"),
-            datetime.utcnow(),
-        ))
+def touch_last_seen(cur, link_hashes: List[str]) -> int:
+    """
+    Marca, num único UPDATE, as vagas vistas nesta execução sem mudança de conteúdo.
+    Só regrava quem está mais velho que LAST_SEEN_GRANULARITY_MINUTES. Não faz commit.
+    """
+    if not link_hashes:
+        return 0
+    cur.execute(
+        """
+        UPDATE scraped_jobs
+           SET last_seen_at = CURRENT_TIMESTAMP
+         WHERE link_hash = ANY(%s::char(64)[])
+           AND last_seen_at < CURRENT_TIMESTAMP - INTERVAL '1 minute' * %s
+        """,
+        (list(link_hashes), LAST_SEEN_GRANULARITY_MINUTES),
+    )
+    return cur.rowcount
 
-    sql = """
-    INSERT INTO scraped_jobs
-    (source, title, link, link_hash, description, skills, original_budget,
-     min_budget, max_budget, proposals, conversion_method, scraped_at)
-    VALUES %s
+def content_fingerprint(title, description, skills, budget) -> str:
+    """
+    SHA-256 do conteúdo que importa para o usuário. O orçamento entra como texto
+    original: a conversão para BRL muda com a cotação, não com a vaga. As propostas
+    ficam de fora (mudam a toda hora) e são gravadas à parte por update_proposals.
+    """
+    payload = "\x1f".join("" if v is None else " ".join(str(v).split()) for v in
+                          (title, description, skills, budget))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+DB_COLUMNS = [
+    "source", "title", "link", "link_hash", "description", "skills", "original_budget",
+    "min_budget", "max_budget", "proposals", "conversion_method", "scraped_at", "exchange_rate_id",
+    "content_hash", "duplicate_of",
+]
+# só reescreve (e gera WAL/tupla morta) quando a impressão digital do conteúdo mudou; as
+# propostas ficam fora dela, então contam à parte (o save_to_db já as grava via update_proposals)
+UPSERT_CONFLICT_SQL = """
     ON CONFLICT (link_hash) DO UPDATE
       SET title = EXCLUDED.title,
           description = EXCLUDED.description,
@@ -429,222 +294,889 @@ def save_to_db(conn, projetos: List[dict]):
           max_budget = EXCLUDED.max_budget,
           proposals = EXCLUDED.proposals,
           conversion_method = EXCLUDED.conversion_method,
-          scraped_at = CURRENT_TIMESTAMP
+          exchange_rate_id = EXCLUDED.exchange_rate_id,
+          content_hash = EXCLUDED.content_hash,
+          search_vector = EXCLUDED.search_vector,
+          scraped_at = CURRENT_TIMESTAMP,
+          last_seen_at = CURRENT_TIMESTAMP
+      WHERE scraped_jobs.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+         OR scraped_jobs.proposals IS DISTINCT FROM EXCLUDED.proposals
+"""
+
+def build_db_row(p: dict) -> tuple:
+    """Converte um projeto (dict do scraper/CSV) numa tupla na ordem de DB_COLUMNS."""
+    link = normalize_value(p.get("Link"), "str")
+    title = normalize_value(p.get("Título"), "str")
+    description = normalize_value(p.get("Descrição"), "str")
+    skills = normalize_value(p.get("Habilidades"), "str")
+    budget = normalize_value(p.get("Orçamento Original"), "str")
+    return (
+        "workana",
+        title,
+        link,
+        generate_link_hash(link or ""),
+        description,
+        skills,
+        budget,
+        normalize_value(p.get("Mínimo (BRL)"), "float"),
+        normalize_value(p.get("Máximo (BRL)"), "float"),
+        normalize_value(p.get("Propostas"), "int"),
+        normalize_value(p.get("Metodo"), "str"),
+        datetime.utcnow(),
+        normalize_value(p.get(RATE_ID_KEY), "int"),
+        content_fingerprint(title, description, skills, budget),
+        normalize_value(p.get(DUPLICATE_KEY), "str"),
+    )
+
+# tsvector calculado no próprio INSERT, a partir das colunas de texto de cada linha
+_SEARCH_COLUMNS = {column: DB_COLUMNS.index(column) for column in ("title", "description", "skills")}
+UPSERT_VALUES_TEMPLATE = "({}, {})".format(
+    ", ".join(["%s"] * len(DB_COLUMNS)), search_vector_sql({column: "%s" for column in _SEARCH_COLUMNS})
+)
+
+_LINK_HASH = DB_COLUMNS.index("link_hash")
+_CONTENT_HASH = DB_COLUMNS.index("content_hash")
+_PROPOSALS = DB_COLUMNS.index("proposals")
+
+def load_content_hashes(cur, link_hashes: List[str]) -> Dict[str, str]:
+    """Impressões digitais já gravadas para `link_hashes` (uma consulta pelo índice único)."""
+    # o array precisa ser char(64)[]: text[] força link_hash::text e uma varredura sequencial
+    cur.execute("SELECT link_hash, content_hash FROM scraped_jobs WHERE link_hash = ANY(%s::char(64)[])", (link_hashes,))
+    return dict(cur.fetchall())
+
+def with_search_params(row: tuple) -> tuple:
+    return row + tuple(search_vector_params({column: row[i] for column, i in _SEARCH_COLUMNS.items()}))
+
+def save_to_db(conn, projetos: List[dict]) -> bool:
+    """
+    Salva os projetos em lote. Recebe uma conexão (reutilizada).
+    Usa ON CONFLICT (link_hash) DO UPDATE para manter dados atualizados.
+    Projetos marcados como parciais (modo incremental) só atualizam as propostas.
+    Devolve False se o lote completo não pôde ser gravado.
+    """
+    if not projetos:
+        logger.info("Nenhum projeto para salvar no banco.")
+        return True
+
+    refresh_proposals(conn, [p for p in projetos if p.get(PARTIAL_KEY)])
+    projetos = [p for p in projetos if not p.get(PARTIAL_KEY)]
+    if not projetos:
+        return True
+
+    rows = [build_db_row(p) for p in projetos]
+    sql = f"""
+    INSERT INTO scraped_jobs
+    ({", ".join(DB_COLUMNS)}, {SEARCH_VECTOR_COLUMN})
+    VALUES %s
+    {UPSERT_CONFLICT_SQL}
+    RETURNING id, link_hash, (xmax = 0), skills
     ;
     """
 
     cur = conn.cursor()
     try:
-        execute_values(cur, sql, rows, template=None, page_size=50)
-        conn.commit()
-        logger.info("Dados salvos/atualizados no banco (registros: %d).", len(rows))
+        with metrics.stage("db_write"):
+            # linhas com a mesma impressão digital nem entram no INSERT (o tsvector não é recalculado)
+            stored = load_content_hashes(cur, [r[_LINK_HASH] for r in rows])
+            changed = [r for r in rows if stored.get(r[_LINK_HASH]) != r[_CONTENT_HASH]]
+            written = []
+            if changed:
+                # só voltam as linhas escritas: xmax = 0 nas recém-inseridas, as demais vieram do DO UPDATE
+                written = execute_values(cur, sql, [with_search_params(r) for r in changed],
+                                         template=UPSERT_VALUES_TEMPLATE, page_size=50, fetch=True)
+            inserted = sum(1 for _, _, is_new, _ in written if is_new)
+            updated = len(written) - inserted
+            # skills normalizadas das linhas escritas, na mesma transação
+            replace_job_skills(cur, ((job_id, skills) for job_id, _, _, skills in written))
+            # as sem mudança (inclusive as que o WHERE do upsert pulou) só ganham as propostas e o last_seen_at
+            written_hashes = {h for _, h, _, _ in written}
+            unchanged = list({r[_LINK_HASH] for r in rows} - written_hashes)
+            update_proposals(cur, [(r[_LINK_HASH], r[_PROPOSALS]) for r in rows if r[_LINK_HASH] not in written_hashes])
+            touch_last_seen(cur, unchanged)
+            conn.commit()
+        metrics.inc("db_rows_inserted", inserted)
+        metrics.inc("db_rows_updated", updated)
+        metrics.inc("db_rows_unchanged", len(unchanged))
+        logger.info("Dados salvos no banco (registros: %d, novos: %d, alterados: %d, sem mudança: %d).",
+                    len(rows), inserted, updated, len(unchanged))
+        return True
     except Exception as e:
         conn.rollback()
+        metrics.inc("errors")
         logger.exception("Erro ao salvar no banco: %s", e)
         # also write simple error file
         with open(ERROR_LOG, "a", encoding="utf-8") as fe:
             fe.write(f"{datetime.utcnow().isoformat()} DB_SAVE_ERROR: {repr(e)}\n")
+        return False
     finally:
         cur.close()
 
+def bulk_save_to_db(conn, projetos: Iterable[dict]) -> int:
+    """
+    Carga em massa (backfill): COPY para uma tabela de staging e um único
+    INSERT ... SELECT ... ON CONFLICT (link_hash) no scraped_jobs.
+    Aceita um iterável, então arquivos grandes não precisam caber em memória.
+    """
+    rows = (build_db_row(p) for p in projetos if not p.get(PARTIAL_KEY))
+    try:
+        loaded, merged, elapsed = copy_merge(conn, "scraped_jobs", DB_COLUMNS, rows, "link_hash", UPSERT_CONFLICT_SQL,
+                                             computed={SEARCH_VECTOR_COLUMN: search_vector_sql({c: c for c in _SEARCH_COLUMNS})},
+                                             returning="id, skills", on_merged=replace_job_skills)
+    except Exception as e:
+        logger.exception("Erro na carga em massa: %s", e)
+        with open(ERROR_LOG, "a", encoding="utf-8") as fe:
+            fe.write(f"{datetime.utcnow().isoformat()} DB_BULK_LOAD_ERROR: {repr(e)}\n")
+        return 0
+    logger.info("[BULK] %d linhas carregadas, %d mescladas em %.2fs (%.0f linhas/s).",
+                loaded, merged, elapsed, loaded / elapsed if elapsed else 0.0)
+    return merged
+
 # -----------------------
 # Main scraper flow
 # -----------------------
-def scrape_workana(language: str = None, max_scrolls: int = DEFAULT_MAX_SCROLL_ATTEMPTS):
+def log_card_error(idx: int, e: Exception):
+    metrics.inc("errors")
+    with open(ERROR_LOG, "a", encoding="utf-8") as fe:
+        fe.write(f"{datetime.utcnow().isoformat()} ERROR processing card index={idx}: {repr(e)}\n")
+    logger.exception("Erro ao processar card index=%s: %s", idx, e)
+
+def expand_cards(driver, stubs: List[dict]):
+    """Volta ao DOM vivo só para os cards que precisam do clique em 'Ver mais'."""
+    pending = [stub for stub in stubs if stub.get("ver_mais")]
+    if not pending:
+        return
+    cards = driver.find_elements(By.CSS_SELECTOR, CARD_SELECTOR)
+    for stub in pending:
+        try:
+            card = cards[stub["idx"] - 1]
+            descricao, habilidades = get_card_description_and_skills(driver, card)
+            stub["descricao"] = descricao or stub["descricao"]
+            stub["habilidades"] = habilidades or stub["habilidades"]
+        except Exception as e:
+            log_card_error(stub["idx"], e)
+    logger.info("Cards expandidos via 'Ver mais': %d", len(pending))
+
+def resolve_budget(orcamento_texto: str, link: str, fetcher, usd_to_brl: float):
+    """Retorna (orcamento_texto, minimo_brl, maximo_brl, metodo), consultando o detalhe se preciso."""
+    moeda, minimo, maximo, _ = tratar_orcamento(orcamento_texto)
+
+    metodo = "listagem"
+    minimo_brl = maximo_brl = None
+
+    if moeda == "USD" and link:
+        try:
+            detalhe_orc = fetcher.fetch(link, [FIELD_BUDGET]).orcamento
+            if detalhe_orc:
+                moeda_det, min_det, max_det, _ = tratar_orcamento(detalhe_orc)
+                if moeda_det == "BRL" and (min_det is not None):
+                    minimo_brl, maximo_brl = min_det, max_det
+                    orcamento_texto = detalhe_orc
+                    moeda = moeda_det
+                    metodo = "detail_page_BRL"
+                else:
+                    metodo = "convert_api"
+                    if minimo is not None:
+                        minimo_brl = round(minimo * usd_to_brl, 2)
+                    if maximo is not None:
+                        maximo_brl = round(maximo * usd_to_brl, 2)
+            else:
+                metodo = "convert_api"
+                if minimo is not None:
+                    minimo_brl = round(minimo * usd_to_brl, 2)
+                if maximo is not None:
+                    maximo_brl = round(maximo * usd_to_brl, 2)
+        except Exception:
+            metodo = "convert_api_error_fallback"
+            if minimo is not None:
+                minimo_brl = round(minimo * usd_to_brl, 2)
+            if maximo is not None:
+                maximo_brl = round(maximo * usd_to_brl, 2)
+
+    elif moeda == "BRL":
+        minimo_brl, maximo_brl = minimo, maximo
+        metodo = "listagem_BRL"
+    else:
+        if link:
+            try:
+                detalhe_orc = fetcher.fetch(link, [FIELD_BUDGET]).orcamento
+                moeda_det, min_det, max_det, _ = tratar_orcamento(detalhe_orc)
+                if moeda_det == "BRL":
+                    moeda = moeda_det
+                    minimo, maximo = min_det, max_det
+                    minimo_brl, maximo_brl = min_det, max_det
+                    orcamento_texto = detalhe_orc
+                    metodo = "detail_page_BRL_unknown"
+            except Exception:
+                pass
+
+    return orcamento_texto, minimo_brl, maximo_brl, metodo
+
+def detail_fields_needed(stub: dict) -> List[str]:
+    """Campos que o card não resolve sozinho e precisam da página de detalhe."""
+    fields = []
+    if needs_detail_description(stub["descricao"], stub["habilidades"]):
+        fields += [FIELD_DESCRIPTION, FIELD_SKILLS]
+    if tratar_orcamento(stub["orcamento"])[0] != "BRL":
+        fields.append(FIELD_BUDGET)
+    return fields
+
+def enrich_card(stub: dict, fetcher, usd_to_brl: float) -> dict:
+    """Completa um card lido da listagem com a página de detalhe e monta o projeto."""
+    link = stub["link"]
+    fields = detail_fields_needed(stub)
+    if link and fields:
+        # uma única navegação cobre descrição, skills e orçamento; as etapas abaixo leem do cache
+        try:
+            with metrics.stage("detail_pages", histogram="detail_page_seconds"):
+                fetcher.fetch(link, fields)
+            metrics.inc("detail_navigations")
+        except Exception as e:
+            logger.debug("Falha ao abrir detalhe da vaga: %s", e)
+    return build_project(stub, fetcher, usd_to_brl)
+
+def build_project(stub: dict, fetcher, usd_to_brl: float) -> dict:
+    """Monta o projeto a partir do card, consultando `fetcher` (já aquecido) para o que faltar."""
+    link = stub["link"]
+    descricao, habilidades = complete_description_and_skills(stub["descricao"], stub["habilidades"], link, fetcher)
+    orcamento_texto, minimo_brl, maximo_brl, metodo = resolve_budget(stub["orcamento"], link, fetcher, usd_to_brl)
+
+    return {
+        "Título": stub["titulo"],
+        "Link": link,
+        "Descrição": descricao,
+        "Habilidades": habilidades,
+        "Orçamento Original": orcamento_texto,
+        "Mínimo (BRL)": minimo_brl,
+        "Máximo (BRL)": maximo_brl,
+        "Propostas": stub["propostas"],
+        "Metodo": metodo
+    }
+
+def iter_enriched(stubs: Iterable[dict], fetcher, usd_to_brl: float, workers: int = DEFAULT_WORKERS) -> Iterator[dict]:
     """
-    Retorna a lista de projetos coletados (lista de dicts).
+    Enriquece os cards com até `workers` threads e devolve cada projeto assim que
+    ele fica pronto, preservando a ordem original. No máximo 2x`workers` cards
+    ficam em voo, então a memória não cresce com o tamanho da listagem.
     """
-    # choose URL
-    if language:
-        q = "+".join(language.split())
-        url = URL_TEMPLATE.format(query=q)
+    def _safe_enrich(stub):
+        try:
+            with metrics.stage("enrich", histogram="card_seconds"):
+                return enrich_card(stub, fetcher, usd_to_brl)
+        except Exception as e:
+            log_card_error(stub["idx"], e)
+            return None
+
+    started = time.time()
+    count = 0
+    if workers <= 1:
+        for stub in stubs:
+            count += 1
+            projeto = _safe_enrich(stub)
+            if projeto is not None:
+                yield projeto
     else:
-        url = URL_ALL_TI
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enrich") as executor:
+            pending = deque()
+            for stub in stubs:
+                count += 1
+                pending.append(executor.submit(_safe_enrich, stub))
+                if len(pending) >= workers * 2:
+                    projeto = pending.popleft().result()
+                    if projeto is not None:
+                        yield projeto
+            while pending:
+                projeto = pending.popleft().result()
+                if projeto is not None:
+                    yield projeto
+    logger.info("Enriquecimento concluído: %d cards em %.1fs (workers=%d).", count, time.time() - started, workers)
 
-    logger.info("Iniciando scraping. Linguagem: %s", language or "TODAS (TI)")
-    usd_to_brl = get_usd_brl_rate()
-    driver = None
-    projetos = []
+def enrich_cards(stubs: List[dict], fetcher, usd_to_brl: float, workers: int = DEFAULT_WORKERS) -> List[dict]:
+    """Versão em lista de `iter_enriched`."""
+    return list(iter_enriched(stubs, fetcher, usd_to_brl, workers))
 
-    try:
-        driver = setup_driver(headless=FORCE_HEADLESS)
-        driver.get(url)
-        try:
-            WebDriverWait(driver, DEFAULT_WAIT_MED).until(lambda d: d.find_elements(By.CSS_SELECTOR, "div.project-item"))
-        except TimeoutException:
-            logger.warning("Timeout aguardando cards; continuando mesmo assim.")
+def listing_only_record(stub: dict) -> dict:
+    """Registro parcial de uma vaga já conhecida: só o que a listagem traz de graça."""
+    return {
+        "Título": stub["titulo"],
+        "Link": stub["link"],
+        "Propostas": stub["propostas"],
+        PARTIAL_KEY: True,
+    }
 
-        scrolled = scroll_until_end(driver, max_attempts=max_scrolls)
-        if not scrolled:
-            logger.info("Scroll atingiu limite de tentativas (MAX=%d).", max_scrolls)
+def split_known(stubs: List[dict], known_hashes: Set[str]) -> Tuple[List[dict], List[dict]]:
+    """Separa os cards novos dos já gravados (que viram registros parciais, sem detalhe)."""
+    if not known_hashes:
+        return stubs, []
+    new_stubs, known_projetos = [], []
+    for stub in stubs:
+        if generate_link_hash(stub["link"]) in known_hashes:
+            known_projetos.append(listing_only_record(stub))
+        else:
+            new_stubs.append(stub)
+    logger.info("[INCREMENTAL] %d vagas novas, %d já conhecidas (sem detalhe).", len(new_stubs), len(known_projetos))
+    return new_stubs, known_projetos
 
-        cards = driver.find_elements(By.CSS_SELECTOR, "div.project-item")
-        logger.info("Cards visíveis encontrados: %d", len(cards))
+def split_near_duplicates(stubs: List[dict], duplicates: NearDuplicateIndex) -> Tuple[List[dict], List[dict]]:
+    """
+    Separa os cards que repetem (com outro link) uma vaga recente ou anterior na
+    execução; esses não são enriquecidos e são gravados com DUPLICATE_KEY.
+    """
+    if duplicates is None:
+        return stubs, []
+    new_stubs, duplicate_stubs = [], []
+    with metrics.stage("near_duplicates"):
+        for stub in stubs:
+            original = duplicates.check(generate_link_hash(stub["link"]), stub["titulo"], stub["descricao"])
+            if original:
+                stub[DUPLICATE_KEY] = original
+                duplicate_stubs.append(stub)
+            else:
+                new_stubs.append(stub)
+    if duplicate_stubs:
+        metrics.inc("near_duplicates", len(duplicate_stubs))
+        logger.info("[DUPLICATAS] %d cards quase duplicados de vagas já vistas (sem detalhe).", len(duplicate_stubs))
+    return new_stubs, duplicate_stubs
+
+def duplicate_record(stub: dict, usd_to_brl: float) -> dict:
+    """Projeto de uma quase duplicata: só dados do card, ligado à vaga original."""
+    projeto = build_project(stub, ListingOnlyFetcher(), usd_to_brl)
+    projeto[DUPLICATE_KEY] = stub[DUPLICATE_KEY]
+    return projeto
 
-        for idx, card in enumerate(cards, start=1):
+def new_driver_pool(workers: int, block_profile: str = BLOCK_PROFILE) -> DriverPool:
+    size = max(1, workers)
+    if CHROME_DEBUGGER_ADDRESS and size > 1:
+        # um navegador externo só comporta uma sessão controlando as abas
+        logger.info("[DRIVER] Usando o Chromium em %s: pool limitado a 1 driver.", CHROME_DEBUGGER_ADDRESS)
+        size = 1
+    return DriverPool(lambda: setup_driver(headless=FORCE_HEADLESS, block_profile=block_profile), size=size)
+
+def read_listing(pool: DriverPool, query: ListingQuery, max_scrolls: int) -> List[dict]:
+    """Carrega uma listagem (scroll + snapshot + 'Ver mais') num driver do pool."""
+    with pool.acquire() as driver:
+        with metrics.stage("listing_load"):
+            driver.get(query.url)
             try:
-                # title + link (robust fallbacks)
-                titulo = ""
-                link_elem = None
-                for sel in ["h2.project-title a", "h2.h3.project-title a", "h2 a"]:
-                    elems = card.find_elements(By.CSS_SELECTOR, sel)
-                    if elems:
-                        link_elem = elems[0]
-                        span_elems = elems[0].find_elements(By.TAG_NAME, "span")
-                        if span_elems:
-                            titulo = span_elems[0].get_attribute("title") or span_elems[0].text.strip()
-                        else:
-                            titulo = elems[0].text.strip()
-                        break
-                link = link_elem.get_attribute("href") if link_elem is not None else ""
-
-                descricao, habilidades = get_full_description_and_skills(driver, card, link)
-
-                # orçamento (listagem)
-                orcamento_texto = safe_find_text(card, ["h4.budget span.values span", "h4.budget .values span", "h4.budget", ".budget"])
-                moeda, minimo, maximo, _ = tratar_orcamento(orcamento_texto)
-
-                metodo = "listagem"
-                minimo_brl = maximo_brl = None
-
-                if moeda == "USD" and link:
-                    try:
-                        detalhe_orc = open_link_in_new_tab_and_get_budget(driver, link)
-                        if detalhe_orc:
-                            moeda_det, min_det, max_det, _ = tratar_orcamento(detalhe_orc)
-                            if moeda_det == "BRL" and (min_det is not None):
-                                minimo_brl, maximo_brl = min_det, max_det
-                                orcamento_texto = detalhe_orc
-                                moeda = moeda_det
-                                metodo = "detail_page_BRL"
-                            else:
-                                metodo = "convert_api"
-                                if minimo is not None:
-                                    minimo_brl = round(minimo * usd_to_brl, 2)
-                                if maximo is not None:
-                                    maximo_brl = round(maximo * usd_to_brl, 2)
-                        else:
-                            metodo = "convert_api"
-                            if minimo is not None:
-                                minimo_brl = round(minimo * usd_to_brl, 2)
-                            if maximo is not None:
-                                maximo_brl = round(maximo * usd_to_brl, 2)
-                    except Exception:
-                        metodo = "convert_api_error_fallback"
-                        if minimo is not None:
-                            minimo_brl = round(minimo * usd_to_brl, 2)
-                        if maximo is not None:
-                            maximo_brl = round(maximo * usd_to_brl, 2)
-
-                elif moeda == "BRL":
-                    minimo_brl, maximo_brl = minimo, maximo
-                    metodo = "listagem_BRL"
-                else:
-                    if link:
-                        try:
-                            detalhe_orc = open_link_in_new_tab_and_get_budget(driver, link)
-                            moeda_det, min_det, max_det, _ = tratar_orcamento(detalhe_orc)
-                            if moeda_det == "BRL":
-                                moeda = moeda_det
-                                minimo, maximo = min_det, max_det
-                                minimo_brl, maximo_brl = min_det, max_det
-                                orcamento_texto = detalhe_orc
-                                metodo = "detail_page_BRL_unknown"
-                        except Exception:
-                            pass
-
-                propostas = safe_find_text(card, ["div.project-main-details span.bids", "span.bids", ".bids"])
-
-                projeto = {
-                    "Título": titulo,
-                    "Link": link,
-                    "Descrição": descricao,
-                    "Habilidades": habilidades,
-                    "Orçamento Original": orcamento_texto,
-                    "Mínimo (BRL)": minimo_brl,
-                    "Máximo (BRL)": maximo_brl,
-                    "Propostas": propostas,
-                    "Metodo": metodo
-                }
-
-                projetos.append(projeto)
+                WebDriverWait(driver, DEFAULT_WAIT_MED).until(lambda d: d.find_elements(By.CSS_SELECTOR, "div.project-item"))
+            except TimeoutException:
+                metrics.inc("timeouts")
+                logger.warning("Timeout aguardando cards (%s); continuando mesmo assim.", query.label)
 
-            except Exception as e:
-                with open(ERROR_LOG, "a", encoding="utf-8") as fe:
-                    fe.write(f"{datetime.utcnow().isoformat()} ERROR processing card index={idx}: {repr(e)}\n")
-                logger.exception("Erro ao processar card index=%s: %s", idx, e)
-                continue
+        with metrics.stage("scroll"):
+            scrolled = scroll_until_end(driver, max_attempts=max_scrolls)
+        if not scrolled:
+            logger.info("Scroll atingiu limite de tentativas (MAX=%d) em %s.", max_scrolls, query.label)
+
+        # um único snapshot do HTML da listagem, processado em memória
+        with metrics.stage("listing_parse"):
+            stubs = parse_listing_html(driver.page_source)
+        metrics.inc("cards_seen", len(stubs))
+        logger.info("Cards visíveis encontrados em %s: %d", query.label, len(stubs))
+        with metrics.stage("ver_mais"):
+            expand_cards(driver, stubs)
+    for stub in stubs:
+        stub["query"] = query.label
+    return stubs
+
+def read_listings(pool: DriverPool, queries: List[ListingQuery], max_scrolls: int, workers: int) -> List[dict]:
+    """
+    Percorre as listagens em paralelo (até `workers` ao mesmo tempo) e junta os
+    cards na ordem das consultas, deduplicando por link entre elas.
+    """
+    def _safe_read(query):
+        try:
+            return read_listing(pool, query, max_scrolls)
+        except WebDriverException:
+            raise
+        except Exception as e:
+            logger.exception("Erro ao ler listagem %s: %s", query.label, e)
+            return []
+
+    if len(queries) == 1 or workers <= 1:
+        results = [_safe_read(q) for q in queries]
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(queries)), thread_name_prefix="listing") as executor:
+            results = list(executor.map(_safe_read, queries))
+    return merge_listings(queries, results)
+
+def read_listing_page(pool: DriverPool, url: str) -> List[dict]:
+    """
+    Uma página da listagem paginada num driver do pool (sem scroll). Só uma
+    página carregada sem cards volta vazia (fim da listagem); se ela não
+    terminar de carregar, o TimeoutException sobe para o crawler tentar de novo.
+    """
+    with pool.acquire() as driver:
+        with metrics.stage("listing_load"):
+            driver.get(url)
+            WebDriverWait(driver, DEFAULT_WAIT_MED).until(
+                lambda d: d.find_elements(By.CSS_SELECTOR, CARD_SELECTOR)
+                or d.execute_script("return document.readyState") == "complete"
+            )
+        with metrics.stage("listing_parse"):
+            stubs = parse_listing_html(driver.page_source)
+        with metrics.stage("ver_mais"):
+            expand_cards(driver, stubs)
+    return stubs
+
+class _QueryDedup:
+    """Cards novos de cada consulta (sem repetir links entre elas) e as contagens por consulta."""
+
+    def __init__(self, queries: List[ListingQuery]):
+        self.seen = set()
+        self.found = {query: 0 for query in queries}
+        self.new = {query: 0 for query in queries}
+
+    def add(self, query: ListingQuery, cards: List[dict]) -> List[dict]:
+        stubs = []
+        for stub in cards:
+            clean = normalize_url_for_hash(stub["link"] or "")
+            if clean not in self.seen:
+                self.seen.add(clean)
+                stubs.append(stub)
+        self.found[query] += len(cards)
+        self.new[query] += len(stubs)
+        return stubs
+
+    def log(self):
+        for query in self.found:
+            logger.info("[CONSULTAS] %s: %d cards, %d novos na execução.", query.label, self.found[query], self.new[query])
+
+def iter_listing_pages(queries: List[ListingQuery], fetch_page, concurrency: int,
+                       max_pages: int = DEFAULT_MAX_PAGES) -> Iterator[List[dict]]:
+    """
+    Cards novos de cada página, com as consultas percorridas em paralelo no
+    mesmo executor (ver page_crawler.crawl_queries), sem repetir links entre consultas.
+    """
+    dedup = _QueryDedup(queries)
+    for query, cards in crawl_queries(queries, fetch_page, concurrency, generate_link_hash, max_pages):
+        stubs = dedup.add(query, cards)
+        if stubs:
+            yield stubs
+    dedup.log()
+
+def merge_listings(queries: List[ListingQuery], results: List[List[dict]]) -> List[dict]:
+    """Junta os cards de cada consulta, na ordem das consultas, sem repetir links entre elas."""
+    dedup = _QueryDedup(queries)
+    stubs = [stub for query, found in zip(queries, results) for stub in dedup.add(query, found)]
+    dedup.log()
+    return stubs
+
+def scrape_workana(language: str = None, max_scrolls: int = DEFAULT_MAX_SCROLL_ATTEMPTS,
+                   detail_backend: str = DEFAULT_DETAIL_BACKEND, workers: int = DEFAULT_WORKERS,
+                   known_hashes: Set[str] = None, pool: DriverPool = None, usd_to_brl: float = None,
+                   queries: List[ListingQuery] = None, block_profile: str = BLOCK_PROFILE,
+                   rate_lookup: RateLookup = None, duplicates: NearDuplicateIndex = None,
+                   listing_mode: str = LISTING_MODE_PAGES, listing_backend: str = "http",
+                   max_pages: int = DEFAULT_MAX_PAGES):
+    """
+    Gera os projetos coletados (dicts) à medida que ficam prontos, na ordem dos cards.
+    `queries` (ver query_planner) define as listagens percorridas; sem ela, usa
+    a categoria TI filtrada por `language`.
+    `detail_backend` escolhe como as páginas de detalhe são buscadas ("http" ou "selenium")
+    e `workers` quantas listagens/vagas são processadas em paralelo (um WebDriver por worker, sob demanda).
+    Links em `known_hashes` não são enriquecidos: voltam como registros parciais (PARTIAL_KEY).
+    Cards quase duplicados de vagas em `duplicates` também não (ver split_near_duplicates).
+    Com `listing_mode` "pages", as páginas da listagem (`&page=N`, até `max_pages`)
+    são lidas em paralelo por `listing_backend` ("http" ou "selenium", pelo pool)
+    e cada página já segue para o enriquecimento; "scroll" rola cada listagem até o fim antes.
+    Um `pool` externo (modo daemon) é reaproveitado e não é encerrado ao final;
+    sem ele, os navegadores sobem com o perfil de bloqueio `block_profile`.
+    Sem `usd_to_brl`, a cotação (`rate_lookup`, ou uma consulta nova) corre em
+    segundo plano durante a leitura das listagens e só é aguardada no enriquecimento.
+    """
+    if not queries:
+        queries = plan_queries([language] if language else None)
+
+    logger.info("Iniciando scraping de %d consulta(s): %s", len(queries), ", ".join(q.label for q in queries))
+    if usd_to_brl is None and rate_lookup is None:
+        rate_lookup = RateLookup.start()
+    own_pool = pool is None
+    if own_pool:
+        pool = new_driver_pool(workers, block_profile)
+    fetcher = None
+    page_fetcher = None
+
+    try:
+        fetcher = CachingDetailFetcher(build_detail_fetcher(
+            None, detail_backend,
+            selenium_fetcher=PooledSeleniumDetailFetcher(pool, DEFAULT_WAIT_LONG),
+            http_pool_size=max(DEFAULT_HTTP_POOL_SIZE, workers),
+        ), key_func=generate_link_hash)
+
+        if listing_mode == LISTING_MODE_PAGES:
+            if listing_backend == "http":
+                page_fetcher = HttpListingFetcher(pool_size=max(1, workers))
+                fetch_page = page_fetcher
+            else:
+                fetch_page = lambda url: read_listing_page(pool, url)
+            pages = iter_listing_pages(queries, fetch_page, workers, max_pages)
+            # a primeira página já está em voo enquanto a cotação é aguardada
+            first = next(pages, None)
+            if usd_to_brl is None:
+                with metrics.stage("exchange_rate"):
+                    usd_to_brl = rate_lookup.result().rate
+            ready = deque()
+
+            def _fresh_stubs():
+                for stubs in itertools.chain([first] if first else [], pages):
+                    stubs, known_projetos = split_known(stubs, known_hashes)
+                    stubs, duplicate_stubs = split_near_duplicates(stubs, duplicates)
+                    ready.extend(known_projetos)
+                    ready.extend(duplicate_record(stub, usd_to_brl) for stub in duplicate_stubs)
+                    yield from stubs
+
+            for projeto in iter_enriched(_fresh_stubs(), fetcher, usd_to_brl, workers):
+                while ready:
+                    yield ready.popleft()
+                yield projeto
+            while ready:
+                yield ready.popleft()
+            return
+
+        # Fase 1: listagens (dedup por URL normalizada entre consultas, antes de qualquer detalhe)
+        stubs = read_listings(pool, queries, max_scrolls, workers)
+        logger.info("Após deduplicação: %d cards", len(stubs))
+
+        # Modo incremental: vagas já gravadas recebem só a atualização de propostas
+        stubs, known_projetos = split_known(stubs, known_hashes)
+        stubs, duplicate_stubs = split_near_duplicates(stubs, duplicates)
+
+        # Fase 2 (pool): completa detalhes e orçamento em paralelo, na ordem original
+        yield from known_projetos
+        if usd_to_brl is None:
+            with metrics.stage("exchange_rate"):
+                usd_to_brl = rate_lookup.result().rate
+        for stub in duplicate_stubs:
+            yield duplicate_record(stub, usd_to_brl)
+        yield from iter_enriched(stubs, fetcher, usd_to_brl, workers)
 
     except WebDriverException as e:
         logger.exception("Erro com WebDriver: %s", e)
+        if not own_pool:
+            # driver possivelmente morto: o próximo ciclo recria o pool
+            pool.close()
     finally:
-        try:
-            if driver:
-                driver.quit()
-        except Exception:
-            pass
-
-    return projetos
+        if page_fetcher:
+            page_fetcher.close()
+        if fetcher:
+            fetcher.log_stats()
+            fetcher.close()
+        if own_pool:
+            pool.close()
 
 # -----------------------
-# Main
+# Run modes
 # -----------------------
-def main():
-    import argparse
-    parser = argparse.ArgumentParser(description="Workly - Scraper híbrido Workana (TI/Programação)")
-    parser.add_argument("--linguagem", "-l", type=str, help="Linguagem para filtrar (ex: java, python). Se omitido, busca todas as vagas de TI.")
-    parser.add_argument("--max-scroll", type=int, default=DEFAULT_MAX_SCROLL_ATTEMPTS, help="Máximo de tentativas de scroll para carregar a lista.")
-    args = parser.parse_args()
-
-    language = args.linguagem
-    max_scrolls = args.max_scroll
+def write_run_report(directory: str):
+    """Grava o relatório da execução (JSON + textfile do Prometheus) em `directory`."""
+    try:
+        report = metrics.write_reports(directory)
+        logger.info("[MÉTRICAS] Relatório gravado em %s (%.1fs, etapas: %s).", directory, report["duration_seconds"],
+                    ", ".join(f"{k}={v:.1f}s" for k, v in report["stages_seconds"].items()) or "nenhuma")
+    except Exception as e:
+        logger.exception("Falha ao gravar relatório de métricas: %s", e)
 
-    logger.info("Iniciando scraper Workana (headless forced: %s).", FORCE_HEADLESS)
-    if language:
-        logger.info("Modo filtrado: buscando vagas relacionadas a: %s", language)
-    else:
-        logger.info("Modo padrão: coletando todas as vagas da categoria TI e Programação.")
+def cycle_known_hashes(args, db) -> Set[str]:
+    """Vagas conhecidas da janela recente (modo incremental); None fora dele ou se o banco falhar."""
+    if not args.incremental:
+        return None
+    conn = None
+    try:
+        conn = db.getconn()
+        return load_known_hashes(conn, args.known_window)
+    except Exception as e:
+        logger.exception("Falha ao carregar vagas conhecidas; seguindo sem modo incremental: %s", e)
+        return None
+    finally:
+        if conn:
+            db.putconn(conn)
 
-    # Scrape
-    projetos = scrape_workana(language=language, max_scrolls=max_scrolls)
-    logger.info("Scraping finalizado — total coletado: %d", len(projetos))
+def project_hash(projeto: dict) -> str:
+    return generate_link_hash(projeto.get("Link") or "")
 
-    if not projetos:
-        logger.info("Nenhum projeto coletado. Encerrando.")
-        return
+def open_cycle_journal(args, db, resume: bool) -> Tuple[RunJournal, Set[str]]:
+    """
+    Abre o diário do ciclo. Com `resume`, grava no banco os projetos que ficaram
+    pendentes na execução interrompida e devolve os link_hash já enriquecidos,
+    que o ciclo trata como conhecidos (só atualiza as propostas).
+    """
+    journal = RunJournal(args.journal)
+    pending, resumed = journal.replay() if resume else ({}, set())
+    journal.open(resume)
+    if resume:
+        logger.info("[JOURNAL] Retomando %s: %d vagas já enriquecidas, %d pendentes de gravação.",
+                    args.journal, len(resumed), len(pending))
+    if pending:
+        conn = None
+        try:
+            conn = db.getconn()
+            if save_to_db(conn, list(pending.values())):
+                journal.mark_saved(pending)
+        except Exception as e:
+            logger.exception("[JOURNAL] Falha ao gravar os pendentes; seguem no diário: %s", e)
+        finally:
+            if conn:
+                db.putconn(conn)
+    return journal, resumed
 
-    # Deduplicate by normalized link (first occurrence kept)
-    dedup = []
-    seen = set()
-    for p in projetos:
-        link = normalize_value(p.get("Link"), "str") or ""
-        clean = normalize_url_for_hash(link)
-        if clean not in seen:
-            seen.add(clean)
-            dedup.append(p)
-    projetos = dedup
-    logger.info("Após deduplicação: %d projetos", len(projetos))
-
-    # Persist to DB (open single connection)
+def load_duplicate_index(args, db, index: NearDuplicateIndex = None) -> NearDuplicateIndex:
+    """
+    Índice de quase duplicatas com as vagas recentes; None se desligado ou se o
+    banco falhar. Um `index` já carregado (daemon) só descarta as vagas que
+    saíram da janela; um ainda vazio é carregado do banco.
+    """
+    if not args.duplicate_window:
+        return None
+    if index is not None and index.loaded:
+        with metrics.stage("near_duplicate_index"):
+            evicted = index.prune()
+        logger.info("[DUPLICATAS] %d vagas fora da janela de %dh removidas do índice; restam %d.",
+                    evicted, args.duplicate_window, len(index))
+        return index
     conn = None
     try:
-        conn = psycopg2.connect(**DB_CONFIG)
-        save_to_db(conn, projetos)
+        conn = db.getconn()
+        with metrics.stage("near_duplicate_index"):
+            index = load_recent(conn, args.duplicate_window, index=index)
+        conn.rollback()
+        logger.info("[DUPLICATAS] Índice carregado com %d vagas das últimas %dh.", len(index), args.duplicate_window)
+        return index
     except Exception as e:
-        logger.exception("Erro ao conectar/salvar no DB: %s", e)
+        logger.exception("Falha ao carregar vagas recentes; seguindo sem detecção de duplicatas: %s", e)
+        return None
+    finally:
+        if conn:
+            db.putconn(conn)
+
+def cycle_writer_options(args, db, journal: RunJournal = None) -> dict:
+    """Parâmetros do escritor em lote do ciclo (iguais nos motores síncrono e assíncrono)."""
+    def _save(conn, batch):
+        if save_to_db(conn, batch) and journal is not None:
+            journal.mark_saved(project_hash(p) for p in batch if not p.get(PARTIAL_KEY))
+
+    return dict(
+        connect=db.getconn, save=_save,
+        batch_size=args.batch_size, flush_interval=args.flush_interval,
         # fallback: save CSV for inspection
-        try:
-            save_csv(projetos, CSV_FILENAME)
-            logger.info("Fallback: salvei CSV com registros coletados.")
-        except Exception as ex:
-            logger.exception("Falha ao salvar CSV de fallback: %s", ex)
+        fallback=lambda batch: save_csv(batch, CSV_FILENAME, append=True),
+        release=db.putconn,
+    )
+
+def prepare_record(projeto: dict, matcher: LanguageMatcher, strict: bool, rate_id: int) -> bool:
+    """Anota linguagens e a cotação usada; False se o projeto deve ser descartado (--estrito)."""
+    if projeto.get(PARTIAL_KEY):
+        return True
+    if rate_id and str(projeto.get("Metodo") or "").startswith("convert_api"):
+        projeto[RATE_ID_KEY] = rate_id
+    projeto[MATCHES_KEY] = matcher.match(projeto)
+    return not (strict and matcher.languages and not projeto[MATCHES_KEY])
+
+def record_run_rate(db, quote) -> int:
+    """Grava a cotação do ciclo em exchange_rates; 0 se não der (as vagas seguem sem referência)."""
+    conn = None
+    try:
+        conn = db.getconn()
+        rate_id = record_rate(conn, quote)
+        logger.info("[COTAÇÃO] Cotação do ciclo registrada (id=%d, %s, 1 USD = %s BRL).", rate_id, quote.source, quote.rate)
+        return rate_id
+    except Exception as e:
+        if conn:
+            conn.rollback()
+        logger.exception("Falha ao registrar a cotação do ciclo: %s", e)
+        return 0
     finally:
         if conn:
+            db.putconn(conn)
+
+def reconvert_budgets():
+    """Busca a cotação atual, registra e reconverte em SQL as vagas em USD já gravadas."""
+    db = DirectConnections()
+    rate_id = record_run_rate(db, get_usd_brl_quote())
+    if not rate_id:
+        return
+    conn = db.getconn()
+    try:
+        updated = reconvert_usd_budgets(conn, rate_id)
+        logger.info("[COTAÇÃO] %d vagas em USD reconvertidas com a cotação id=%d.", updated, rate_id)
+    finally:
+        db.putconn(conn)
+
+class DirectConnections:
+    """Mesma interface do psycopg2.pool, abrindo uma conexão nova por uso (execução única)."""
+
+    def getconn(self):
+        return psycopg2.connect(**DB_CONFIG)
+
+    def putconn(self, conn):
+        conn.close()
+
+    def closeall(self):
+        pass
+
+def run_cycle(args, db, pool: DriverPool = None, stop_event: threading.Event = None, resume: bool = None,
+              duplicates: NearDuplicateIndex = None) -> int:
+    """
+    Um ciclo completo: vagas conhecidas (opcional), scraping e gravação em lotes.
+    `duplicates` é o índice mantido pelo modo daemon entre ciclos (ver load_duplicate_index).
+    """
+    resume = args.resume if resume is None else resume
+    if args.engine == ENGINE_ASYNC:
+        # httpx só é necessário (e importado) no motor assíncrono
+        from async_engine import run_async_cycle
+        return run_async_cycle(args, db, stop_event, resume, duplicates)
+
+    metrics.reset()
+    journal, resumed = open_cycle_journal(args, db, resume)
+    duplicates = load_duplicate_index(args, db, duplicates)
+    known_hashes = cycle_known_hashes(args, db)
+    if resumed:
+        known_hashes = (known_hashes or set()) | resumed
+
+    # Scrape (já deduplicado por link normalizado) com gravação em lotes em paralelo
+    writer = BatchedDBWriter(**cycle_writer_options(args, db, journal))
+    writer.start()
+    total = 0
+    queries = plan_queries(args.linguagem, args.categoria, args.publicacao)
+    matcher = LanguageMatcher(args.linguagem or [])
+    rate_lookup = RateLookup.start()
+    rate_id = None
+    projetos = scrape_workana(max_scrolls=args.max_scroll, detail_backend=args.detail_backend, workers=args.workers,
+                              known_hashes=known_hashes, pool=pool, queries=queries,
+                              block_profile=args.block_profile, rate_lookup=rate_lookup, duplicates=duplicates,
+                              listing_mode=args.listing_mode, listing_backend=args.listing_backend,
+                              max_pages=args.max_pages)
+    try:
+        for projeto in projetos:
+            if rate_id is None and not projeto.get(PARTIAL_KEY):
+                # a cotação já foi resolvida para o enriquecimento: registra a usada no ciclo
+                rate_id = record_run_rate(db, rate_lookup.result())
+            if not prepare_record(projeto, matcher, args.estrito, rate_id):
+                continue
+            if not projeto.get(PARTIAL_KEY):
+                journal.append(project_hash(projeto), projeto)
+            writer.put(projeto)
+            total += 1
+            if stop_event is not None and stop_event.is_set():
+                logger.info("Parada solicitada; encerrando o ciclo atual.")
+                break
+    finally:
+        projetos.close()
+        writer.close()
+        journal.close()
+        write_run_report(args.metrics_dir)
+
+    logger.info("Scraping finalizado — total coletado: %d", total)
+    return total
+
+def run_daemon(args):
+    """
+    Executa ciclos a cada `args.interval` segundos (com jitter), mantendo o pool
+    de navegadores e o pool de conexões vivos. SIGTERM/SIGINT encerram após
+    gravar o que já foi coletado.
+    """
+    stop_event = threading.Event()
+
+    def _request_stop(signum, frame):
+        logger.info("[DAEMON] Sinal %s recebido; finalizando.", signum)
+        stop_event.set()
+
+    signal.signal(signal.SIGTERM, _request_stop)
+    signal.signal(signal.SIGINT, _request_stop)
+
+    # minconn=0: nenhuma conexão é aberta antes do primeiro uso
+    db = ThreadedConnectionPool(0, DB_POOL_MAX_CONNECTIONS, **DB_CONFIG)
+    pool = new_driver_pool(args.workers, args.block_profile)
+    # carregado no primeiro ciclo (dentro das métricas dele); cresce com as vagas novas e descarta as antigas
+    duplicates = NearDuplicateIndex(window_hours=args.duplicate_window) if args.duplicate_window else None
+    cycle = 0
+    try:
+        while not stop_event.is_set():
+            cycle += 1
+            started = time.time()
             try:
-                conn.close()
-            except Exception:
-                pass
+                # a partir do 2º ciclo, retoma o que um ciclo anterior não conseguiu gravar
+                total = run_cycle(args, db, pool, stop_event, resume=args.resume or cycle > 1, duplicates=duplicates)
+                logger.info("[DAEMON] Ciclo %d concluído: %d projetos em %.1fs.", cycle, total, time.time() - started)
+            except Exception as e:
+                logger.exception("[DAEMON] Erro no ciclo %d: %s", cycle, e)
+                pool.close()
+
+            if args.recycle_every and cycle % args.recycle_every == 0:
+                logger.info("[DAEMON] Reciclando navegadores após %d ciclos.", cycle)
+                pool.close()
+
+            if stop_event.is_set():
+                break
+            delay = max(0.0, args.interval * (1 + random.uniform(-args.jitter, args.jitter)))
+            logger.info("[DAEMON] Próximo ciclo em %.0fs.", delay)
+            stop_event.wait(delay)
+    finally:
+        pool.close()
+        db.closeall()
+        logger.info("[DAEMON] Encerrado após %d ciclos.", cycle)
 
+# -----------------------
+# Main
+# -----------------------
+def main(argv: List[str] = None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Workly - Scraper híbrido Workana (TI/Programação)")
+    parser.add_argument("--linguagem", "-l", nargs="+", help="Linguagem(s) buscadas, uma consulta por linguagem (ex: java python). Se omitido, busca todas as vagas da categoria.")
+    parser.add_argument("--categoria", nargs="+", default=DEFAULT_CATEGORIES, help="Categoria(s) da Workana (ex: it-programming design-multimedia).")
+    parser.add_argument("--estrito", action="store_true", help="Descarta vagas que não citam nenhuma das linguagens pedidas (título, descrição ou skills).")
+    parser.add_argument("--publicacao", nargs="+", default=DEFAULT_PUBLICATIONS, help="Janela(s) de publicação (ex: 1d 3d 1w).")
+    parser.add_argument("--max-scroll", type=int, default=DEFAULT_MAX_SCROLL_ATTEMPTS, help="Máximo de tentativas de scroll para carregar a lista (modo scroll).")
+    parser.add_argument("--listing-mode", choices=LISTING_MODES, default=LISTING_MODE_PAGES, help="pages (páginas &page=N em paralelo, direto para o enriquecimento) ou scroll (rola cada listagem até o fim).")
+    parser.add_argument("--listing-backend", choices=LISTING_BACKENDS, default="http", help="Como ler as páginas no modo pages: http (sem navegador) ou selenium (pool de WebDrivers).")
+    parser.add_argument("--max-pages", type=int, default=DEFAULT_MAX_PAGES, help="Máximo de páginas lidas por consulta no modo pages.")
+    parser.add_argument("--detail-backend", choices=DETAIL_BACKENDS, default=DEFAULT_DETAIL_BACKEND, help="Como buscar as páginas de detalhe: http (com fallback Selenium) ou selenium.")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Quantidade de vagas enriquecidas em paralelo (máximo de WebDrivers simultâneos).")
+    parser.add_argument("--block-profile", choices=sorted(BLOCK_PROFILES), default=BLOCK_PROFILE, help="Recursos bloqueados no Chromium: default (imagens, fontes, mídia, analytics e anúncios), assets, trackers ou none.")
+    parser.add_argument("--engine", choices=(ENGINE_SELENIUM, ENGINE_ASYNC), default=ENGINE_SELENIUM, help="selenium (listagem com navegador) ou async (listagem e detalhes via HTTP concorrente, sem navegador).")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_ASYNC_CONCURRENCY, help="Requisições HTTP simultâneas no motor async.")
+    parser.add_argument("--incremental", action="store_true", help="Não busca detalhes de vagas já gravadas na janela recente; só atualiza as propostas.")
+    parser.add_argument("--known-window", type=int, default=DEFAULT_KNOWN_WINDOW_HOURS, help="Janela (horas) de vagas conhecidas usada no modo incremental.")
+    parser.add_argument("--duplicate-window", type=int, default=DEFAULT_DUPLICATE_WINDOW_HOURS, help="Janela (horas) de vagas recentes comparadas na detecção de quase duplicatas (0 = desliga).")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Registros por lote gravado no banco.")
+    parser.add_argument("--flush-interval", type=float, default=DEFAULT_FLUSH_INTERVAL, help="Segundos máximos entre gravações de lotes no banco.")
+    parser.add_argument("--metrics-dir", default=METRICS_DIR, help="Diretório do relatório da execução (run_report.json e textfile do Prometheus).")
+    parser.add_argument("--journal", default=JOURNAL_FILE, help="Diário de checkpoint da execução (JSON Lines, removido ao final se tudo foi gravado).")
+    parser.add_argument("--resume", action="store_true", help="Retoma uma execução interrompida: grava os pendentes do diário e não reenriquece as vagas já concluídas.")
+    parser.add_argument("--bulk-load", nargs="+", metavar="CSV", help="Não faz scraping: carrega CSV(s) exportados (backfill) via COPY + merge.")
+    parser.add_argument("--reconverter-usd", action="store_true", help="Não faz scraping: registra a cotação atual e reconverte os orçamentos em USD já gravados.")
+    parser.add_argument("--daemon", action="store_true", help="Roda continuamente, mantendo navegadores e conexões abertos entre os ciclos.")
+    parser.add_argument("--interval", type=float, default=DEFAULT_DAEMON_INTERVAL, help="Segundos entre ciclos no modo daemon.")
+    parser.add_argument("--jitter", type=float, default=DEFAULT_DAEMON_JITTER, help="Variação aleatória do intervalo (fração, ex.: 0.1 = ±10%%).")
+    parser.add_argument("--recycle-every", type=int, default=DEFAULT_RECYCLE_EVERY, help="Reinicia os navegadores a cada N ciclos (0 = nunca).")
+    args = parser.parse_args(argv)
+    setup_logging(LOG_FILE)
+
+    if args.bulk_load:
+        conn = psycopg2.connect(**DB_CONFIG)
+        try:
+            for filename in args.bulk_load:
+                logger.info("[BULK] Carregando %s", filename)
+                bulk_save_to_db(conn, load_csv(filename))
+        finally:
+            conn.close()
+        return
+
+    if args.reconverter_usd:
+        reconvert_budgets()
+        return
+
+    languages = args.linguagem
+
+    logger.info("Iniciando scraper Workana (headless forced: %s).", FORCE_HEADLESS)
+    if languages:
+        logger.info("Modo filtrado: buscando vagas relacionadas a: %s", ", ".join(languages))
+    else:
+        logger.info("Modo padrão: coletando todas as vagas da categoria TI e Programação.")
+
+    if args.daemon:
+        run_daemon(args)
+    else:
+        run_cycle(args, DirectConnections())
     logger.info("Execução finalizada.")
 
 if __name__ == "__main__":